@@ -0,0 +1,176 @@
+"""Campaign stat from the raw events against the ``campaign_counters`` rollup read by ``get_stat``.
+
+Seeds the same data as ``benchmarks.index_plans`` and fills the rollup from it,
+then for sample campaigns times three ways to get the stat: correlated
+subqueries over ``impression`` and ``click`` referenced once per column (how
+the stat was computed before the rollup), one aggregate per table computing
+count and sum in a single scan, and ``CampaignAlchemyGateway.get_stat``. Every
+way must give exactly the same ``CampaignStat``, the script exits with an error
+otherwise. Everything runs in one transaction that is rolled back, run it
+against a scratch database migrated to head::
+
+    POSTGRES_USERNAME=... POSTGRES_PASSWORD=... POSTGRES_HOST=... POSTGRES_DATABASE=... \
+        python -m benchmarks.campaign_stat --campaigns 2000 --clients 50000 --impressions 1000000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import sys
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from uuid import UUID
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.index_plans import SEED, database_url
+from crudik.adapters.gateway.campaign import CampaignAlchemyGateway
+from crudik.application.data_model.campaign import CampaignStat, retort_campaign_stat_from_list
+
+FILL_COUNTERS = """
+    INSERT INTO campaign_counters (campaign_id, impressions_count, clicks_count, spent_impressions, spent_clicks)
+    SELECT
+        campaign.campaign_id,
+        coalesce(impressions.count, 0),
+        coalesce(clicks.count, 0),
+        coalesce(impressions.spent, 0),
+        coalesce(clicks.spent, 0)
+    FROM campaign
+    LEFT JOIN (
+        SELECT ad_id, count(*) AS count, sum(cost_per_impression) AS spent
+        FROM impression GROUP BY ad_id
+    ) AS impressions ON impressions.ad_id = campaign.campaign_id
+    LEFT JOIN (
+        SELECT ad_id, count(*) AS count, sum(cost_per_click) AS spent
+        FROM click GROUP BY ad_id
+    ) AS clicks ON clicks.ad_id = campaign.campaign_id
+    WHERE impressions.ad_id IS NOT NULL OR clicks.ad_id IS NOT NULL
+"""
+
+# every column repeats its subquery, the planner may scan the events of the campaign once per reference
+CORRELATED_STAT_QUERY = text(
+    """
+    SELECT
+        (SELECT count(*) FROM impression WHERE ad_id = campaign.campaign_id),
+        (SELECT count(*) FROM click WHERE ad_id = campaign.campaign_id),
+        coalesce(
+            (SELECT count(*) FROM click WHERE ad_id = campaign.campaign_id)
+            / nullif((SELECT count(*) FROM impression WHERE ad_id = campaign.campaign_id), 0)::numeric * 100,
+            0.0
+        ),
+        coalesce((SELECT sum(cost_per_impression) FROM impression WHERE ad_id = campaign.campaign_id), 0.0),
+        coalesce((SELECT sum(cost_per_click) FROM click WHERE ad_id = campaign.campaign_id), 0.0),
+        coalesce((SELECT sum(cost_per_impression) FROM impression WHERE ad_id = campaign.campaign_id), 0.0)
+            + coalesce((SELECT sum(cost_per_click) FROM click WHERE ad_id = campaign.campaign_id), 0.0)
+    FROM campaign
+    WHERE campaign.campaign_id = :campaign_id
+    """,
+)
+
+# one aggregate per table, count and sum come from the same scan
+EVENTS_STAT_QUERY = text(
+    """
+    SELECT
+        impressions.count,
+        clicks.count,
+        coalesce(clicks.count / nullif(impressions.count, 0)::numeric * 100, 0.0),
+        coalesce(impressions.spent, 0.0),
+        coalesce(clicks.spent, 0.0),
+        coalesce(impressions.spent, 0.0) + coalesce(clicks.spent, 0.0)
+    FROM campaign
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS count, sum(cost_per_impression) AS spent
+        FROM impression WHERE ad_id = campaign.campaign_id
+    ) AS impressions
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS count, sum(cost_per_click) AS spent
+        FROM click WHERE ad_id = campaign.campaign_id
+    ) AS clicks
+    WHERE campaign.campaign_id = :campaign_id
+    """,
+)
+
+
+async def measure(
+    get_stat: Callable[[UUID], Awaitable[CampaignStat | None]],
+    campaign_ids: Sequence[UUID],
+) -> tuple[list[CampaignStat | None], float]:
+    """Stats of the campaigns and milliseconds per campaign."""
+    started = time.perf_counter()
+    stats = [await get_stat(campaign_id) for campaign_id in campaign_ids]
+    return stats, (time.perf_counter() - started) / len(campaign_ids) * 1000
+
+
+async def run(args: argparse.Namespace) -> bool:
+    engine = create_async_engine(database_url())
+    seed_params = {
+        "advertisers": max(args.campaigns // 10, 1),
+        "campaigns": args.campaigns,
+        "clients": args.clients,
+        "impressions": args.impressions,
+    }
+    # the first campaigns get events of every client, the last ones get none
+    campaign_ids = [
+        UUID(hashlib.md5(f"campaign{number}".encode()).hexdigest())  # noqa: S324
+        for number in (*range(1, args.samples + 1), args.campaigns)
+    ]
+
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            for statement in SEED:
+                await conn.execute(text(statement), seed_params)
+            await conn.execute(text(FILL_COUNTERS))
+            await conn.execute(text("ANALYZE campaign_counters"))
+            events = (
+                await conn.execute(text("SELECT (SELECT count(*) FROM impression) + count(*) FROM click"))
+            ).scalar()
+
+            session = AsyncSession(bind=conn)
+            gateway = CampaignAlchemyGateway(session)
+
+            async def from_events(query: TextClause, campaign_id: UUID) -> CampaignStat:
+                row = (await session.execute(query, {"campaign_id": campaign_id})).one()
+                return retort_campaign_stat_from_list.load(row, CampaignStat)
+
+            results = {
+                "correlated subqueries": await measure(
+                    lambda campaign_id: from_events(CORRELATED_STAT_QUERY, campaign_id),
+                    campaign_ids,
+                ),
+                "single scan": await measure(
+                    lambda campaign_id: from_events(EVENTS_STAT_QUERY, campaign_id),
+                    campaign_ids,
+                ),
+                "rollup (get_stat)": await measure(gateway.get_stat, campaign_ids),
+            }
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    sys.stdout.write(f"{events} events, {len(campaign_ids)} campaigns\n")
+    sys.stdout.write(f"{'way':<24}{'ms per campaign':>16}\n")
+    for name, (_, ms) in results.items():
+        sys.stdout.write(f"{name:<24}{ms:>16.2f}\n")
+
+    expected, _ = results["correlated subqueries"]
+    mismatched = [name for name, (stats, _) in results.items() if stats != expected]
+    for name in mismatched:
+        sys.stderr.write(f"{name} stats differ from the correlated subqueries\n")
+
+    return not mismatched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--campaigns", type=int, default=2_000)
+    parser.add_argument("--clients", type=int, default=50_000)
+    parser.add_argument("--impressions", type=int, default=1_000_000)
+    parser.add_argument("--samples", type=int, default=20)
+    if not asyncio.run(run(parser.parse_args())):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
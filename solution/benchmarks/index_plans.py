@@ -0,0 +1,194 @@
+"""Query plans of the campaign selection and event aggregate queries, old indexes against new ones.
+
+Seeds synthetic advertisers, campaigns, clients and events, prints the plans
+with the current indexes, swaps them for the indexes before migration
+``9c4e2f7a1d38`` and prints the plans again. Everything runs in one
+transaction that is rolled back, but the tables are locked meanwhile, so run
+it against a scratch database migrated to head::
+
+    POSTGRES_USERNAME=... POSTGRES_PASSWORD=... POSTGRES_HOST=... POSTGRES_DATABASE=... \
+        python -m benchmarks.index_plans --campaigns 20000 --clients 50000 --impressions 2000000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import os
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+SEED = (
+    """
+    INSERT INTO advertiser (advertiser_id, name)
+    SELECT md5('advertiser' || i)::uuid, 'advertiser ' || i
+    FROM generate_series(1, :advertisers) AS i
+    """,
+    """
+    INSERT INTO campaign (
+        campaign_id, advertiser_id, impressions_limit, clicks_limit, cost_per_impression, cost_per_click,
+        ad_title, ad_text, start_date, end_date, age_from, age_to, location, gender, is_deleted, created_at
+    )
+    SELECT
+        md5('campaign' || i)::uuid,
+        md5('advertiser' || (i % :advertisers + 1))::uuid,
+        1000, 100, 1.5, 10,
+        'title ' || i, 'text ' || i,
+        i % 30, i % 30 + i % 7,
+        CASE WHEN i % 3 = 0 THEN NULL ELSE i % 40 END,
+        CASE WHEN i % 4 = 0 THEN NULL ELSE 40 + i % 40 END,
+        CASE WHEN i % 5 = 0 THEN NULL ELSE 'city ' || i % 50 END,
+        (ARRAY['MALE', 'FEMALE', 'ALL', NULL])[i % 4 + 1]::targetgender,
+        i % 10 = 0,
+        now()
+    FROM generate_series(1, :campaigns) AS i
+    """,
+    """
+    INSERT INTO client (client_id, login, age, location, gender)
+    SELECT md5('client' || i)::uuid, 'client ' || i, 14 + i % 70, 'city ' || i % 50,
+        (ARRAY['MALE', 'FEMALE'])[i % 2 + 1]::gender
+    FROM generate_series(1, :clients) AS i
+    """,
+    # client and campaign numbers are unique per event while impressions <= clients * campaigns
+    """
+    INSERT INTO impression (impression_id, ad_id, client_id, cost_per_impression, day, created_at)
+    SELECT md5('impression' || i)::uuid, md5('campaign' || (i / :clients % :campaigns + 1))::uuid,
+        md5('client' || (i % :clients + 1))::uuid, 1.5, i % 30, now()
+    FROM generate_series(1, :impressions) AS i
+    """,
+    """
+    INSERT INTO click (click_id, ad_id, client_id, cost_per_click, day, created_at)
+    SELECT md5('click' || impression_id)::uuid, ad_id, client_id, 10, day, now()
+    FROM impression
+    WHERE get_byte(decode(md5(impression_id::text), 'hex'), 0) < 26
+    """,
+    "ANALYZE advertiser, campaign, client, impression, click",
+)
+
+QUERIES = {
+    "active campaigns matching a client": """
+        SELECT campaign_id FROM campaign
+        WHERE NOT is_deleted
+            AND start_date <= :day AND end_date >= :day
+            AND (location IS NULL OR location = :location)
+            AND (gender IS NULL OR gender = 'ALL' OR gender = :gender)
+            AND (age_from IS NULL OR age_from <= :age)
+            AND (age_to IS NULL OR age_to >= :age)
+    """,
+    "campaigns running on a day": """
+        SELECT campaign_id FROM campaign
+        WHERE NOT is_deleted AND start_date <= :day AND end_date >= :day
+    """,
+    "campaign impressions total": """
+        SELECT count(*), sum(cost_per_impression) FROM impression WHERE ad_id = :ad_id
+    """,
+    "campaign clicks by day": """
+        SELECT day, count(*), sum(cost_per_click) FROM click WHERE ad_id = :ad_id GROUP BY day
+    """,
+    "10000 impressions insert": """
+        INSERT INTO impression (impression_id, ad_id, client_id, cost_per_impression, day, created_at)
+        SELECT gen_random_uuid(), md5('campaign' || (i % :campaigns + 1))::uuid,
+            md5('client' || (i % :clients + 1))::uuid, 1.5, :day, now()
+        FROM generate_series(1, 10000) AS i
+        ON CONFLICT DO NOTHING
+    """,
+}
+
+# the indexes of migration 9c4e2f7a1d38 and the ones it replaced
+NEW_INDEXES = (
+    "ix_campaign_active_dates",
+    "ix_campaign_active_targeting",
+    "ix_click_ad_id_day",
+    "ix_impression_ad_id_day",
+)
+OLD_INDEXES = (
+    "CREATE INDEX ix_campaign_age_from ON campaign (age_from)",
+    "CREATE INDEX ix_campaign_age_to ON campaign (age_to)",
+    "CREATE INDEX ix_campaign_gender ON campaign (gender)",
+    "CREATE INDEX ix_campaign_is_deleted ON campaign (is_deleted)",
+    "CREATE INDEX ix_campaign_location ON campaign (location)",
+    "CREATE INDEX ix_click_ad_id ON click (ad_id)",
+    "CREATE INDEX ix_click_cost_per_click ON click (cost_per_click)",
+    "CREATE INDEX ix_impression_ad_id ON impression (ad_id)",
+    "CREATE INDEX ix_impression_cost_per_impression ON impression (cost_per_impression)",
+)
+
+
+def database_url() -> str:
+    user = os.environ["POSTGRES_USERNAME"]
+    password = os.environ["POSTGRES_PASSWORD"]
+    host = os.environ["POSTGRES_HOST"]
+    port = os.environ.get("POSTGRES_PORT", "5432")
+    db_name = os.environ["POSTGRES_DATABASE"]
+
+    return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+
+
+async def explain_all(conn: AsyncConnection, params: Mapping[str, Any]) -> dict[str, Sequence[str]]:
+    plans = {}
+    for name, query in QUERIES.items():
+        # every statement runs in a savepoint, so the insert does not change the data for the next run
+        async with conn.begin_nested() as savepoint:
+            result = await conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params)
+            plans[name] = result.scalars().all()
+            await savepoint.rollback()
+
+    return plans
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(database_url())
+    seed_params = {
+        "advertisers": max(args.campaigns // 10, 1),
+        "campaigns": args.campaigns,
+        "clients": args.clients,
+        "impressions": args.impressions,
+    }
+    query_params = {
+        **seed_params,
+        "day": 15,
+        "location": "city 7",
+        "gender": "MALE",
+        "age": 30,
+        # the first seeded campaign, it gets events of every client
+        "ad_id": UUID(hashlib.md5(b"campaign1").hexdigest()),  # noqa: S324
+    }
+
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            for statement in SEED:
+                await conn.execute(text(statement), seed_params)
+
+            new_plans = await explain_all(conn, query_params)
+
+            await conn.execute(text(f"DROP INDEX {', '.join(NEW_INDEXES)}"))
+            for statement in OLD_INDEXES:
+                await conn.execute(text(statement))
+            await conn.execute(text("ANALYZE campaign, impression, click"))
+
+            old_plans = await explain_all(conn, query_params)
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    for name in QUERIES:
+        for label, plans in (("before", old_plans), ("after", new_plans)):
+            sys.stdout.write(f"=== {name}, {label} ===\n")
+            sys.stdout.write("\n".join(plans[name]) + "\n\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--campaigns", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=50_000)
+    parser.add_argument("--impressions", type=int, default=2_000_000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
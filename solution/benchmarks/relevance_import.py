@@ -0,0 +1,143 @@
+"""Throughput of the score import against upserting the scores one request at a time.
+
+Seeds advertisers and clients the way ``benchmarks.index_plans`` does, then
+imports ``--rows`` generated scores with ``ImportRelevances`` in chunks of
+``IMPORT_CHUNK_SIZE``, every hundredth of them for a missing client, and
+upserts the first ``--single-rows`` of them with ``UpsertRelevance``, the way
+``POST /ml-scores`` does. Everything runs in one transaction that is rolled
+back, run it against a scratch database migrated to head::
+
+    POSTGRES_USERNAME=... POSTGRES_PASSWORD=... POSTGRES_HOST=... POSTGRES_DATABASE=... \
+        python -m benchmarks.relevance_import --rows 100000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import sys
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from benchmarks.index_plans import database_url
+from crudik.adapters.gateway.advertiser import AdvertiserAlchemyGateway
+from crudik.adapters.gateway.client import ClientAlchemyGateway
+from crudik.adapters.gateway.relevance import RelevanceAlchemyGateway
+from crudik.application.common.relevance_cache import RelevanceCache
+from crudik.application.data_model.relevance import RelevanceData, RelevanceImportRow
+from crudik.application.relevance.upsert import ImportRelevances, UpsertRelevance
+from crudik.presentation.http.endpoint.relevance import IMPORT_CHUNK_SIZE
+
+SEED = (
+    """
+    INSERT INTO advertiser (advertiser_id, name)
+    SELECT md5('advertiser' || i)::uuid, 'advertiser ' || i
+    FROM generate_series(1, :advertisers) AS i
+    """,
+    """
+    INSERT INTO client (client_id, login, age, location, gender)
+    SELECT md5('client' || i)::uuid, 'client ' || i, 14 + i % 70, 'city ' || i % 50,
+        (ARRAY['MALE', 'FEMALE'])[i % 2 + 1]::gender
+    FROM generate_series(1, :clients) AS i
+    """,
+)
+# every hundredth row refers to a client that does not exist
+MISSING_CLIENT_EVERY = 100
+
+
+def seeded_id(kind: str, number: int) -> UUID:
+    return UUID(hashlib.md5(f"{kind}{number}".encode()).hexdigest())  # noqa: S324
+
+
+def generate_rows(rows: int, clients: int, advertisers: int) -> list[RelevanceData]:
+    """Scores of distinct client and advertiser pairs while ``rows <= clients * advertisers``."""
+    return [
+        RelevanceData(
+            client_id=uuid4() if number % MISSING_CLIENT_EVERY == 0 else seeded_id("client", number % clients + 1),
+            advertiser_id=seeded_id("advertiser", number // clients % advertisers + 1),
+            score=number % 1000,
+        )
+        for number in range(rows)
+    ]
+
+
+class NoRelevanceCache(RelevanceCache):
+    """The benchmark measures the database, scores are not cached."""
+
+    async def invalidate(self, client_ids: Iterable[UUID]) -> None: ...
+
+
+async def as_chunks(data: Sequence[RelevanceData]) -> AsyncIterator[Sequence[RelevanceImportRow]]:
+    for start in range(0, len(data), IMPORT_CHUNK_SIZE):
+        chunk = data[start : start + IMPORT_CHUNK_SIZE]
+        yield [RelevanceImportRow(start + line, each) for line, each in enumerate(chunk, start=1)]
+
+
+async def run(args: argparse.Namespace) -> bool:
+    engine = create_async_engine(database_url())
+    data = generate_rows(args.rows, args.clients, args.advertisers)
+    # rows that get stored, the single upserts overwrite scores the import stored already
+    single_data = [each for number, each in enumerate(data[: args.single_rows]) if number % MISSING_CLIENT_EVERY != 0]
+
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            for statement in SEED:
+                await conn.execute(text(statement), {"advertisers": args.advertisers, "clients": args.clients})
+            await conn.execute(text("ANALYZE advertiser, client"))
+
+            # the session joins the outer transaction, its commits do not end it
+            session = AsyncSession(bind=conn)
+            gateway = RelevanceAlchemyGateway(session)
+            client_gateway = ClientAlchemyGateway(session)
+            advertiser_gateway = AdvertiserAlchemyGateway(session)
+            cache = NoRelevanceCache()
+
+            started = time.perf_counter()
+            import_relevances = ImportRelevances(gateway, client_gateway, advertiser_gateway, session, cache)
+            result = await import_relevances.execute(as_chunks(data))
+            import_seconds = time.perf_counter() - started
+
+            upsert = UpsertRelevance(gateway, client_gateway, advertiser_gateway, session, cache)
+            started = time.perf_counter()
+            for each in single_data:
+                await upsert.execute(each)
+            single_seconds = time.perf_counter() - started
+
+            stored = (await conn.execute(text("SELECT count(*) FROM relevance"))).scalar_one()
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    sys.stdout.write(f"{args.rows} rows, {args.clients} clients, {args.advertisers} advertisers\n")
+    sys.stdout.write(f"{'way':<24}{'rows':>10}{'rows per second':>18}\n")
+    sys.stdout.write(f"{'import':<24}{args.rows:>10}{args.rows / import_seconds:>18.0f}\n")
+    sys.stdout.write(f"{'one row per request':<24}{len(single_data):>10}{len(single_data) / single_seconds:>18.0f}\n")
+
+    expected_rejects = len(range(0, args.rows, MISSING_CLIENT_EVERY))
+    if result.accepted != args.rows - expected_rejects or len(result.rejected) != expected_rejects:
+        sys.stderr.write(f"accepted {result.accepted}, rejected {len(result.rejected)}, expected {expected_rejects}\n")
+        return False
+
+    if stored != result.accepted:
+        sys.stderr.write(f"{stored} scores stored, {result.accepted} accepted\n")
+        return False
+
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--clients", type=int, default=20_000)
+    parser.add_argument("--advertisers", type=int, default=100)
+    parser.add_argument("--single-rows", type=int, default=2_000)
+    if not asyncio.run(run(parser.parse_args())):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Python CPU spent per request on the hot gateway statements before they reach the driver.
+
+Compares three ways to get a statement compiled for asyncpg: building the
+expression tree and compiling it every time, building it every time and
+hitting the compiled cache (how the gateways worked before), and reusing the
+statement built once per process (how they work now). No database is needed::
+
+    python -m benchmarks.statement_cache --runs 20000
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.util import LRUCache
+
+from crudik.adapters.gateway import ad, advertiser, campaign
+
+STATEMENTS: dict[str, Callable[[], Select[Any]]] = {
+    "ad candidates stats": ad._build_candidates_stats_query,  # noqa: SLF001
+    "campaign stat": campaign._build_stat_query,  # noqa: SLF001
+    "campaign daily stat": campaign._build_stat_daily_query,  # noqa: SLF001
+    "advertiser stat": advertiser._build_stat_query,  # noqa: SLF001
+    "advertiser daily stat": advertiser._build_stat_daily_query,  # noqa: SLF001
+}
+
+
+def compile_cached(stmt: Select[Any], dialect: Any, cache: LRUCache[Any, Any]) -> None:
+    # the lookup a connection does on every execution
+    stmt._compile_w_cache(  # noqa: SLF001
+        dialect,
+        compiled_cache=cache,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+
+
+def measure(build: Callable[[], Select[Any]], dialect: Any, runs: int) -> list[float]:
+    """Microseconds per call of every way to get the statement compiled."""
+    cache: LRUCache[Any, Any] = LRUCache(100)
+    prebuilt = build()
+
+    timings = [
+        # compiling from scratch is slow, a tenth of the runs is enough
+        timeit.timeit(lambda: build().compile(dialect=dialect), number=runs // 10) * 10,
+        timeit.timeit(lambda: compile_cached(build(), dialect, cache), number=runs),
+        timeit.timeit(lambda: compile_cached(prebuilt, dialect, cache), number=runs),
+    ]
+    return [each / runs * 1_000_000 for each in timings]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20_000)
+    runs = parser.parse_args().runs
+
+    # the engine only provides the dialect, it never connects
+    dialect = create_async_engine("postgresql+asyncpg://").dialect
+    sys.stdout.write(f"{'statement':<24}{'compile':>12}{'build+cache':>14}{'prebuilt':>12}   us per call\n")
+
+    for name, build in STATEMENTS.items():
+        compile_us, built_us, prebuilt_us = measure(build, dialect, runs)
+        sys.stdout.write(f"{name:<24}{compile_us:>12.1f}{built_us:>14.1f}{prebuilt_us:>12.1f}\n")
+
+
+if __name__ == "__main__":
+    main()
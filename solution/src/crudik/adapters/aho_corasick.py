@@ -0,0 +1,57 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+
+class AhoCorasick:
+    """Multi-pattern matcher finding every pattern occurrence in one pass over the text."""
+
+    __slots__ = ("_fail", "_goto", "_output")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+
+        self._link()
+
+    def find(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield ``(start, pattern)`` for every occurrence."""
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for pattern in self._output[state]:
+                yield position - len(pattern) + 1, pattern
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        self._output[state].append(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
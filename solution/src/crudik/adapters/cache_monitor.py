@@ -0,0 +1,49 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from crudik.application.common.cache_monitor import CacheMonitor
+from crudik.application.data_model.metrics import CacheStat
+
+
+@dataclass(slots=True)
+class CacheCounter:
+    name: str
+    size: Callable[[], int] = field(default=lambda: 0)
+    hits: int = 0
+    misses: int = 0
+
+    def hit(self) -> None:
+        self.hits += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    def to_stat(self) -> CacheStat:
+        total = self.hits + self.misses
+        return CacheStat(
+            name=self.name,
+            size=self.size(),
+            hits=self.hits,
+            misses=self.misses,
+            hit_ratio=self.hits / total if total else 0.0,
+        )
+
+
+class CacheRegistry(CacheMonitor):
+    """Hit and miss counters of the process caches, used to size them."""
+
+    __slots__ = ("_counters",)
+
+    def __init__(self) -> None:
+        self._counters: dict[str, CacheCounter] = {}
+
+    def counter(self, name: str, size: Callable[[], int] | None = None) -> CacheCounter:
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = CacheCounter(name) if size is None else CacheCounter(name, size)
+            self._counters[name] = counter
+
+        return counter
+
+    def get_stats(self) -> Sequence[CacheStat]:
+        return [counter.to_stat() for counter in self._counters.values()]
@@ -0,0 +1,133 @@
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import TypeAlias
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crudik.adapters.db.models.ad import campaign_table
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.data_model.ad import AdCandidate, convert_campaign_to_candidate
+from crudik.domain.entity.campaign import Campaign, TargetGender
+from crudik.domain.entity.client import Client
+
+AGE_BUCKET_SIZE = 10
+MAX_AGE = 100
+ANY = None
+
+IndexKey: TypeAlias = str | int | None
+
+
+class InMemoryCampaignIndex(CampaignIndex):
+    """Process-local index of campaigns that can be shown.
+
+    Campaigns are grouped by location, gender and age bucket, a ``None`` key
+    holding campaigns without the corresponding targeting. Campaigns running on
+    the current day are memoized, so a lookup touches only matching campaigns.
+    """
+
+    __slots__ = ("_active", "_by_age", "_by_gender", "_by_location", "_candidates")
+
+    def __init__(self) -> None:
+        self._candidates: dict[UUID, AdCandidate] = {}
+        self._by_location: defaultdict[IndexKey, set[UUID]] = defaultdict(set)
+        self._by_gender: defaultdict[IndexKey, set[UUID]] = defaultdict(set)
+        self._by_age: defaultdict[IndexKey, set[UUID]] = defaultdict(set)
+        self._active: tuple[int, set[UUID]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def find(self, client: Client, day: int) -> Sequence[AdCandidate]:
+        active = self._active_on(day)
+        groups = [
+            (self._by_location.get(client.location, set()), self._by_location.get(ANY, set())),
+            (self._by_gender.get(client.gender.value, set()), self._by_gender.get(ANY, set())),
+            (self._by_age.get(client.age // AGE_BUCKET_SIZE, set()), set[UUID]()),
+        ]
+        groups.sort(key=lambda group: len(group[0]) + len(group[1]))
+        (specific, wildcard), *rest = groups
+
+        result = []
+        for ids in (specific, wildcard):
+            for ad_id in ids:
+                if ad_id not in active:
+                    continue
+                if not all(ad_id in other or ad_id in other_any for other, other_any in rest):
+                    continue
+
+                candidate = self._candidates[ad_id]
+                if candidate.age_from is not None and candidate.age_from > client.age:
+                    continue
+                if candidate.age_to is not None and candidate.age_to < client.age:
+                    continue
+
+                result.append(candidate)
+
+        return result
+
+    def put(self, candidate: AdCandidate) -> None:
+        self.discard(candidate.ad_id)
+        ad_id = candidate.ad_id
+        self._candidates[ad_id] = candidate
+
+        self._by_location[candidate.location].add(ad_id)
+        self._by_gender[self._gender_key(candidate.gender)].add(ad_id)
+        for bucket in self._age_buckets(candidate):
+            self._by_age[bucket].add(ad_id)
+
+        if self._active is not None and self._is_active(candidate, self._active[0]):
+            self._active[1].add(ad_id)
+
+    def discard(self, ad_id: UUID) -> None:
+        candidate = self._candidates.pop(ad_id, None)
+        if candidate is None:
+            return
+
+        self._by_location[candidate.location].discard(ad_id)
+        self._by_gender[self._gender_key(candidate.gender)].discard(ad_id)
+        for bucket in self._age_buckets(candidate):
+            self._by_age[bucket].discard(ad_id)
+
+        if self._active is not None:
+            self._active[1].discard(ad_id)
+
+    def _active_on(self, day: int) -> set[UUID]:
+        if self._active is None or self._active[0] != day:
+            active = {ad_id for ad_id, candidate in self._candidates.items() if self._is_active(candidate, day)}
+            self._active = (day, active)
+
+        return self._active[1]
+
+    @staticmethod
+    def _is_active(candidate: AdCandidate, day: int) -> bool:
+        return candidate.start_date <= day <= candidate.end_date
+
+    @staticmethod
+    def _gender_key(gender: TargetGender | None) -> IndexKey:
+        if gender is None or gender == TargetGender.ALL:
+            return ANY
+
+        return str(gender.value)
+
+    @staticmethod
+    def _age_buckets(candidate: AdCandidate) -> range:
+        age_from = max(candidate.age_from or 0, 0)
+        age_to = min(candidate.age_to if candidate.age_to is not None else MAX_AGE, MAX_AGE)
+        return range(age_from // AGE_BUCKET_SIZE, age_to // AGE_BUCKET_SIZE + 1)
+
+
+async def load_campaign_index(session_factory: async_sessionmaker[AsyncSession]) -> InMemoryCampaignIndex:
+    index = InMemoryCampaignIndex()
+
+    async with session_factory() as session:
+        q = select(Campaign).where(campaign_table.c.is_deleted.is_(False))
+        campaigns = (await session.execute(q)).scalars().all()
+
+    for campaign in campaigns:
+        index.put(convert_campaign_to_candidate(campaign))
+
+    logging.info("Campaign index built, %s campaigns", len(index))
+    return index
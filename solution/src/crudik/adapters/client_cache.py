@@ -0,0 +1,85 @@
+import json
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from adaptix import Retort
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.lru import LRUCache
+from crudik.application.common.client_cache import ClientCache
+from crudik.domain.entity.client import Client
+
+CLIENT_KEY_PREFIX = "client:"
+
+retort = Retort()
+
+
+class TieredClientCache(ClientCache):
+    """Two tier client cache: process-local LRU in front of Redis.
+
+    Committed upserts overwrite both tiers, a client read from the database
+    only fills Redis if it has no value yet, so a read that raced an upsert
+    cannot put back the old client. Other workers do not hear about upserts,
+    their local entries live ``local_ttl`` seconds.
+    """
+
+    __slots__ = ("_local", "_local_counter", "_local_ttl", "_redis", "_redis_counter", "_ttl")
+
+    def __init__(self, redis: Redis, registry: CacheRegistry, maxsize: int, ttl: int, local_ttl: float) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._local_ttl = local_ttl
+        # a client with the moment its local entry expires
+        self._local: LRUCache[UUID, tuple[Client, float]] = LRUCache(maxsize)
+        self._local_counter = registry.counter("clients", lambda: len(self._local))
+        self._redis_counter = registry.counter("clients_redis")
+
+    async def get(self, client_id: UUID) -> Client | None:
+        entry = self._local.get(client_id)
+        if entry is not None and entry[1] > time.monotonic():
+            self._local_counter.hit()
+            return entry[0]
+
+        self._local_counter.miss()
+        raw = await self._redis.get(self._key(client_id))
+        if raw is None:
+            self._redis_counter.miss()
+            return None
+
+        self._redis_counter.hit()
+        client = retort.load(json.loads(raw), Client)
+        self._put_local(client)
+        return client
+
+    async def add(self, client: Client) -> None:
+        """Cache a client read from the database unless an upsert cached it first."""
+        client = self._detach(client)
+        self._put_local(client)
+        await self._redis.set(self._key(client.client_id), self._dump(client), ex=self._ttl, nx=True)
+
+    async def put_many(self, clients: Iterable[Client]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for each in clients:
+                client = self._detach(each)
+                self._put_local(client)
+                pipe.set(self._key(client.client_id), self._dump(client), ex=self._ttl)
+
+            await pipe.execute()
+
+    def _put_local(self, client: Client) -> None:
+        self._local.put(client.client_id, (client, time.monotonic() + self._local_ttl))
+
+    @staticmethod
+    def _detach(client: Client) -> Client:
+        # the cached object must not be bound to a session
+        return Client(client.client_id, client.login, client.age, client.location, client.gender)
+
+    @staticmethod
+    def _dump(client: Client) -> str:
+        return json.dumps(retort.dump(client))
+
+    @staticmethod
+    def _key(client_id: UUID) -> str:
+        return f"{CLIENT_KEY_PREFIX}{client_id}"
@@ -12,6 +12,9 @@ class DBConnectionConfig:
     postgres_database: str
     redis_host: str
     redis_port: int
+    replica_conn_url: str | None = None
+    replica_max_lag: float = 5
+    replica_check_interval: float = 1
 
     @property
     def postgres_conn_url(self) -> str:
@@ -20,7 +23,21 @@ class DBConnectionConfig:
         host = self.postgres_host
         db_name = self.postgres_database
 
-        return f"postgresql+asyncpg://{user}:{password}@{host}/{db_name}"
+        port = self.postgres_port
+
+        return f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class DBPoolConfig:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: int
+    pool_pre_ping: bool
+    statement_cache_size: int
+    prepared_statement_cache_size: int
+    pgbouncer: bool
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,13 +53,37 @@ class YaGPTConfig:
     folder_id: str
     api_key: str
     swear_check_enabled: bool
+    swear_prefilter_trust_clean: bool
+
+
+@dataclass(frozen=True, slots=True)
+class IngestionConfig:
+    batched: bool
+    batch_size: int
+    flush_interval_ms: int
+
+
+@dataclass(frozen=True, slots=True)
+class CacheConfig:
+    client_cache_size: int
+    client_cache_ttl: int
+    client_cache_local_ttl: float
+    relevance_cache_ttl: int
+    day_refresh_interval: float
+    swear_cache_size: int
+    swear_cache_redis_size: int
+    swear_cache_ttl: int
+    metrics_refresh_interval: float
 
 
 @dataclass(frozen=True, slots=True)
 class Config:
     db_connection: DBConnectionConfig
+    db_pool: DBPoolConfig
     minio: FilesConfig
     gpt: YaGPTConfig
+    ingestion: IngestionConfig
+    cache: CacheConfig
 
     @classmethod
     def load_from_environment(cls: type["Config"]) -> "Config":
@@ -54,6 +95,19 @@ class Config:
             postgres_database=os.environ["POSTGRES_DATABASE"],
             redis_host=os.environ["REDIS_HOST"],
             redis_port=int(os.environ["REDIS_PORT"]),
+            replica_conn_url=os.environ.get("POSTGRES_REPLICA_URL") or None,
+            replica_max_lag=float(os.environ.get("POSTGRES_REPLICA_MAX_LAG", "5")),
+            replica_check_interval=float(os.environ.get("POSTGRES_REPLICA_CHECK_INTERVAL", "1")),
+        )
+        db_pool = DBPoolConfig(
+            pool_size=int(os.environ.get("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.environ.get("DB_POOL_MAX_OVERFLOW", "10")),
+            pool_timeout=float(os.environ.get("DB_POOL_TIMEOUT", "30")),
+            pool_recycle=int(os.environ.get("DB_POOL_RECYCLE", "-1")),
+            pool_pre_ping=bool(int(os.environ.get("DB_POOL_PRE_PING", "0"))),
+            statement_cache_size=int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "100")),
+            prepared_statement_cache_size=int(os.environ.get("DB_PREPARED_STATEMENT_CACHE_SIZE", "100")),
+            pgbouncer=bool(int(os.environ.get("DB_PGBOUNCER", "0"))),
         )
         minio = FilesConfig(
             minio_url=os.environ["MINIO_URL"],
@@ -65,10 +119,30 @@ class Config:
             folder_id=os.environ["YANDEX_GPT_FOLDER_ID"],
             api_key=os.environ["YANDEX_GPT_API_KEY"],
             swear_check_enabled=bool(int(os.environ["SWEAR_CHECK_ENABLED"])),
+            swear_prefilter_trust_clean=bool(int(os.environ.get("SWEAR_PREFILTER_TRUST_CLEAN", "0"))),
+        )
+        ingestion = IngestionConfig(
+            batched=bool(int(os.environ.get("INGESTION_BATCHED", "0"))),
+            batch_size=int(os.environ.get("INGESTION_BATCH_SIZE", "500")),
+            flush_interval_ms=int(os.environ.get("INGESTION_FLUSH_INTERVAL_MS", "50")),
+        )
+        cache = CacheConfig(
+            client_cache_size=int(os.environ.get("CLIENT_CACHE_SIZE", "100000")),
+            client_cache_ttl=int(os.environ.get("CLIENT_CACHE_TTL", "3600")),
+            client_cache_local_ttl=float(os.environ.get("CLIENT_CACHE_LOCAL_TTL", "5")),
+            relevance_cache_ttl=int(os.environ.get("RELEVANCE_CACHE_TTL", "3600")),
+            day_refresh_interval=float(os.environ.get("DAY_CACHE_REFRESH_INTERVAL", "5")),
+            swear_cache_size=int(os.environ.get("SWEAR_CACHE_SIZE", "10000")),
+            swear_cache_redis_size=int(os.environ.get("SWEAR_CACHE_REDIS_SIZE", "1000000")),
+            swear_cache_ttl=int(os.environ.get("SWEAR_CACHE_TTL", "604800")),
+            metrics_refresh_interval=float(os.environ.get("METRICS_REFRESH_INTERVAL", "0")),
         )
         logging.debug("Config loaded.")
         return cls(
             db_connection=db,
+            db_pool=db_pool,
             minio=minio,
             gpt=gpt,
+            ingestion=ingestion,
+            cache=cache,
         )
@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any
+
+from redis.asyncio import Redis
+
+DAY_CHANNEL = "current_day_updates"
+RESUBSCRIBE_DELAY = 1.0
+
+
+class CurrentDayCache:
+    """Current day held in process memory.
+
+    Every worker subscribes to ``DAY_CHANNEL``, where a new day is published
+    when it is set, and to keyspace notifications of the day key, which drop
+    the cached value when the key is changed by anybody else. A value older
+    than ``refresh_interval`` seconds is treated as missing, in case a message
+    was lost.
+    """
+
+    __slots__ = ("_day", "_keyspace_channel", "_redis", "_refresh_interval", "_refreshed_at", "_task", "_version")
+
+    def __init__(self, redis: Redis, day_key: str, refresh_interval: float) -> None:
+        self._redis = redis
+        # the application works with the default database only
+        self._keyspace_channel = f"__keyspace@0__:{day_key}"
+        self._refresh_interval = refresh_interval
+        self._day: int | None = None
+        self._refreshed_at = 0.0
+        self._version = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def version(self) -> int:
+        """Changes on every invalidation, a value read from Redis is only stored under the same version."""
+        return self._version
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def get(self) -> int | None:
+        if self._day is None or time.monotonic() - self._refreshed_at > self._refresh_interval:
+            return None
+
+        return self._day
+
+    def put(self, day: int, version: int) -> None:
+        if version == self._version:
+            self._store(day)
+
+    async def publish(self, day: int) -> None:
+        self._invalidate()
+        self._store(day)
+        await self._redis.publish(DAY_CHANNEL, str(day))
+
+    def _store(self, day: int) -> None:
+        self._day = day
+        self._refreshed_at = time.monotonic()
+
+    def _invalidate(self) -> None:
+        self._day = None
+        self._version += 1
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(DAY_CHANNEL, self._keyspace_channel)
+                    # updates could be missed while we were not subscribed
+                    self._invalidate()
+                    async for message in pubsub.listen():
+                        self._on_message(message)
+            except Exception:
+                logging.exception("Current day subscription failed, resubscribing")
+                self._invalidate()
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        if message["type"] != "message":
+            return
+
+        channel = message["channel"].decode()
+        self._invalidate()
+        if channel == DAY_CHANNEL:
+            self._store(int(message["data"]))
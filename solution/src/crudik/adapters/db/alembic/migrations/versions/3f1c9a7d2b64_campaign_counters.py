@@ -0,0 +1,51 @@
+"""['campaign counters']
+
+Revision ID: 3f1c9a7d2b64
+Revises: a29365444389
+Create Date: 2026-10-18 10:12:41.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b64'
+down_revision = 'a29365444389'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('campaign_counters',
+    sa.Column('campaign_id', sa.UUID(), nullable=False),
+    sa.Column('impressions_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('clicks_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('spent_impressions', sa.Numeric(), server_default='0', nullable=False),
+    sa.Column('spent_clicks', sa.Numeric(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaign.campaign_id'], ),
+    sa.PrimaryKeyConstraint('campaign_id')
+    )
+    op.execute("""
+        INSERT INTO campaign_counters (campaign_id, impressions_count, clicks_count, spent_impressions, spent_clicks)
+        SELECT
+            campaign.campaign_id,
+            coalesce(impressions.count, 0),
+            coalesce(clicks.count, 0),
+            coalesce(impressions.spent, 0),
+            coalesce(clicks.spent, 0)
+        FROM campaign
+        LEFT JOIN (
+            SELECT ad_id, count(*) AS count, sum(cost_per_impression) AS spent
+            FROM impression GROUP BY ad_id
+        ) AS impressions ON impressions.ad_id = campaign.campaign_id
+        LEFT JOIN (
+            SELECT ad_id, count(*) AS count, sum(cost_per_click) AS spent
+            FROM click GROUP BY ad_id
+        ) AS clicks ON clicks.ad_id = campaign.campaign_id
+        WHERE impressions.ad_id IS NOT NULL OR clicks.ad_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('campaign_counters')
@@ -0,0 +1,59 @@
+"""['campaign daily stats']
+
+Revision ID: 7b2e4d91c0a5
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-18 12:31:07.284611
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b2e4d91c0a5'
+down_revision = '3f1c9a7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('campaign_daily_stats',
+    sa.Column('campaign_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Integer(), nullable=False),
+    sa.Column('advertiser_id', sa.UUID(), nullable=False),
+    sa.Column('impressions', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('clicks', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('spent_impressions', sa.Numeric(), server_default='0', nullable=False),
+    sa.Column('spent_clicks', sa.Numeric(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['advertiser_id'], ['advertiser.advertiser_id'], ),
+    sa.ForeignKeyConstraint(['campaign_id'], ['campaign.campaign_id'], ),
+    sa.PrimaryKeyConstraint('campaign_id', 'day')
+    )
+    op.create_index('ix_campaign_daily_stats_advertiser_id_day', 'campaign_daily_stats', ['advertiser_id', 'day'], unique=False)
+    op.execute("""
+        INSERT INTO campaign_daily_stats (
+            campaign_id, day, advertiser_id, impressions, clicks, spent_impressions, spent_clicks
+        )
+        SELECT
+            coalesce(impressions.ad_id, clicks.ad_id),
+            coalesce(impressions.day, clicks.day),
+            campaign.advertiser_id,
+            coalesce(impressions.count, 0),
+            coalesce(clicks.count, 0),
+            coalesce(impressions.spent, 0),
+            coalesce(clicks.spent, 0)
+        FROM (
+            SELECT ad_id, day, count(*) AS count, sum(cost_per_impression) AS spent
+            FROM impression GROUP BY ad_id, day
+        ) AS impressions
+        FULL JOIN (
+            SELECT ad_id, day, count(*) AS count, sum(cost_per_click) AS spent
+            FROM click GROUP BY ad_id, day
+        ) AS clicks ON clicks.ad_id = impressions.ad_id AND clicks.day = impressions.day
+        JOIN campaign ON campaign.campaign_id = coalesce(impressions.ad_id, clicks.ad_id)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_campaign_daily_stats_advertiser_id_day', table_name='campaign_daily_stats')
+    op.drop_table('campaign_daily_stats')
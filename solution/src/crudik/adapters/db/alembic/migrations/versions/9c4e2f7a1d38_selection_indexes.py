@@ -0,0 +1,52 @@
+"""['selection indexes']
+
+Revision ID: 9c4e2f7a1d38
+Revises: 7b2e4d91c0a5
+Create Date: 2026-10-18 16:05:43.910275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e2f7a1d38'
+down_revision = '7b2e4d91c0a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_campaign_age_from', table_name='campaign')
+    op.drop_index('ix_campaign_age_to', table_name='campaign')
+    op.drop_index('ix_campaign_gender', table_name='campaign')
+    op.drop_index('ix_campaign_is_deleted', table_name='campaign')
+    op.drop_index('ix_campaign_location', table_name='campaign')
+    op.create_index('ix_campaign_active_dates', 'campaign', ['start_date', 'end_date'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_campaign_active_targeting', 'campaign', ['location', 'gender', 'age_from', 'age_to'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+
+    op.drop_index('ix_click_cost_per_click', table_name='click')
+    op.drop_index('ix_click_ad_id', table_name='click')
+    op.create_index('ix_click_ad_id_day', 'click', ['ad_id', 'day'], unique=False, postgresql_include=['cost_per_click'])
+
+    op.drop_index('ix_impression_cost_per_impression', table_name='impression')
+    op.drop_index('ix_impression_ad_id', table_name='impression')
+    op.create_index('ix_impression_ad_id_day', 'impression', ['ad_id', 'day'], unique=False, postgresql_include=['cost_per_impression'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_impression_ad_id_day', table_name='impression')
+    op.create_index('ix_impression_ad_id', 'impression', ['ad_id'], unique=False)
+    op.create_index('ix_impression_cost_per_impression', 'impression', ['cost_per_impression'], unique=False)
+
+    op.drop_index('ix_click_ad_id_day', table_name='click')
+    op.create_index('ix_click_ad_id', 'click', ['ad_id'], unique=False)
+    op.create_index('ix_click_cost_per_click', 'click', ['cost_per_click'], unique=False)
+
+    op.drop_index('ix_campaign_active_targeting', table_name='campaign', postgresql_where=sa.text('NOT is_deleted'))
+    op.drop_index('ix_campaign_active_dates', table_name='campaign', postgresql_where=sa.text('NOT is_deleted'))
+    op.create_index('ix_campaign_location', 'campaign', ['location'], unique=False)
+    op.create_index('ix_campaign_is_deleted', 'campaign', ['is_deleted'], unique=False)
+    op.create_index('ix_campaign_gender', 'campaign', ['gender'], unique=False)
+    op.create_index('ix_campaign_age_to', 'campaign', ['age_to'], unique=False)
+    op.create_index('ix_campaign_age_from', 'campaign', ['age_from'], unique=False)
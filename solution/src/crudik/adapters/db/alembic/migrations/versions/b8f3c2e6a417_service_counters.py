@@ -0,0 +1,49 @@
+"""['service counters']
+
+Revision ID: b8f3c2e6a417
+Revises: e51a3b8d6f20
+Create Date: 2026-10-18 19:04:52.117094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8f3c2e6a417'
+down_revision = 'e51a3b8d6f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('service_counters',
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('impressions_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('clicks_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('spent_impressions', sa.Numeric(), server_default='0', nullable=False),
+    sa.Column('spent_clicks', sa.Numeric(), server_default='0', nullable=False),
+    sa.Column('advertisers_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('clients_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('campaigns_count', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('shard')
+    )
+    op.execute("""
+        INSERT INTO service_counters (
+            shard, impressions_count, clicks_count, spent_impressions, spent_clicks,
+            advertisers_count, clients_count, campaigns_count
+        )
+        SELECT
+            0,
+            (SELECT coalesce(sum(impressions_count), 0) FROM campaign_counters),
+            (SELECT coalesce(sum(clicks_count), 0) FROM campaign_counters),
+            (SELECT coalesce(sum(spent_impressions), 0) FROM campaign_counters),
+            (SELECT coalesce(sum(spent_clicks), 0) FROM campaign_counters),
+            (SELECT count(*) FROM advertiser),
+            (SELECT count(*) FROM client),
+            (SELECT count(*) FROM campaign)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('service_counters')
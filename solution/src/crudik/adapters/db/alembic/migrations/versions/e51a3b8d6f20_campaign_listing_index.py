@@ -0,0 +1,24 @@
+"""['campaign listing index']
+
+Revision ID: e51a3b8d6f20
+Revises: 9c4e2f7a1d38
+Create Date: 2026-10-18 18:22:10.403817
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e51a3b8d6f20'
+down_revision = '9c4e2f7a1d38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_campaign_active_advertiser_id_ad_title', 'campaign', ['advertiser_id', 'ad_title', 'campaign_id'], unique=False, postgresql_where=sa.text('NOT is_deleted'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_campaign_active_advertiser_id_ad_title', table_name='campaign', postgresql_where=sa.text('NOT is_deleted'))
@@ -1,4 +1,19 @@
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, Numeric, Table, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    SmallInteger,
+    Table,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as SA_UUID
 
 from crudik.domain.entity.advertiser import Advertiser
@@ -66,13 +81,36 @@ campaign_table = Table(
     Column("ad_text", Text, nullable=False),
     Column("start_date", Integer, nullable=False),
     Column("end_date", Integer, nullable=False),
-    Column("age_from", Integer, nullable=True, index=True),
-    Column("age_to", Integer, nullable=True, index=True),
-    Column("location", Text, nullable=True, index=True),
-    Column("gender", Enum(TargetGender), nullable=True, index=True),
+    Column("age_from", Integer, nullable=True),
+    Column("age_to", Integer, nullable=True),
+    Column("location", Text, nullable=True),
+    Column("gender", Enum(TargetGender), nullable=True),
     Column("image_path", Text, nullable=True),
-    Column("is_deleted", Boolean, nullable=False, index=True),
+    Column("is_deleted", Boolean, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
+    # the only campaigns ever looked up by dates or targeting are the live ones
+    Index(
+        "ix_campaign_active_dates",
+        "start_date",
+        "end_date",
+        postgresql_where=text("NOT is_deleted"),
+    ),
+    Index(
+        "ix_campaign_active_targeting",
+        "location",
+        "gender",
+        "age_from",
+        "age_to",
+        postgresql_where=text("NOT is_deleted"),
+    ),
+    # the campaign listing order, so a page is an index range scan
+    Index(
+        "ix_campaign_active_advertiser_id_ad_title",
+        "advertiser_id",
+        "ad_title",
+        "campaign_id",
+        postgresql_where=text("NOT is_deleted"),
+    ),
 )
 
 click_table = Table(
@@ -84,7 +122,6 @@ click_table = Table(
         SA_UUID(as_uuid=True),
         ForeignKey("campaign.campaign_id"),
         nullable=False,
-        index=True,
     ),
     Column(
         "client_id",
@@ -93,10 +130,12 @@ click_table = Table(
         nullable=False,
         index=True,
     ),
-    Column("cost_per_click", Numeric(10, 2), nullable=False, index=True),
+    Column("cost_per_click", Numeric(10, 2), nullable=False),
     Column("day", Integer, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
     UniqueConstraint("client_id", "ad_id"),
+    # per campaign and per day aggregates are answered from the index alone
+    Index("ix_click_ad_id_day", "ad_id", "day", postgresql_include=["cost_per_click"]),
 )
 
 impression_table = Table(
@@ -108,7 +147,6 @@ impression_table = Table(
         SA_UUID(as_uuid=True),
         ForeignKey("campaign.campaign_id"),
         nullable=False,
-        index=True,
     ),
     Column(
         "client_id",
@@ -117,10 +155,65 @@ impression_table = Table(
         nullable=False,
         index=True,
     ),
-    Column("cost_per_impression", Numeric(10, 2), nullable=False, index=True),
+    Column("cost_per_impression", Numeric(10, 2), nullable=False),
     Column("day", Integer, nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
     UniqueConstraint("client_id", "ad_id"),
+    # per campaign and per day aggregates are answered from the index alone
+    Index("ix_impression_ad_id_day", "ad_id", "day", postgresql_include=["cost_per_impression"]),
+)
+
+campaign_counters_table = Table(
+    "campaign_counters",
+    metadata,
+    Column(
+        "campaign_id",
+        SA_UUID(as_uuid=True),
+        ForeignKey("campaign.campaign_id"),
+        primary_key=True,
+    ),
+    Column("impressions_count", Integer, nullable=False, server_default="0"),
+    Column("clicks_count", Integer, nullable=False, server_default="0"),
+    Column("spent_impressions", Numeric, nullable=False, server_default="0"),
+    Column("spent_clicks", Numeric, nullable=False, server_default="0"),
+)
+
+# service-wide totals split over rows, a connection always increments the row pg_backend_pid() % SERVICE_COUNTER_SHARDS,
+# so concurrent writers on different connections rarely wait for the same row, the totals are the sums over all rows
+service_counters_table = Table(
+    "service_counters",
+    metadata,
+    Column("shard", SmallInteger, primary_key=True),
+    Column("impressions_count", BigInteger, nullable=False, server_default="0"),
+    Column("clicks_count", BigInteger, nullable=False, server_default="0"),
+    Column("spent_impressions", Numeric, nullable=False, server_default="0"),
+    Column("spent_clicks", Numeric, nullable=False, server_default="0"),
+    Column("advertisers_count", BigInteger, nullable=False, server_default="0"),
+    Column("clients_count", BigInteger, nullable=False, server_default="0"),
+    Column("campaigns_count", BigInteger, nullable=False, server_default="0"),
+)
+
+campaign_daily_stats_table = Table(
+    "campaign_daily_stats",
+    metadata,
+    Column(
+        "campaign_id",
+        SA_UUID(as_uuid=True),
+        ForeignKey("campaign.campaign_id"),
+        primary_key=True,
+    ),
+    Column("day", Integer, primary_key=True),
+    Column(
+        "advertiser_id",
+        SA_UUID(as_uuid=True),
+        ForeignKey("advertiser.advertiser_id"),
+        nullable=False,
+    ),
+    Column("impressions", Integer, nullable=False, server_default="0"),
+    Column("clicks", Integer, nullable=False, server_default="0"),
+    Column("spent_impressions", Numeric, nullable=False, server_default="0"),
+    Column("spent_clicks", Numeric, nullable=False, server_default="0"),
+    Index("ix_campaign_daily_stats_advertiser_id_day", "advertiser_id", "day"),
 )
 
 mapper_registry.map_imperatively(Client, client_table)
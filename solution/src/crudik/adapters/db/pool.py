@@ -0,0 +1,74 @@
+import statistics
+from collections import deque
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+from crudik.application.common.pool_monitor import PoolMonitor
+from crudik.application.data_model.metrics import PoolStat
+
+WAIT_WINDOW = 1000
+
+
+class PoolWaitMonitor(PoolMonitor):
+    """Connection checkout wait times of the engine pools.
+
+    A wait includes opening a new connection when the pool grows. Wait
+    percentiles are computed over the last ``WAIT_WINDOW`` checkouts, a checkout
+    failed on the pool timeout counts with the time it waited. Sizes are summed
+    over the primary and the replica pools.
+    """
+
+    __slots__ = ("_checkouts", "_pools", "_waits")
+
+    def __init__(self) -> None:
+        self._waits: deque[float] = deque(maxlen=WAIT_WINDOW)
+        self._checkouts = 0
+        self._pools: dict[str, AsyncAdaptedQueuePool] = {}
+
+    def watch(self, name: str, pool: AsyncAdaptedQueuePool) -> None:
+        self._pools[name] = pool
+
+    def record(self, wait: float) -> None:
+        self._checkouts += 1
+        self._waits.append(wait)
+
+    def get_stats(self) -> PoolStat:
+        waits_ms = sorted(wait * 1000 for wait in self._waits)
+        return PoolStat(
+            size=sum(pool.size() for pool in self._pools.values()),
+            checked_out=sum(pool.checkedout() for pool in self._pools.values()),
+            overflow=sum(max(pool.overflow(), 0) for pool in self._pools.values()),
+            checkouts=self._checkouts,
+            wait_avg_ms=statistics.fmean(waits_ms) if waits_ms else 0.0,
+            wait_p50_ms=_percentile(waits_ms, 0.5),
+            wait_p99_ms=_percentile(waits_ms, 0.99),
+            wait_max_ms=waits_ms[-1] if waits_ms else 0.0,
+        )
+
+
+def _percentile(ordered: list[float], rank: float) -> float:
+    if not ordered:
+        return 0.0
+
+    return ordered[min(int(len(ordered) * rank), len(ordered) - 1)]
+
+
+def timed_pool_class(monitor: PoolWaitMonitor, name: str) -> type[Pool]:
+    """Queue pool class reporting how long every checkout waited to ``monitor``, ``name`` tells the engines apart."""
+
+    class TimedQueuePool(AsyncAdaptedQueuePool):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            # the engine recreates its pool on dispose, the new one takes over
+            monitor.watch(name, self)
+
+        def _do_get(self) -> ConnectionPoolEntry:
+            start = perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                monitor.record(perf_counter() - start)
+
+    return TimedQueuePool
@@ -1,5 +1,7 @@
 import logging
 from collections.abc import AsyncIterator
+from typing import Any, NewType
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -8,15 +10,47 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from crudik.adapters.config_loader import DBConnectionConfig
+from crudik.adapters.config_loader import DBConnectionConfig, DBPoolConfig
+from crudik.adapters.db.pool import PoolWaitMonitor, timed_pool_class
+from crudik.adapters.db.replica import ReplicaRouter
 
+# a session for queries that can be answered by a read replica
+ReadOnlySession = NewType("ReadOnlySession", AsyncSession)
 
-async def get_engine(config: DBConnectionConfig) -> AsyncIterator[AsyncEngine]:
+
+def get_connect_args(config: DBPoolConfig) -> dict[str, Any]:
+    if config.pgbouncer:
+        # a transaction pooler hands every transaction to some other server connection,
+        # where statements prepared on the previous one do not exist
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    return {
+        "statement_cache_size": config.statement_cache_size,
+        "prepared_statement_cache_size": config.prepared_statement_cache_size,
+    }
+
+
+async def get_engine(
+    config: DBConnectionConfig,
+    pool_config: DBPoolConfig,
+    pool_monitor: PoolWaitMonitor,
+) -> AsyncIterator[AsyncEngine]:
     connection_url = config.postgres_conn_url
 
     engine = create_async_engine(
         connection_url,
         future=True,
+        poolclass=timed_pool_class(pool_monitor, "primary"),
+        pool_size=pool_config.pool_size,
+        max_overflow=pool_config.max_overflow,
+        pool_timeout=pool_config.pool_timeout,
+        pool_recycle=pool_config.pool_recycle,
+        pool_pre_ping=pool_config.pool_pre_ping,
+        connect_args=get_connect_args(pool_config),
     )
 
     logging.debug("Engine was created.")
@@ -28,6 +62,43 @@ async def get_engine(config: DBConnectionConfig) -> AsyncIterator[AsyncEngine]:
     logging.debug("Engine was disposed.")
 
 
+async def get_replica_router(
+    config: DBConnectionConfig,
+    pool_config: DBPoolConfig,
+    session_factory: async_sessionmaker[AsyncSession],
+    pool_monitor: PoolWaitMonitor,
+) -> AsyncIterator[ReplicaRouter]:
+    if config.replica_conn_url is None:
+        yield ReplicaRouter(session_factory, None, config.replica_max_lag, config.replica_check_interval)
+        return
+
+    engine = create_async_engine(
+        config.replica_conn_url,
+        future=True,
+        poolclass=timed_pool_class(pool_monitor, "replica"),
+        pool_size=pool_config.pool_size,
+        max_overflow=pool_config.max_overflow,
+        pool_timeout=pool_config.pool_timeout,
+        pool_recycle=pool_config.pool_recycle,
+        pool_pre_ping=pool_config.pool_pre_ping,
+        connect_args=get_connect_args(pool_config),
+    )
+    replica_session_factory = await get_async_sessionmaker(engine)
+
+    logging.debug("Replica engine was created.")
+
+    yield ReplicaRouter(
+        session_factory,
+        replica_session_factory,
+        config.replica_max_lag,
+        config.replica_check_interval,
+    )
+
+    await engine.dispose()
+
+    logging.debug("Replica engine was disposed.")
+
+
 async def get_async_sessionmaker(
     engine: AsyncEngine,
 ) -> async_sessionmaker[AsyncSession]:
@@ -47,3 +118,9 @@ async def get_async_session(
 ) -> AsyncIterator[AsyncSession]:
     async with session_factory() as session:
         yield session
+
+
+async def get_read_only_session(router: ReplicaRouter) -> AsyncIterator[ReadOnlySession]:
+    session_factory = await router.get_session_factory()
+    async with session_factory() as session:
+        yield ReadOnlySession(session)
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+# zero while the replica has replayed everything it received, otherwise the age of the last replayed transaction
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """,
+)
+
+
+class ReplicaRouter:
+    """Chooses where read-only sessions go.
+
+    The replica is used while its replication lag, checked at most once per
+    ``check_interval`` seconds, stays within ``max_lag`` seconds. Without a
+    replica, while it lags or when it cannot be reached, the primary is used.
+    """
+
+    __slots__ = (
+        "_check_interval",
+        "_checked_at",
+        "_lock",
+        "_max_lag",
+        "_primary",
+        "_replica",
+        "_use_replica",
+    )
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replica: async_sessionmaker[AsyncSession] | None,
+        max_lag: float,
+        check_interval: float,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._max_lag = max_lag
+        self._check_interval = check_interval
+        self._use_replica = False
+        self._checked_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._replica is None:
+            return self._primary
+
+        loop = asyncio.get_running_loop()
+        if self._checked_at is None or loop.time() - self._checked_at >= self._check_interval:
+            async with self._lock:
+                # a concurrent request may have checked while this one waited
+                if self._checked_at is None or loop.time() - self._checked_at >= self._check_interval:
+                    self._use_replica = await self._is_replica_fresh(self._replica)
+                    self._checked_at = loop.time()
+
+        return self._replica if self._use_replica else self._primary
+
+    async def _is_replica_fresh(self, replica: async_sessionmaker[AsyncSession]) -> bool:
+        try:
+            async with replica() as session:
+                lag = float((await session.execute(REPLICATION_LAG_QUERY)).scalar_one())
+        except (SQLAlchemyError, OSError):
+            logging.exception("Replica is unavailable, reading from the primary")
+            return False
+
+        if lag > self._max_lag:
+            logging.warning("Replica lags %.1f seconds behind, reading from the primary", lag)
+            return False
+
+        return True
@@ -0,0 +1,239 @@
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+from uuid import UUID
+
+from sqlalchemy import Table
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crudik.adapters.db.models.ad import click_table, impression_table
+from crudik.adapters.gateway.counter import CounterAlchemyGateway
+from crudik.application.common.event_writer import EventWriter
+from crudik.application.common.gateway.ad import AdGateway
+from crudik.application.common.gateway.counter import CounterGateway
+from crudik.application.common.ingestion_monitor import IngestionMonitor
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import ImpressionOutcome
+from crudik.application.data_model.metrics import IngestionStat
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.impression import Impression
+
+EventT = TypeVar("EventT", Impression, Click)
+
+# a failed batch is written again after RETRY_DELAY seconds times the attempt number
+FLUSH_ATTEMPTS = 3
+RETRY_DELAY = 0.2
+
+
+@dataclass(slots=True, frozen=True)
+class TransactionalEventWriter(EventWriter):
+    """Writes every event in its own transaction, the default mode."""
+
+    uow: UoW
+    counter_gateway: CounterGateway
+    ad_gateway: AdGateway
+
+    def has_pending_impression(self, client_id: UUID, ad_id: UUID) -> bool:
+        return False
+
+    def has_pending_click(self, client_id: UUID, ad_id: UUID) -> bool:
+        return False
+
+    async def write_impression(self, impression: Impression) -> ImpressionOutcome:
+        outcome = await self.ad_gateway.record_impression(impression)
+        if outcome is ImpressionOutcome.RECORDED:
+            await self.uow.commit()
+        return outcome
+
+    async def write_click(self, click: Click) -> None:
+        self.uow.add(click)
+        await self.counter_gateway.count_clicks([click])
+        await self.uow.commit()
+
+
+class IngestionCounters(IngestionMonitor):
+    """Event totals of the batched writer, all zero in the transactional mode."""
+
+    __slots__ = ("dropped", "queued", "retried_batches", "written")
+
+    def __init__(self) -> None:
+        self.queued = 0
+        self.written = 0
+        self.retried_batches = 0
+        self.dropped = 0
+
+    def get_stats(self) -> IngestionStat:
+        return IngestionStat(
+            queued=self.queued,
+            written=self.written,
+            retried_batches=self.retried_batches,
+            dropped=self.dropped,
+        )
+
+
+async def write_batch(
+    session_factory: async_sessionmaker[AsyncSession],
+    impressions: Sequence[Impression],
+    clicks: Sequence[Click],
+) -> None:
+    """Store and count the events in one transaction, skipping already stored ones."""
+    async with session_factory() as session:
+        counter_gateway = CounterAlchemyGateway(session)
+        # impressions go first, clicks of this batch may refer to them
+        new_impressions = await _insert_new(session, impression_table, impressions)
+        await counter_gateway.count_impressions(new_impressions)
+        new_clicks = await _insert_new(session, click_table, clicks)
+        await counter_gateway.count_clicks(new_clicks)
+        await session.commit()
+
+
+async def _insert_new(session: AsyncSession, table: Table, events: Sequence[EventT]) -> Sequence[EventT]:
+    """Insert events skipping already stored ones, return the inserted events."""
+    if not events:
+        return []
+
+    id_column = table.primary_key.columns.values()[0]
+    stmt = (
+        pg_insert(table)
+        .values([dataclasses.asdict(each) for each in events])
+        .on_conflict_do_nothing()
+        .returning(id_column)
+    )
+    inserted = set((await session.execute(stmt)).scalars().all())
+    return [each for each in events if getattr(each, id_column.name) in inserted]
+
+
+class BatchedEventWriter(EventWriter):
+    """Queues events and writes them in batches from a background task.
+
+    A batch is flushed once it has ``batch_size`` events or ``flush_interval``
+    seconds after its first event. Events stay pending until their batch is
+    committed, and a second event for the same client and campaign is dropped
+    while the first one is pending. A failed batch is retried ``FLUSH_ATTEMPTS``
+    times in all, retries are safe as already stored events are skipped, then
+    its events are dropped and counted in ``counters``.
+    """
+
+    __slots__ = (
+        "_batch_size",
+        "_counters",
+        "_flush_interval",
+        "_pending_clicks",
+        "_pending_impressions",
+        "_queue",
+        "_task",
+        "_write",
+    )
+
+    def __init__(
+        self,
+        write: Callable[[Sequence[Impression], Sequence[Click]], Awaitable[None]],
+        counters: IngestionCounters,
+        batch_size: int,
+        flush_interval: float,
+    ) -> None:
+        self._write = write
+        self._counters = counters
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue[Impression | Click | None] = asyncio.Queue()
+        self._pending_impressions: set[tuple[UUID, UUID]] = set()
+        self._pending_clicks: set[tuple[UUID, UUID]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Flush the events queued so far and stop the background task."""
+        if self._task is None:
+            return
+
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    def has_pending_impression(self, client_id: UUID, ad_id: UUID) -> bool:
+        return (client_id, ad_id) in self._pending_impressions
+
+    def has_pending_click(self, client_id: UUID, ad_id: UUID) -> bool:
+        return (client_id, ad_id) in self._pending_clicks
+
+    async def write_impression(self, impression: Impression) -> ImpressionOutcome:
+        key = (impression.client_id, impression.ad_id)
+        if key in self._pending_impressions:
+            return ImpressionOutcome.ALREADY_SHOWN
+
+        self._pending_impressions.add(key)
+        await self._enqueue(impression)
+        return ImpressionOutcome.RECORDED
+
+    async def write_click(self, click: Click) -> None:
+        key = (click.client_id, click.ad_id)
+        if key in self._pending_clicks:
+            return
+
+        self._pending_clicks.add(key)
+        await self._enqueue(click)
+
+    async def _enqueue(self, event: Impression | Click) -> None:
+        self._counters.queued += 1
+        await self._queue.put(event)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            event = await self._queue.get()
+            if event is None:
+                return
+
+            batch = [event]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+
+                if event is None:
+                    stopping = True
+                    break
+
+                batch.append(event)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: Sequence[Impression | Click]) -> None:
+        impressions = [each for each in batch if isinstance(each, Impression)]
+        clicks = [each for each in batch if isinstance(each, Click)]
+
+        try:
+            for attempt in range(1, FLUSH_ATTEMPTS + 1):
+                try:
+                    await self._write(impressions, clicks)
+                except Exception:
+                    logging.exception(
+                        "Failed to write %s impressions and %s clicks, attempt %s",
+                        len(impressions),
+                        len(clicks),
+                        attempt,
+                    )
+                else:
+                    self._counters.written += len(batch)
+                    return
+
+                if attempt < FLUSH_ATTEMPTS:
+                    self._counters.retried_batches += 1
+                    await asyncio.sleep(RETRY_DELAY * attempt)
+
+            self._counters.dropped += len(batch)
+            logging.error("Dropped %s impressions and %s clicks", len(impressions), len(clicks))
+        finally:
+            self._pending_impressions.difference_update((each.client_id, each.ad_id) for each in impressions)
+            self._pending_clicks.difference_update((each.client_id, each.ad_id) for each in clicks)
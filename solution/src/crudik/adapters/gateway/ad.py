@@ -1,31 +1,140 @@
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy import (
+    DateTime,
+    Integer,
+    Select,
     and_,
-    case,
+    any_,
+    bindparam,
     exists,
     func,
-    literal,
-    or_,
     select,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as SA_UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from crudik.adapters.db.models.ad import (
+    campaign_counters_table,
     campaign_table,
     click_table,
+    client_table,
     impression_table,
-    relevance_table,
 )
+from crudik.adapters.gateway.counter import counting_ctes
 from crudik.application.common.gateway.ad import AdGateway
-from crudik.application.data_model.ad import Ad
-from crudik.domain.entity.campaign import TargetGender
+from crudik.application.data_model.ad import AdCandidateStats, ClickOutcome, ImpressionOutcome
 from crudik.domain.entity.click import Click
-from crudik.domain.entity.client import Client
 from crudik.domain.entity.impression import Impression
 
 
+def _build_candidates_stats_query() -> Select[Any]:
+    client_id = bindparam("client_id", type_=SA_UUID(as_uuid=True))
+    is_seen = exists().where(
+        and_(
+            impression_table.c.client_id == client_id,
+            impression_table.c.ad_id == campaign_table.c.campaign_id,
+        ),
+    )
+    return (
+        select(
+            campaign_table.c.campaign_id,
+            func.coalesce(campaign_counters_table.c.impressions_count, 0),
+            func.coalesce(campaign_counters_table.c.clicks_count, 0),
+            is_seen,
+        )
+        .outerjoin(
+            campaign_counters_table,
+            campaign_counters_table.c.campaign_id == campaign_table.c.campaign_id,
+        )
+        .where(
+            # one array parameter instead of an IN list, so the SQL text and its
+            # prepared statement do not depend on the number of candidates
+            campaign_table.c.campaign_id == any_(bindparam("ad_ids", type_=ARRAY(SA_UUID(as_uuid=True)))),
+            ~campaign_table.c.is_deleted,
+        )
+    )
+
+
+def _build_record_impression_statement() -> Select[Any]:
+    ad_id = bindparam("ad_id", type_=SA_UUID(as_uuid=True))
+    campaign = campaign_table.c
+    new_impression = (
+        pg_insert(impression_table)
+        .from_select(
+            ["impression_id", "ad_id", "client_id", "cost_per_impression", "day", "created_at"],
+            select(
+                bindparam("impression_id", type_=SA_UUID(as_uuid=True)),
+                campaign.campaign_id,
+                bindparam("client_id", type_=SA_UUID(as_uuid=True)),
+                campaign.cost_per_impression,
+                bindparam("day", type_=Integer),
+                bindparam("created_at", type_=DateTime(timezone=True)),
+            ).where(
+                campaign.campaign_id == ad_id,
+                ~campaign.is_deleted,
+            ),
+        )
+        # a concurrent show of the same campaign to the client has won, nothing is inserted or counted
+        .on_conflict_do_nothing(index_elements=["client_id", "ad_id"])
+        .returning(
+            impression_table.c.ad_id,
+            impression_table.c.day,
+            impression_table.c.cost_per_impression.label("cost"),
+        )
+        .cte("new_impression")
+    )
+    # the check sees the snapshot the insert saw, it tells a deleted campaign from a concurrent show
+    return select(
+        select(func.count()).select_from(new_impression).scalar_subquery(),
+        exists().where(campaign.campaign_id == ad_id, ~campaign.is_deleted),
+    ).add_cte(*counting_ctes(new_impression, "impressions_count", "impressions", "spent_impressions"))
+
+
+def _build_record_click_statement() -> Select[Any]:
+    client_id = bindparam("client_id", type_=SA_UUID(as_uuid=True))
+    ad_id = bindparam("ad_id", type_=SA_UUID(as_uuid=True))
+    campaign = campaign_table.c
+    impression_exists = exists().where(impression_table.c.client_id == client_id, impression_table.c.ad_id == ad_id)
+    new_click = (
+        pg_insert(click_table)
+        .from_select(
+            ["click_id", "ad_id", "client_id", "cost_per_click", "day", "created_at"],
+            select(
+                bindparam("click_id", type_=SA_UUID(as_uuid=True)),
+                campaign.campaign_id,
+                client_id,
+                campaign.cost_per_click,
+                bindparam("day", type_=Integer),
+                bindparam("created_at", type_=DateTime(timezone=True)),
+            ).where(campaign.campaign_id == ad_id, ~campaign.is_deleted, impression_exists),
+        )
+        # the client has clicked before, nothing is inserted or counted
+        .on_conflict_do_nothing(index_elements=["client_id", "ad_id"])
+        .returning(click_table.c.ad_id, click_table.c.day, click_table.c.cost_per_click.label("cost"))
+        .cte("new_click")
+    )
+    # the checks see the snapshot the insert saw, they tell why nothing was inserted
+    return select(
+        select(func.count()).select_from(new_click).scalar_subquery(),
+        exists().where(client_table.c.client_id == client_id),
+        exists().where(campaign.campaign_id == ad_id, ~campaign.is_deleted),
+        impression_exists,
+    ).add_cte(*counting_ctes(new_click, "clicks_count", "clicks", "spent_clicks"))
+
+
+# built once per process, every execution is a compiled cache hit with the same SQL text
+CANDIDATES_STATS_QUERY = _build_candidates_stats_query()
+RECORD_IMPRESSION_STATEMENT = _build_record_impression_statement()
+RECORD_CLICK_STATEMENT = _build_record_click_statement()
+
+
 @dataclass(slots=True, frozen=True)
 class AdAlchemyGateway(AdGateway):
     session: AsyncSession
@@ -41,77 +150,60 @@ class AdAlchemyGateway(AdGateway):
         return res
 
     async def get_clicks_count(self, ad_id: UUID) -> int:
-        q = select(func.count("*")).where(click_table.c.ad_id == ad_id).select_from(click_table)
-        res = (await self.session.execute(q)).scalar_one()
-        return res
+        q = select(campaign_counters_table.c.clicks_count).where(campaign_counters_table.c.campaign_id == ad_id)
+        res = (await self.session.execute(q)).scalar_one_or_none()
+        return res or 0
 
-    async def show_ad(self, client: Client, day: int) -> Ad | None:
-        impression_cte = (
-            select(impression_table.c.ad_id, func.count().label("count"))
-            .group_by(impression_table.c.ad_id)
-            .cte("impression_counts")
-        )
+    async def get_candidates_stats(
+        self,
+        client_id: UUID,
+        ad_ids: Collection[UUID],
+    ) -> Mapping[UUID, AdCandidateStats]:
+        if not ad_ids:
+            return {}
 
-        click_cte = (
-            select(click_table.c.ad_id, func.count().label("count")).group_by(click_table.c.ad_id).cte("click_counts")
+        result = await self.session.execute(
+            CANDIDATES_STATS_QUERY,
+            {"client_id": client_id, "ad_ids": list(ad_ids)},
         )
+        return {row[0]: AdCandidateStats(row[0], row[1], row[2], row[3]) for row in result}
 
-        profit = 0.5 * (campaign_table.c.cost_per_impression + campaign_table.c.cost_per_click)
-        relevance = 0.25 * func.coalesce(relevance_table.c.score, 0)
-
-        impressions_ratio = func.coalesce(impression_cte.c.count, 0) / campaign_table.c.impressions_limit
-        clicks_ratio = func.coalesce(click_cte.c.count, 0) / campaign_table.c.clicks_limit
-        limit_bonus = 0.15 * ((1 - impressions_ratio) + (1 - clicks_ratio)) / 2
-        click_penalty = case(
-            (
-                click_cte.c.count > campaign_table.c.clicks_limit,
-                -0.05 * clicks_ratio,
-            ),
-            else_=0.0,
-        )
-        query = (
-            select(
-                campaign_table.c.campaign_id,
-                campaign_table.c.ad_text,
-                campaign_table.c.ad_title,
-                campaign_table.c.advertiser_id,
-            )
-            .outerjoin(
-                relevance_table,
-                and_(
-                    relevance_table.c.client_id == client.client_id,
-                    relevance_table.c.advertiser_id == campaign_table.c.advertiser_id,
-                ),
-            )
-            .outerjoin(impression_cte, impression_cte.c.ad_id == campaign_table.c.campaign_id)
-            .outerjoin(click_cte, click_cte.c.ad_id == campaign_table.c.campaign_id)
-            .where(
-                and_(
-                    campaign_table.c.start_date <= day,
-                    campaign_table.c.end_date >= day,
-                    or_(campaign_table.c.age_from.is_(None), campaign_table.c.age_from <= client.age),
-                    or_(campaign_table.c.age_to.is_(None), campaign_table.c.age_to >= client.age),
-                    or_(campaign_table.c.location.is_(None), campaign_table.c.location == client.location),
-                    or_(
-                        campaign_table.c.gender.is_(None),
-                        campaign_table.c.gender == TargetGender.ALL,
-                        and_(campaign_table.c.gender == TargetGender.MALE, literal(client.gender.value) == "MALE"),
-                        and_(campaign_table.c.gender == TargetGender.FEMALE, literal(client.gender.value) == "FEMALE"),
-                    ),
-                    ~exists().where(
-                        and_(
-                            impression_table.c.client_id == client.client_id,
-                            impression_table.c.ad_id == campaign_table.c.campaign_id,
-                        ),
-                    ),
-                    func.coalesce(impression_cte.c.count, 0) < campaign_table.c.impressions_limit * 1.049,
-                    ~campaign_table.c.is_deleted,
-                ),
-            )
-            .order_by((profit + relevance + limit_bonus + click_penalty).desc())
-            .limit(1)
+    async def record_impression(self, impression: Impression) -> ImpressionOutcome:
+        result = await self.session.execute(
+            RECORD_IMPRESSION_STATEMENT,
+            {
+                "impression_id": impression.impression_id,
+                "ad_id": impression.ad_id,
+                "client_id": impression.client_id,
+                "day": impression.day,
+                "created_at": impression.created_at,
+            },
         )
+        inserted, campaign_exists = result.one()
+        if inserted:
+            return ImpressionOutcome.RECORDED
+        if not campaign_exists:
+            return ImpressionOutcome.CAMPAIGN_NOT_FOUND
+        return ImpressionOutcome.ALREADY_SHOWN
 
-        result = await self.session.execute(query)
-        row = result.first()
-        return Ad(row[0], row[1], row[2], row[3]) if row else None
+    async def record_click(self, click_id: UUID, client_id: UUID, ad_id: UUID, day: int) -> ClickOutcome:
+        result = await self.session.execute(
+            RECORD_CLICK_STATEMENT,
+            {
+                "click_id": click_id,
+                "ad_id": ad_id,
+                "client_id": client_id,
+                "day": day,
+                "created_at": datetime.now(tz=UTC),
+            },
+        )
+        inserted, client_exists, campaign_exists, impression_exists = result.one()
+        if inserted:
+            return ClickOutcome.RECORDED
+        if not client_exists:
+            return ClickOutcome.CLIENT_NOT_FOUND
+        if not campaign_exists:
+            return ClickOutcome.CAMPAIGN_NOT_FOUND
+        if not impression_exists:
+            return ClickOutcome.NO_IMPRESSION
+        return ClickOutcome.ALREADY_CLICKED
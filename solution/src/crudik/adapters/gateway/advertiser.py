@@ -1,88 +1,219 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import AsyncIterator, Collection, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Integer, Select, any_, bindparam, case, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, Insert
+from sqlalchemy.dialects.postgresql import UUID as SA_UUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from crudik.adapters.db.models.ad import campaign_table, click_table, impression_table
+from crudik.adapters.db.models.ad import (
+    advertiser_table,
+    campaign_counters_table,
+    campaign_daily_stats_table,
+    campaign_table,
+)
+from crudik.adapters.gateway.bulk import COPY_THRESHOLD, UPSERT_CHUNK_SIZE, copy_to_staging, execute_upsert
+from crudik.adapters.gateway.counter import increment_service_counters
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily, retort_campaign_stat_from_list
+from crudik.application.data_model.campaign import (
+    AdvertiserCampaignStat,
+    CampaignStat,
+    CampaignStatDaily,
+    CampaignStatDailyRow,
+    CampaignStatSort,
+    SortOrder,
+    retort_campaign_stat_from_list,
+)
 from crudik.domain.entity.advertiser import Advertiser
-from crudik.domain.entity.campaign import Campaign
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+def _build_stat_query() -> Select[Any]:
+    impression_count = func.coalesce(func.sum(campaign_counters_table.c.impressions_count), 0)
+    click_count = func.coalesce(func.sum(campaign_counters_table.c.clicks_count), 0)
+
+    conversion = func.coalesce(
+        (click_count / func.nullif(impression_count, 0)) * 100,
+        0.0,
+    )
+    spent_impressions = func.coalesce(func.sum(campaign_counters_table.c.spent_impressions), 0.0)
+    spent_clicks = func.coalesce(func.sum(campaign_counters_table.c.spent_clicks), 0.0)
+    spent_total = spent_impressions + spent_clicks
+
+    return (
+        select(
+            impression_count,
+            click_count,
+            conversion,
+            spent_impressions,
+            spent_clicks,
+            spent_total,
+        )
+        .select_from(campaign_counters_table)
+        .join(campaign_table, campaign_counters_table.c.campaign_id == campaign_table.c.campaign_id)
+        .where(campaign_table.c.advertiser_id == bindparam("advertiser_id"))
+    )
+
+
+def _build_stat_daily_query() -> Select[Any]:
+    daily = campaign_daily_stats_table.c
+    impressions_count = func.sum(daily.impressions)
+    clicks_count = func.sum(daily.clicks)
+    spent_impressions = func.sum(daily.spent_impressions)
+    spent_clicks = func.sum(daily.spent_clicks)
+    conversion = case(
+        (impressions_count > 0, (clicks_count / impressions_count) * 100),
+        else_=0.0,
+    )
+    return (
+        select(
+            impressions_count,
+            clicks_count,
+            conversion,
+            spent_impressions,
+            spent_clicks,
+            spent_impressions + spent_clicks,
+            daily.day,
+        )
+        .where(daily.advertiser_id == bindparam("advertiser_id"))
+        .group_by(daily.day)
+        .order_by(daily.day)
+    )
+
+
+def _build_campaign_stat_daily_query() -> Select[Any]:
+    daily = campaign_daily_stats_table.c
+    conversion = case(
+        (daily.impressions > 0, (daily.clicks / daily.impressions) * 100),
+        else_=0.0,
+    )
+    return (
+        select(
+            daily.impressions,
+            daily.clicks,
+            conversion,
+            daily.spent_impressions,
+            daily.spent_clicks,
+            daily.spent_impressions + daily.spent_clicks,
+            daily.day,
+            daily.campaign_id,
+        )
+        .where(daily.advertiser_id == bindparam("advertiser_id"))
+        .order_by(daily.day, daily.campaign_id)
+        # rows are fetched from a server-side cursor this many at a time
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
+
+
+def _build_campaign_stats_queries() -> dict[tuple[CampaignStatSort, SortOrder], Select[Any]]:
+    counters = campaign_counters_table.c
+    impressions_count = func.coalesce(counters.impressions_count, 0)
+    clicks_count = func.coalesce(counters.clicks_count, 0)
+    spent_impressions = func.coalesce(counters.spent_impressions, 0.0)
+    spent_clicks = func.coalesce(counters.spent_clicks, 0.0)
+    columns = {
+        CampaignStatSort.IMPRESSIONS_COUNT: impressions_count,
+        CampaignStatSort.CLICKS_COUNT: clicks_count,
+        CampaignStatSort.CONVERSION: func.coalesce((clicks_count / func.nullif(impressions_count, 0)) * 100, 0.0),
+        CampaignStatSort.SPENT_IMPRESSIONS: spent_impressions,
+        CampaignStatSort.SPENT_CLICKS: spent_clicks,
+        CampaignStatSort.SPENT_TOTAL: spent_impressions + spent_clicks,
+    }
+    labeled = {sort: column.label(sort.value) for sort, column in columns.items()}
+
+    base = (
+        select(*labeled.values(), campaign_table.c.campaign_id)
+        .select_from(campaign_table)
+        .outerjoin(campaign_counters_table, counters.campaign_id == campaign_table.c.campaign_id)
+        .where(
+            campaign_table.c.advertiser_id == bindparam("advertiser_id"),
+            ~campaign_table.c.is_deleted,
+        )
+        # NULL limit and offset mean no limit and no offset
+        .limit(bindparam("limit", type_=Integer))
+        .offset(bindparam("offset", type_=Integer))
+    )
+    return {
+        (sort, order): base.order_by(
+            column.desc() if order == SortOrder.DESC else column.asc(),
+            campaign_table.c.campaign_id,
+        )
+        for sort, column in labeled.items()
+        for order in SortOrder
+    }
+
+
+STAT_QUERY = _build_stat_query()
+STAT_DAILY_QUERY = _build_stat_daily_query()
+CAMPAIGN_STAT_DAILY_QUERY = _build_campaign_stat_daily_query()
+CAMPAIGN_STATS_QUERIES = _build_campaign_stats_queries()
+EXISTING_IDS_QUERY = select(advertiser_table.c.advertiser_id).where(
+    advertiser_table.c.advertiser_id == any_(bindparam("ids", type_=ARRAY(SA_UUID(as_uuid=True)))),
+)
+
+UPSERT_COLUMNS = [each.name for each in advertiser_table.columns]
+
+
+def _on_conflict(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=["advertiser_id"],
+        set_={
+            "name": stmt.excluded.name,
+        },
+    )
 
 
 @dataclass(slots=True, frozen=True)
 class AdvertiserAlchemyGateway(AdvertiserGateway):
     session: AsyncSession
 
-    async def upsert(self, data: Iterable[Advertiser]) -> Sequence[Advertiser]:
-        values = [
-            {
-                "advertiser_id": each.advertiser_id,
-                "name": each.name,
-            }
-            for each in data
-        ]
-
-        stmt = pg_insert(Advertiser).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["advertiser_id"],
-            set_={
-                "name": stmt.excluded.name,
-            },
-        ).returning(Advertiser)  # type: ignore
-
-        result = (await self.session.execute(stmt)).scalars().all()
-        return result
+    async def upsert(self, data: Sequence[Advertiser], *, returning: bool = True) -> Sequence[Advertiser]:
+        stored: list[Advertiser] = []
+        inserted = 0
+        async for stmt in self._upsert_statements(data):
+            rows, count = await execute_upsert(self.session, stmt, Advertiser if returning else None)
+            stored.extend(rows)
+            inserted += count
+
+        await increment_service_counters(self.session, advertisers_count=inserted)
+        return stored if returning else data
+
+    async def _upsert_statements(self, data: Sequence[Advertiser]) -> AsyncIterator[Insert]:
+        if len(data) >= COPY_THRESHOLD:
+            records = [(each.advertiser_id, each.name) for each in data]
+            staging = await copy_to_staging(self.session, advertiser_table, records)
+            yield _on_conflict(pg_insert(Advertiser).from_select(UPSERT_COLUMNS, select(staging)))
+            return
+
+        for start in range(0, len(data), UPSERT_CHUNK_SIZE):
+            values = [
+                {
+                    "advertiser_id": each.advertiser_id,
+                    "name": each.name,
+                }
+                for each in data[start : start + UPSERT_CHUNK_SIZE]
+            ]
+            yield _on_conflict(pg_insert(Advertiser).values(values))
 
     async def get_by_id(self, unique_id: UUID) -> Advertiser | None:
         q = select(Advertiser).filter_by(advertiser_id=unique_id)
         res = (await self.session.execute(q)).scalar_one_or_none()
         return res
 
-    async def get_stat(self, advertiser_id: UUID) -> CampaignStat | None:
-        impressions = (
-            select(
-                func.count().label("impressions_count"),
-                func.coalesce(func.sum(impression_table.c.cost_per_impression), 0.0).label("spent_impressions"),
-            )
-            .join(Campaign, impression_table.c.ad_id == campaign_table.c.campaign_id)
-            .where(campaign_table.c.advertiser_id == advertiser_id)
-            .select_from(impression_table)
-        ).cte()
-
-        clicks = (
-            select(
-                func.count().label("clicks_count"),
-                func.coalesce(func.sum(click_table.c.cost_per_click), 0.0).label("spent_clicks"),
-            )
-            .join(Campaign, click_table.c.ad_id == campaign_table.c.campaign_id)
-            .where(campaign_table.c.advertiser_id == advertiser_id)
-            .select_from(click_table)
-        ).cte()
-
-        impression_count = impressions.c.impressions_count
-        click_count = clicks.c.clicks_count
-
-        conversion = func.coalesce(
-            (click_count / func.nullif(impression_count, 0)) * 100,
-            0.0,
-        )
-        spent_impressions = impressions.c.spent_impressions
-        spent_clicks = clicks.c.spent_clicks
-        spent_total = spent_impressions + spent_clicks
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        if not ids:
+            return set()
 
-        q = select(
-            impression_count,
-            click_count,
-            conversion,
-            spent_impressions,
-            spent_clicks,
-            spent_total,
-        )
-        result = await self.session.execute(q)
+        result = await self.session.execute(EXISTING_IDS_QUERY, {"ids": list(ids)})
+        return set(result.scalars().all())
+
+    async def get_stat(self, advertiser_id: UUID) -> CampaignStat | None:
+        result = await self.session.execute(STAT_QUERY, {"advertiser_id": advertiser_id})
         row = result.first()
 
         if row is None:
@@ -91,56 +222,33 @@ class AdvertiserAlchemyGateway(AdvertiserGateway):
         return retort_campaign_stat_from_list.load(row, CampaignStat)
 
     async def get_stat_daily(self, advertiser_id: UUID) -> Sequence[CampaignStatDaily]:
-        impressions = (
-            select(
-                impression_table.c.day.label("day"),
-                func.sum(impression_table.c.cost_per_impression).label("spent_impressions"),
-                func.count().label("impressions_count"),
-            )
-            .join(campaign_table, impression_table.c.ad_id == campaign_table.c.campaign_id)
-            .where(campaign_table.c.advertiser_id == advertiser_id)
-            .group_by(impression_table.c.day)
-            .select_from(impression_table)
-        ).cte()
-
-        clicks = (
-            select(
-                click_table.c.day.label("day"),
-                func.sum(click_table.c.cost_per_click).label("spent_clicks"),
-                func.count().label("clicks_count"),
-            )
-            .join(campaign_table, click_table.c.ad_id == campaign_table.c.campaign_id)
-            .where(campaign_table.c.advertiser_id == advertiser_id)
-            .group_by(click_table.c.day)
-            .select_from(click_table)
-        ).cte()
-
-        impressions_count = func.coalesce(impressions.c.impressions_count, 0)
-        clicks_count = func.coalesce(clicks.c.clicks_count, 0)
-        spent_impressions = func.coalesce(impressions.c.spent_impressions, 0.0)
-        spent_clicks = func.coalesce(clicks.c.spent_clicks, 0.0)
-        conversion = case(
-            (impressions_count > 0, (clicks_count / impressions_count) * 100),
-            else_=0.0,
-        )
-        spent_total = spent_impressions + spent_clicks
-        current_day = func.coalesce(clicks.c.day, impressions.c.day)
-        q = (
-            select(
-                impressions_count,
-                clicks_count,
-                conversion,
-                spent_impressions,
-                spent_clicks,
-                spent_total,
-                current_day,
-            )
-            .select_from(impressions)
-            .join(clicks, impressions.c.day == clicks.c.day, full=True)
-            .order_by(current_day)
-        )
-        result = await self.session.execute(q)
+        result = await self.session.execute(STAT_DAILY_QUERY, {"advertiser_id": advertiser_id})
         rows = result.all()
 
         res: Sequence[CampaignStatDaily] = retort_campaign_stat_from_list.load(rows, Sequence[CampaignStatDaily])
         return res
+
+    async def stream_campaign_stat_daily(self, advertiser_id: UUID) -> AsyncIterator[Sequence[CampaignStatDailyRow]]:
+        result = await self.session.stream(CAMPAIGN_STAT_DAILY_QUERY, {"advertiser_id": advertiser_id})
+        async for rows in result.partitions():
+            yield retort_campaign_stat_from_list.load(rows, Sequence[CampaignStatDailyRow])
+
+    async def list_campaign_stats(
+        self,
+        advertiser_id: UUID,
+        sort: CampaignStatSort,
+        order: SortOrder,
+        limit: int | None,
+        offset: int | None,
+    ) -> Sequence[AdvertiserCampaignStat]:
+        result = await self.session.execute(
+            CAMPAIGN_STATS_QUERIES[sort, order],
+            {"advertiser_id": advertiser_id, "limit": limit, "offset": offset},
+        )
+        rows = result.all()
+
+        res: Sequence[AdvertiserCampaignStat] = retort_campaign_stat_from_list.load(
+            rows,
+            Sequence[AdvertiserCampaignStat],
+        )
+        return res
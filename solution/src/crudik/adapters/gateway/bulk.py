@@ -0,0 +1,53 @@
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import Table, column, func, select, table, text
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import TableClause
+
+from crudik.adapters.gateway.counter import INSERTED
+
+# rows of one multi-row upsert, far below the 32767 parameters asyncpg allows per statement for every table here
+UPSERT_CHUNK_SIZE = 1000
+# from this many rows on the rows are copied into a temporary table and upserted from it by one statement
+COPY_THRESHOLD = 10_000
+
+EntityT = TypeVar("EntityT")
+
+
+async def copy_to_staging(session: AsyncSession, target: Table, records: Sequence[tuple[Any, ...]]) -> TableClause:
+    """Copy ``records``, ordered as the columns of ``target``, into a temporary table shaped like it.
+
+    The table is dropped at the end of the transaction, so the statement that
+    reads it must run in the same one.
+    """
+    name = f"{target.name}_staging"
+    columns = [each.name for each in target.columns]
+
+    await session.execute(text(f"DROP TABLE IF EXISTS pg_temp.{name}"))
+    await session.execute(text(f"CREATE TEMPORARY TABLE {name} (LIKE {target.name}) ON COMMIT DROP"))
+
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(name, records=records, columns=columns)  # type: ignore[union-attr]
+
+    return table(name, *(column(each) for each in columns))
+
+
+async def execute_upsert(
+    session: AsyncSession,
+    stmt: Insert,
+    entity: type[EntityT] | None,
+) -> tuple[Sequence[EntityT], int]:
+    """Rows stored by ``stmt`` loaded as ``entity`` and how many of them were inserted.
+
+    Without ``entity`` nothing is loaded, the statement returns one count instead of a row per upserted row.
+    """
+    if entity is None:
+        upserted = stmt.returning(INSERTED.label("inserted")).cte("upserted")
+        count = select(func.count()).select_from(upserted).where(upserted.c.inserted)
+        return [], (await session.execute(count)).scalar_one()
+
+    rows = (await session.execute(stmt.returning(entity, INSERTED))).tuples().all()
+    return [each for each, _ in rows], sum(inserted for _, inserted in rows)
@@ -1,16 +1,77 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Select, bindparam, case, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from crudik.adapters.db.models.ad import campaign_table, click_table, impression_table
+from crudik.adapters.db.models.ad import campaign_counters_table, campaign_daily_stats_table, campaign_table
 from crudik.application.common.gateway.campaign import CampaignGateway
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily, retort_campaign_stat_from_list
+from crudik.application.data_model.campaign import (
+    CampaignCursor,
+    CampaignStat,
+    CampaignStatDaily,
+    retort_campaign_stat_from_list,
+)
 from crudik.domain.entity.campaign import Campaign
-from crudik.domain.entity.click import Click
-from crudik.domain.entity.impression import Impression
+
+
+def _build_stat_query() -> Select[Any]:
+    impression_count = func.coalesce(campaign_counters_table.c.impressions_count, 0)
+    click_count = func.coalesce(campaign_counters_table.c.clicks_count, 0)
+    conversion = func.coalesce(
+        (click_count / func.nullif(impression_count, 0)) * 100,
+        0.0,
+    )
+    spent_impressions = func.coalesce(campaign_counters_table.c.spent_impressions, 0.0)
+    spent_clicks = func.coalesce(campaign_counters_table.c.spent_clicks, 0.0)
+    spent_total = spent_impressions + spent_clicks
+
+    return (
+        select(
+            impression_count,
+            click_count,
+            conversion,
+            spent_impressions,
+            spent_clicks,
+            spent_total,
+        )
+        .select_from(campaign_table)
+        .outerjoin(
+            campaign_counters_table,
+            campaign_counters_table.c.campaign_id == campaign_table.c.campaign_id,
+        )
+        .where(
+            campaign_table.c.campaign_id == bindparam("campaign_id"),
+        )
+    )
+
+
+def _build_stat_daily_query() -> Select[Any]:
+    daily = campaign_daily_stats_table.c
+    conversion = case(
+        (daily.impressions > 0, (daily.clicks / daily.impressions) * 100),
+        else_=0.0,
+    )
+    return (
+        select(
+            daily.impressions,
+            daily.clicks,
+            conversion,
+            daily.spent_impressions,
+            daily.spent_clicks,
+            daily.spent_impressions + daily.spent_clicks,
+            daily.day,
+        )
+        .where(daily.campaign_id == bindparam("campaign_id"))
+        .order_by(daily.day)
+    )
+
+
+# built once per process, every execution is a compiled cache hit with the same SQL text
+STAT_QUERY = _build_stat_query()
+STAT_DAILY_QUERY = _build_stat_daily_query()
 
 
 @dataclass(slots=True, frozen=True)
@@ -55,44 +116,30 @@ class CampaignAlchemyGateway(CampaignGateway):
         response = await self.session.execute(q)
         return response.scalars().all()
 
-    async def get_stat(self, unique_id: UUID) -> CampaignStat | None:
-        impressions = (
-            select(Impression)
-            .where(impression_table.c.ad_id == campaign_table.c.campaign_id)
-            .correlate(campaign_table)
-            .subquery()
-        )
-        clicks = (
-            select(Click)
-            .where(click_table.c.ad_id == campaign_table.c.campaign_id)
-            .correlate(campaign_table)
-            .subquery()
-        )
-        impression_count = select(func.count()).select_from(impressions).scalar_subquery()
-        click_count = select(func.count()).select_from(clicks).scalar_subquery()
-        conversion = func.coalesce(
-            (click_count / func.nullif(impression_count, 0)) * 100,
-            0.0,
-        )
-        spent_impressions = func.coalesce(select(func.sum(impressions.c.cost_per_impression)).scalar_subquery(), 0.0)
-        spent_clicks = func.coalesce(select(func.sum(clicks.c.cost_per_click)).scalar_subquery(), 0.0)
-        spent_total = spent_impressions + spent_clicks
-
+    async def list_after(
+        self,
+        advertiser_id: UUID,
+        limit: int | None,
+        after: CampaignCursor,
+    ) -> Sequence[Campaign]:
+        # a row comparison the (advertiser_id, ad_title, campaign_id) index can seek to
         q = (
-            select(
-                impression_count,
-                click_count,
-                conversion,
-                spent_impressions,
-                spent_clicks,
-                spent_total,
-            )
-            .select_from(campaign_table)
+            select(Campaign)
+            .filter_by(advertiser_id=advertiser_id, is_deleted=False)
             .where(
-                campaign_table.c.campaign_id == unique_id,
+                tuple_(campaign_table.c.ad_title, campaign_table.c.campaign_id) > (after.ad_title, after.campaign_id),
             )
+            .order_by(campaign_table.c.ad_title, campaign_table.c.campaign_id)
         )
-        result = await self.session.execute(q)
+
+        if limit is not None:
+            q = q.limit(limit)
+
+        response = await self.session.execute(q)
+        return response.scalars().all()
+
+    async def get_stat(self, unique_id: UUID) -> CampaignStat | None:
+        result = await self.session.execute(STAT_QUERY, {"campaign_id": unique_id})
         row = result.first()
 
         if row is None:
@@ -101,51 +148,7 @@ class CampaignAlchemyGateway(CampaignGateway):
         return retort_campaign_stat_from_list.load(row, CampaignStat)
 
     async def get_stat_daily(self, unique_id: UUID) -> Sequence[CampaignStatDaily]:
-        impressions = (
-            select(
-                impression_table.c.day.label("day"),
-                func.sum(impression_table.c.cost_per_impression).label("spent_impressions"),
-                func.count().label("impressions_count"),
-            )
-            .where(impression_table.c.ad_id == unique_id)
-            .group_by(impression_table.c.day)
-        ).cte()
-
-        clicks = (
-            select(
-                click_table.c.day.label("day"),
-                func.sum(click_table.c.cost_per_click).label("spent_clicks"),
-                func.count().label("clicks_count"),
-            )
-            .where(click_table.c.ad_id == unique_id)
-            .group_by(click_table.c.day)
-        ).cte()
-
-        impressions_count = func.coalesce(impressions.c.impressions_count, 0)
-        clicks_count = func.coalesce(clicks.c.clicks_count, 0)
-        spent_impressions = func.coalesce(impressions.c.spent_impressions, 0.0)
-        spent_clicks = func.coalesce(clicks.c.spent_clicks, 0.0)
-        conversion = case(
-            (impressions_count > 0, (clicks_count / impressions_count) * 100),
-            else_=0.0,
-        )
-        spent_total = spent_impressions + spent_clicks
-        current_day = func.coalesce(clicks.c.day, impressions.c.day)
-        q = (
-            select(
-                impressions_count,
-                clicks_count,
-                conversion,
-                spent_impressions,
-                spent_clicks,
-                spent_total,
-                current_day,
-            )
-            .select_from(impressions)
-            .join(clicks, impressions.c.day == clicks.c.day, full=True)
-            .order_by(current_day)
-        )
-        result = await self.session.execute(q)
+        result = await self.session.execute(STAT_DAILY_QUERY, {"campaign_id": unique_id})
         rows = result.all()
 
         res: Sequence[CampaignStatDaily] = retort_campaign_stat_from_list.load(rows, Sequence[CampaignStatDaily])
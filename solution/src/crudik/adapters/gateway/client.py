@@ -1,46 +1,112 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import AsyncIterator, Collection, Sequence
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, Insert
+from sqlalchemy.dialects.postgresql import UUID as SA_UUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from crudik.adapters.client_cache import TieredClientCache
+from crudik.adapters.db.models.ad import client_table
+from crudik.adapters.gateway.bulk import COPY_THRESHOLD, UPSERT_CHUNK_SIZE, copy_to_staging, execute_upsert
+from crudik.adapters.gateway.counter import increment_service_counters
 from crudik.application.common.gateway.client import ClientGateway
 from crudik.domain.entity.client import Client
 
+EXISTING_IDS_QUERY = select(client_table.c.client_id).where(
+    client_table.c.client_id == any_(bindparam("ids", type_=ARRAY(SA_UUID(as_uuid=True)))),
+)
+
+UPSERT_COLUMNS = [each.name for each in client_table.columns]
+
+
+def _on_conflict(stmt: Insert) -> Insert:
+    return stmt.on_conflict_do_update(
+        index_elements=["client_id"],
+        set_={
+            "login": stmt.excluded.login,
+            "age": stmt.excluded.age,
+            "location": stmt.excluded.location,
+            "gender": stmt.excluded.gender,
+        },
+    )
+
 
 @dataclass(slots=True, frozen=True)
 class ClientAlchemyGateway(ClientGateway):
     session: AsyncSession
 
-    async def upsert(self, data: Iterable[Client]) -> Sequence[Client]:
-        values = [
-            {
-                "client_id": client.client_id,
-                "login": client.login,
-                "age": client.age,
-                "location": client.location,
-                "gender": client.gender,
-            }
-            for client in data
-        ]
-
-        stmt = pg_insert(Client).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["client_id"],
-            set_={
-                "login": stmt.excluded.login,
-                "age": stmt.excluded.age,
-                "location": stmt.excluded.location,
-                "gender": stmt.excluded.gender,
-            },
-        ).returning(Client)  # type: ignore
-
-        result = (await self.session.execute(stmt)).scalars().all()
-        return result
+    async def upsert(self, data: Sequence[Client], *, returning: bool = True) -> Sequence[Client]:
+        stored: list[Client] = []
+        inserted = 0
+        async for stmt in self._upsert_statements(data):
+            rows, count = await execute_upsert(self.session, stmt, Client if returning else None)
+            stored.extend(rows)
+            inserted += count
+
+        await increment_service_counters(self.session, clients_count=inserted)
+        return stored if returning else data
+
+    async def _upsert_statements(self, data: Sequence[Client]) -> AsyncIterator[Insert]:
+        if len(data) >= COPY_THRESHOLD:
+            records = [(each.client_id, each.login, each.age, each.location, each.gender.name) for each in data]
+            staging = await copy_to_staging(self.session, client_table, records)
+            yield _on_conflict(pg_insert(Client).from_select(UPSERT_COLUMNS, select(staging)))
+            return
+
+        for start in range(0, len(data), UPSERT_CHUNK_SIZE):
+            values = [
+                {
+                    "client_id": client.client_id,
+                    "login": client.login,
+                    "age": client.age,
+                    "location": client.location,
+                    "gender": client.gender,
+                }
+                for client in data[start : start + UPSERT_CHUNK_SIZE]
+            ]
+            yield _on_conflict(pg_insert(Client).values(values))
 
     async def get_by_id(self, unique_id: UUID) -> Client | None:
         q = select(Client).filter_by(client_id=unique_id)
         res = (await self.session.execute(q)).scalar_one_or_none()
         return res
+
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        if not ids:
+            return set()
+
+        result = await self.session.execute(EXISTING_IDS_QUERY, {"ids": list(ids)})
+        return set(result.scalars().all())
+
+
+@dataclass(slots=True, frozen=True)
+class CachedClientGateway(ClientGateway):
+    """Read-through cache over the database gateway.
+
+    Upserts are not cached here, they are not committed yet: the use case puts
+    them into the cache after the commit.
+    """
+
+    gateway: ClientAlchemyGateway
+    cache: TieredClientCache
+
+    async def upsert(self, data: Sequence[Client], *, returning: bool = True) -> Sequence[Client]:
+        return await self.gateway.upsert(data, returning=returning)
+
+    async def get_by_id(self, unique_id: UUID) -> Client | None:
+        client = await self.cache.get(unique_id)
+        if client is not None:
+            return client
+
+        client = await self.gateway.get_by_id(unique_id)
+        if client is not None:
+            await self.cache.add(client)
+
+        return client
+
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        return await self.gateway.get_existing_ids(ids)
@@ -0,0 +1,261 @@
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, TypeVar
+from uuid import UUID
+
+from sqlalchemy import CTE, Boolean, delete, func, literal_column, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crudik.adapters.db.models.ad import (
+    campaign_counters_table,
+    campaign_daily_stats_table,
+    campaign_table,
+    click_table,
+    impression_table,
+    service_counters_table,
+)
+from crudik.application.common.gateway.counter import CounterGateway
+from crudik.domain.entity.campaign import Campaign
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.impression import Impression
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+SERVICE_COUNTER_SHARDS = 16
+# true in RETURNING of an upsert for the rows it inserted, an updated row has the updating transaction in xmax
+INSERTED = literal_column("xmax = 0", Boolean)
+
+
+def _sum_by(events: Iterable[tuple[KeyT, float]]) -> dict[KeyT, tuple[int, Decimal]]:
+    totals: defaultdict[KeyT, tuple[int, Decimal]] = defaultdict(lambda: (0, Decimal(0)))
+    for key, cost in events:
+        count, spent = totals[key]
+        totals[key] = (count + 1, spent + Decimal(str(cost)))
+    return totals
+
+
+async def increment_service_counters(session: AsyncSession, **deltas: int | Decimal) -> None:
+    """Add ``deltas`` to the service-wide totals of ``service_counters``."""
+    if not any(deltas.values()):
+        return
+
+    # a connection always takes the same row, so one transaction never locks two of them
+    stmt = pg_insert(service_counters_table).values(
+        shard=func.pg_backend_pid() % SERVICE_COUNTER_SHARDS,
+        **deltas,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["shard"],
+        set_={name: service_counters_table.c[name] + stmt.excluded[name] for name in deltas},
+    )
+    await session.execute(stmt)
+
+
+def counting_ctes(events: CTE, count_field: str, daily_count_field: str, spent_field: str) -> list[CTE]:
+    """Upserts adding ``events`` to every counter, to run as CTEs of the statement that inserts the events.
+
+    ``events`` must have ``ad_id``, ``day`` and ``cost`` columns, usually it is
+    the RETURNING of that insert, so events it skipped are not counted.
+    """
+    per_campaign = select(events.c.ad_id, func.count(), func.sum(events.c.cost)).group_by(events.c.ad_id)
+    counters = pg_insert(campaign_counters_table).from_select(["campaign_id", count_field, spent_field], per_campaign)
+    counters = counters.on_conflict_do_update(
+        index_elements=["campaign_id"],
+        set_={
+            count_field: campaign_counters_table.c[count_field] + counters.excluded[count_field],
+            spent_field: campaign_counters_table.c[spent_field] + counters.excluded[spent_field],
+        },
+    )
+
+    per_day = (
+        select(events.c.ad_id, events.c.day, campaign_table.c.advertiser_id, func.count(), func.sum(events.c.cost))
+        .join(campaign_table, campaign_table.c.campaign_id == events.c.ad_id)
+        .group_by(events.c.ad_id, events.c.day, campaign_table.c.advertiser_id)
+    )
+    daily = pg_insert(campaign_daily_stats_table).from_select(
+        ["campaign_id", "day", "advertiser_id", daily_count_field, spent_field],
+        per_day,
+    )
+    daily = daily.on_conflict_do_update(
+        index_elements=["campaign_id", "day"],
+        set_={
+            daily_count_field: campaign_daily_stats_table.c[daily_count_field] + daily.excluded[daily_count_field],
+            spent_field: campaign_daily_stats_table.c[spent_field] + daily.excluded[spent_field],
+        },
+    )
+
+    total = select(
+        func.pg_backend_pid() % SERVICE_COUNTER_SHARDS,
+        func.count(),
+        func.sum(events.c.cost),
+    ).having(func.count() > 0)
+    service = pg_insert(service_counters_table).from_select(["shard", count_field, spent_field], total)
+    service = service.on_conflict_do_update(
+        index_elements=["shard"],
+        set_={
+            count_field: service_counters_table.c[count_field] + service.excluded[count_field],
+            spent_field: service_counters_table.c[spent_field] + service.excluded[spent_field],
+        },
+    )
+
+    return [
+        counters.cte(f"{count_field}_counters"),
+        daily.cte(f"{count_field}_daily"),
+        service.cte(f"{count_field}_service"),
+    ]
+
+
+@dataclass(slots=True, frozen=True)
+class CounterAlchemyGateway(CounterGateway):
+    session: AsyncSession
+
+    async def count_impressions(self, impressions: Sequence[Impression]) -> None:
+        await self._increment(
+            _sum_by((each.ad_id, each.cost_per_impression) for each in impressions),
+            "impressions_count",
+            "spent_impressions",
+        )
+        await self._increment_daily(
+            _sum_by(((each.ad_id, each.day), each.cost_per_impression) for each in impressions),
+            "impressions",
+            "spent_impressions",
+        )
+
+    async def count_clicks(self, clicks: Sequence[Click]) -> None:
+        await self._increment(
+            _sum_by((each.ad_id, each.cost_per_click) for each in clicks),
+            "clicks_count",
+            "spent_clicks",
+        )
+        await self._increment_daily(
+            _sum_by(((each.ad_id, each.day), each.cost_per_click) for each in clicks),
+            "clicks",
+            "spent_clicks",
+        )
+
+    async def count_campaigns(self, campaigns: Sequence[Campaign]) -> None:
+        await increment_service_counters(self.session, campaigns_count=len(campaigns))
+
+    async def _increment(self, totals: dict[UUID, tuple[int, Decimal]], count_field: str, spent_field: str) -> None:
+        if not totals:
+            return
+
+        values: list[dict[str, Any]] = [
+            {
+                "campaign_id": ad_id,
+                count_field: count,
+                spent_field: spent,
+            }
+            # stable order, so concurrent batches lock counter rows in the same order
+            for ad_id, (count, spent) in sorted(totals.items())
+        ]
+        stmt = pg_insert(campaign_counters_table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["campaign_id"],
+            set_={
+                count_field: campaign_counters_table.c[count_field] + stmt.excluded[count_field],
+                spent_field: campaign_counters_table.c[spent_field] + stmt.excluded[spent_field],
+            },
+        )
+        await self.session.execute(stmt)
+        deltas: dict[str, int | Decimal] = {
+            count_field: sum(count for count, _ in totals.values()),
+            spent_field: sum((spent for _, spent in totals.values()), Decimal(0)),
+        }
+        await increment_service_counters(self.session, **deltas)
+
+    async def _increment_daily(
+        self,
+        totals: dict[tuple[UUID, int], tuple[int, Decimal]],
+        count_field: str,
+        spent_field: str,
+    ) -> None:
+        if not totals:
+            return
+
+        values: list[dict[str, Any]] = [
+            {
+                "campaign_id": ad_id,
+                "day": day,
+                "advertiser_id": (
+                    select(campaign_table.c.advertiser_id)
+                    .where(campaign_table.c.campaign_id == ad_id)
+                    .scalar_subquery()
+                ),
+                count_field: count,
+                spent_field: spent,
+            }
+            for (ad_id, day), (count, spent) in sorted(totals.items())
+        ]
+        stmt = pg_insert(campaign_daily_stats_table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["campaign_id", "day"],
+            set_={
+                count_field: campaign_daily_stats_table.c[count_field] + stmt.excluded[count_field],
+                spent_field: campaign_daily_stats_table.c[spent_field] + stmt.excluded[spent_field],
+            },
+        )
+        await self.session.execute(stmt)
+
+
+async def rebuild_daily_stats(session: AsyncSession) -> None:
+    """Rebuild ``campaign_daily_stats`` from the raw impression and click history."""
+    # blocks the write path until commit, events committed later are counted by it as usual
+    await session.execute(text(f"LOCK TABLE {campaign_daily_stats_table.name} IN EXCLUSIVE MODE"))
+    await session.execute(delete(campaign_daily_stats_table))
+
+    impressions = (
+        select(
+            impression_table.c.ad_id.label("ad_id"),
+            impression_table.c.day.label("day"),
+            func.count().label("count"),
+            func.sum(impression_table.c.cost_per_impression).label("spent"),
+        )
+        .group_by(impression_table.c.ad_id, impression_table.c.day)
+        .cte()
+    )
+    clicks = (
+        select(
+            click_table.c.ad_id.label("ad_id"),
+            click_table.c.day.label("day"),
+            func.count().label("count"),
+            func.sum(click_table.c.cost_per_click).label("spent"),
+        )
+        .group_by(click_table.c.ad_id, click_table.c.day)
+        .cte()
+    )
+    ad_id = func.coalesce(impressions.c.ad_id, clicks.c.ad_id)
+    history = (
+        select(
+            ad_id,
+            func.coalesce(impressions.c.day, clicks.c.day),
+            campaign_table.c.advertiser_id,
+            func.coalesce(impressions.c.count, 0),
+            func.coalesce(clicks.c.count, 0),
+            func.coalesce(impressions.c.spent, 0),
+            func.coalesce(clicks.c.spent, 0),
+        )
+        .select_from(impressions)
+        .join(
+            clicks,
+            (impressions.c.ad_id == clicks.c.ad_id) & (impressions.c.day == clicks.c.day),
+            full=True,
+        )
+        .join(campaign_table, campaign_table.c.campaign_id == ad_id)
+    )
+    stmt = pg_insert(campaign_daily_stats_table).from_select(
+        [
+            "campaign_id",
+            "day",
+            "advertiser_id",
+            "impressions",
+            "clicks",
+            "spent_impressions",
+            "spent_clicks",
+        ],
+        history,
+    )
+    await session.execute(stmt)
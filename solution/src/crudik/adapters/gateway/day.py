@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from crudik.adapters.day_cache import CurrentDayCache
 from crudik.adapters.redis import RedisStorage
 from crudik.application.common.gateway.current_day import DayGateway
 
@@ -20,3 +21,23 @@ class DayRedisGateway(DayGateway):
             res = 0
 
         return int(res)
+
+
+@dataclass(slots=True, frozen=True)
+class CachedDayGateway(DayGateway):
+    gateway: DayRedisGateway
+    cache: CurrentDayCache
+
+    async def set_current_day(self, day: int) -> None:
+        await self.gateway.set_current_day(day)
+        await self.cache.publish(day)
+
+    async def read_current_day(self) -> int:
+        day = self.cache.get()
+        if day is not None:
+            return day
+
+        version = self.cache.version
+        day = await self.gateway.read_current_day()
+        self.cache.put(day, version)
+        return day
@@ -1,68 +1,48 @@
 from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from crudik.adapters.db.models.ad import advertiser_table, campaign_table, click_table, client_table, impression_table
+from crudik.adapters.db.models.ad import service_counters_table
 from crudik.application.common.gateway.metrics import MetricsGateway
 from crudik.application.data_model.metrics import ServiceMetrics
 
 
-@dataclass(slots=True, frozen=True)
-class MetricsAlchemyGateway(MetricsGateway):
-    session: AsyncSession
+def _build_metrics_query() -> Select[Any]:
+    # a fixed number of shard rows, however many events and entities are stored
+    counters = service_counters_table.c
+    impressions_count = func.coalesce(func.sum(counters.impressions_count), 0)
+    clicks_count = func.coalesce(func.sum(counters.clicks_count), 0)
+    income_impressions = func.coalesce(func.sum(counters.spent_impressions), 0.0)
+    income_clicks = func.coalesce(func.sum(counters.spent_clicks), 0.0)
+    conversion = func.coalesce(
+        (clicks_count / func.nullif(impressions_count, 0)) * 100,
+        0.0,
+    )
 
-    async def get_metrics(self) -> ServiceMetrics:
-        impressions = (
-            select(
-                func.count().label("impressions_count"),
-                func.coalesce(func.sum(impression_table.c.cost_per_impression), 0.0).label("income_impressions"),
-            )
-        ).cte()
-
-        clicks = (
-            select(
-                func.count().label("clicks_count"),
-                func.coalesce(func.sum(click_table.c.cost_per_click), 0.0).label("income_clicks"),
-            )
-        ).cte()
+    return select(
+        impressions_count,
+        clicks_count,
+        func.coalesce(func.sum(counters.advertisers_count), 0),
+        func.coalesce(func.sum(counters.clients_count), 0),
+        func.coalesce(func.sum(counters.campaigns_count), 0),
+        conversion,
+        income_impressions,
+        income_clicks,
+        income_impressions + income_clicks,
+    )
 
-        advertisers = (
-            select(
-                func.count().label("advertisers_count"),
-            ).select_from(advertiser_table)
-        ).cte()
 
-        clients = (
-            select(
-                func.count().label("clients_count"),
-            ).select_from(client_table)
-        ).cte()
+METRICS_QUERY = _build_metrics_query()
 
-        campaigns = (
-            select(
-                func.count().label("campaigns_count"),
-            ).select_from(campaign_table)
-        ).cte()
 
-        conversion = func.coalesce(
-            (clicks.c.clicks_count / func.nullif(impressions.c.impressions_count, 0)) * 100,
-            0.0,
-        )
-        income_total = impressions.c.income_impressions + clicks.c.income_clicks
+@dataclass(slots=True, frozen=True)
+class MetricsAlchemyGateway(MetricsGateway):
+    session: AsyncSession
 
-        q = select(
-            impressions.c.impressions_count,
-            clicks.c.clicks_count,
-            advertisers.c.advertisers_count,
-            clients.c.clients_count,
-            campaigns.c.campaigns_count,
-            conversion,
-            impressions.c.income_impressions,
-            clicks.c.income_clicks,
-            income_total,
-        )
-        result = await self.session.execute(q)
+    async def get_metrics(self) -> ServiceMetrics:
+        result = await self.session.execute(METRICS_QUERY)
         row = result.one()
 
         return ServiceMetrics(
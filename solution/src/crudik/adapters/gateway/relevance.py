@@ -1,8 +1,14 @@
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from crudik.adapters.db.models.ad import relevance_table
+from crudik.adapters.gateway.bulk import UPSERT_CHUNK_SIZE
+from crudik.adapters.relevance_cache import RedisRelevanceCache
 from crudik.application.common.gateway.relevance import RelevanceGateway
 from crudik.domain.entity.relevance import Relevance
 
@@ -12,16 +18,61 @@ class RelevanceAlchemyGateway(RelevanceGateway):
     session: AsyncSession
 
     async def upsert(self, data: Relevance) -> None:
-        stmt = pg_insert(Relevance).values(
-            client_id=data.client_id,
-            advertiser_id=data.advertiser_id,
-            score=data.score,
-        )
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["client_id", "advertiser_id"],
-            set_={
-                "score": stmt.excluded.score,
-            },
+        await self.upsert_many([data])
+
+    async def upsert_many(self, data: Sequence[Relevance]) -> None:
+        # stable order, so concurrent upserts lock rows in the same order
+        ordered = sorted(data, key=lambda each: (each.client_id, each.advertiser_id))
+        for start in range(0, len(ordered), UPSERT_CHUNK_SIZE):
+            chunk = ordered[start : start + UPSERT_CHUNK_SIZE]
+            stmt = pg_insert(relevance_table).values(
+                [
+                    {
+                        "client_id": each.client_id,
+                        "advertiser_id": each.advertiser_id,
+                        "score": each.score,
+                    }
+                    for each in chunk
+                ],
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["client_id", "advertiser_id"],
+                set_={
+                    "score": stmt.excluded.score,
+                },
+            )
+            await self.session.execute(stmt)
+
+    async def get_client_scores(self, client_id: UUID) -> Mapping[UUID, int]:
+        q = select(relevance_table.c.advertiser_id, relevance_table.c.score).where(
+            relevance_table.c.client_id == client_id,
         )
+        result = await self.session.execute(q)
+        return dict(result.tuples().all())
+
+
+@dataclass(slots=True, frozen=True)
+class CachedRelevanceGateway(RelevanceGateway):
+    """Read-through cache of client scores over the database gateway.
+
+    Upserts leave the cache alone, they are not committed yet: the use case
+    drops the changed clients after the commit.
+    """
+
+    gateway: RelevanceAlchemyGateway
+    cache: RedisRelevanceCache
+
+    async def upsert(self, data: Relevance) -> None:
+        await self.upsert_many([data])
+
+    async def upsert_many(self, data: Sequence[Relevance]) -> None:
+        await self.gateway.upsert_many(data)
+
+    async def get_client_scores(self, client_id: UUID) -> Mapping[UUID, int]:
+        scores, version = await self.cache.get(client_id)
+        if scores is not None:
+            return scores
 
-        await self.session.execute(stmt)
+        scores = dict(await self.gateway.get_client_scores(client_id))
+        await self.cache.put(client_id, scores, version)
+        return scores
@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+REFRESH_LOCK_KEY = "metrics_refresh_lock"
+# how often every worker tries to take the lock, and how often its holder extends it during a refresh
+ATTEMPTS_PER_INTERVAL = 4
+
+# both scripts only touch the lock while it still holds the token of the caller
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+# keeps the lock for the rest of the interval, or deletes it when nothing is left
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    if tonumber(ARGV[2]) > 0 then
+        return redis.call("pexpire", KEYS[1], ARGV[2])
+    end
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class MetricsRefresher:
+    """Recomputes the service metrics in the background every ``interval`` seconds.
+
+    Every worker runs one, but only the worker that takes ``REFRESH_LOCK_KEY``
+    recomputes. The holder extends the lock while its refresh runs, so a slow
+    refresh never overlaps with another one. Once it is done, the lock is kept
+    until an interval has passed since the refresh started, so the fleet
+    refreshes once per interval and readers get a value at most a fraction of
+    an interval older than that. Every change of the lock checks its token
+    first, a worker never extends or deletes a lock that expired and was taken
+    by another worker.
+    """
+
+    __slots__ = ("_extend_lock", "_interval", "_redis", "_refresh", "_release_lock", "_task", "_token")
+
+    def __init__(self, redis: Redis, refresh: Callable[[], Awaitable[None]], interval: float) -> None:
+        self._redis = redis
+        self._refresh = refresh
+        self._interval = interval
+        self._token = uuid4().hex
+        self._extend_lock = redis.register_script(EXTEND_LOCK_SCRIPT)
+        self._release_lock = redis.register_script(RELEASE_LOCK_SCRIPT)
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self._redis.set(REFRESH_LOCK_KEY, self._token, nx=True, px=self._ms(self._interval)):
+                    await self._refresh_holding_lock()
+            except Exception:
+                logging.exception("Failed to refresh metrics")
+
+            await asyncio.sleep(self._interval / ATTEMPTS_PER_INTERVAL)
+
+    async def _refresh_holding_lock(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        keeper = asyncio.create_task(self._keep_lock())
+        hold = 0.0
+        try:
+            await self._refresh()
+            hold = self._interval - (loop.time() - started)
+        finally:
+            keeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await keeper
+            # a failed or cancelled refresh frees the lock at once, another worker can retry
+            await asyncio.shield(self._release(hold))
+
+    async def _keep_lock(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval / ATTEMPTS_PER_INTERVAL)
+            try:
+                extended = await self._extend_lock([REFRESH_LOCK_KEY], [self._token, self._ms(self._interval)])
+            except Exception:
+                logging.exception("Failed to extend the metrics refresh lock")
+                continue
+
+            if not extended:
+                logging.warning("Metrics refresh lock was lost")
+                return
+
+    async def _release(self, hold: float) -> None:
+        await self._release_lock([REFRESH_LOCK_KEY], [self._token, self._ms(max(hold, 0))])
+
+    @staticmethod
+    def _ms(seconds: float) -> int:
+        return int(seconds * 1000)
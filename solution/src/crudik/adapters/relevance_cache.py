@@ -0,0 +1,76 @@
+import json
+from collections.abc import Iterable, Mapping
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.application.common.relevance_cache import RelevanceCache
+
+RELEVANCE_KEY_PREFIX = "relevance:"
+RELEVANCE_VERSION_KEY_PREFIX = "relevance_version:"
+
+# fills the value only if no invalidation has bumped the version since it was read
+FILL_SCRIPT = """
+if (redis.call("get", KEYS[2]) or "") == ARGV[1] then
+    return redis.call("set", KEYS[1], ARGV[2], "EX", ARGV[3])
+end
+return 0
+"""
+# every client takes a value key and a version key
+INVALIDATE_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call("del", KEYS[i])
+    redis.call("incr", KEYS[i + 1])
+    redis.call("expire", KEYS[i + 1], ARGV[1])
+end
+return 0
+"""
+
+
+class RedisRelevanceCache(RelevanceCache):
+    """Scores of every advertiser for a client, one Redis value per client.
+
+    There is no process-local tier: committed upserts drop the value of every
+    changed client, and all workers see that at once. Each drop also bumps a
+    version of the client, a fill carries the version read with the miss and
+    is skipped once it changed, so scores read before a commit are not put
+    back after its invalidation.
+    """
+
+    __slots__ = ("_counter", "_fill", "_invalidate", "_redis", "_ttl")
+
+    def __init__(self, redis: Redis, registry: CacheRegistry, ttl: int) -> None:
+        self._redis = redis
+        self._ttl = ttl
+        self._counter = registry.counter("relevance_redis")
+        self._fill = redis.register_script(FILL_SCRIPT)
+        self._invalidate = redis.register_script(INVALIDATE_SCRIPT)
+
+    async def get(self, client_id: UUID) -> tuple[dict[UUID, int] | None, str]:
+        """Return the cached scores of the client, None on a miss, and the version to fill them with."""
+        raw, raw_version = await self._redis.mget([self._key(client_id), self._version_key(client_id)])
+        version = raw_version.decode() if raw_version is not None else ""
+        if raw is None:
+            self._counter.miss()
+            return None, version
+
+        self._counter.hit()
+        return {UUID(advertiser_id): score for advertiser_id, score in json.loads(raw).items()}, version
+
+    async def put(self, client_id: UUID, scores: Mapping[UUID, int], version: str) -> None:
+        raw = json.dumps({str(advertiser_id): score for advertiser_id, score in scores.items()})
+        await self._fill(keys=[self._key(client_id), self._version_key(client_id)], args=[version, raw, self._ttl])
+
+    async def invalidate(self, client_ids: Iterable[UUID]) -> None:
+        keys = [key for each in set(client_ids) for key in (self._key(each), self._version_key(each))]
+        if keys:
+            await self._invalidate(keys=keys, args=[self._ttl])
+
+    @staticmethod
+    def _key(client_id: UUID) -> str:
+        return f"{RELEVANCE_KEY_PREFIX}{client_id}"
+
+    @staticmethod
+    def _version_key(client_id: UUID) -> str:
+        return f"{RELEVANCE_VERSION_KEY_PREFIX}{client_id}"
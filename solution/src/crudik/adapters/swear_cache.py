@@ -0,0 +1,106 @@
+import hashlib
+import time
+from collections.abc import Collection, Iterable
+
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.lru import LRUCache
+
+SWEAR_KEY_PREFIX = "swear:"
+SWEAR_INDEX_KEY = "swear_index"
+
+
+def text_digest(text: str) -> str:
+    normalized = " ".join(text.casefold().split())
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class SwearVerdictCache:
+    """Swear check verdicts keyed by SHA-256 of the normalized text.
+
+    A process-local LRU sits in front of Redis. In Redis every verdict is a
+    separate key with a TTL, and ``SWEAR_INDEX_KEY`` keeps them ordered by
+    write time, so the oldest ones are evicted above ``max_entries``.
+    """
+
+    __slots__ = ("_local", "_local_counter", "_max_entries", "_redis", "_redis_counter", "_ttl")
+
+    def __init__(self, redis: Redis, registry: CacheRegistry, local_size: int, max_entries: int, ttl: int) -> None:
+        self._redis = redis
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._local: LRUCache[str, bool] = LRUCache(local_size)
+        self._local_counter = registry.counter("swears", lambda: len(self._local))
+        self._redis_counter = registry.counter("swears_redis")
+
+    async def get(self, text: str) -> bool | None:
+        digest = text_digest(text)
+        verdict = self._local.get(digest)
+        if verdict is not None:
+            self._local_counter.hit()
+            return verdict
+
+        self._local_counter.miss()
+        raw = await self._redis.get(f"{SWEAR_KEY_PREFIX}{digest}")
+        if raw is None:
+            self._redis_counter.miss()
+            return None
+
+        self._redis_counter.hit()
+        verdict = bool(int(raw))
+        self._local.put(digest, verdict)
+        return verdict
+
+    async def get_many(self, texts: Iterable[str]) -> dict[str, bool]:
+        """Return verdicts of the cached texts keyed by text digest."""
+        verdicts: dict[str, bool] = {}
+        remote: list[str] = []
+        for digest in {text_digest(text) for text in texts}:
+            verdict = self._local.get(digest)
+            if verdict is None:
+                self._local_counter.miss()
+                remote.append(digest)
+            else:
+                self._local_counter.hit()
+                verdicts[digest] = verdict
+
+        if not remote:
+            return verdicts
+
+        values = await self._redis.mget([f"{SWEAR_KEY_PREFIX}{digest}" for digest in remote])
+        for digest, raw in zip(remote, values, strict=True):
+            if raw is None:
+                self._redis_counter.miss()
+                continue
+
+            self._redis_counter.hit()
+            verdicts[digest] = bool(int(raw))
+            self._local.put(digest, verdicts[digest])
+
+        return verdicts
+
+    async def put(self, text: str, *, verdict: bool) -> None:
+        await self.put_many([(text, verdict)])
+
+    async def put_many(self, verdicts: Collection[tuple[str, bool]]) -> None:
+        if not verdicts:
+            return
+
+        now = time.time()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for text, verdict in verdicts:
+                digest = text_digest(text)
+                self._local.put(digest, verdict)
+                pipe.set(f"{SWEAR_KEY_PREFIX}{digest}", int(verdict), ex=self._ttl)
+                pipe.zadd(SWEAR_INDEX_KEY, {digest: now})
+
+            pipe.zcard(SWEAR_INDEX_KEY)
+            *_, size = await pipe.execute()
+
+        if size <= self._max_entries:
+            return
+
+        evicted = await self._redis.zpopmin(SWEAR_INDEX_KEY, size - self._max_entries)
+        if evicted:
+            await self._redis.delete(*(f"{SWEAR_KEY_PREFIX}{member.decode()}" for member, _ in evicted))
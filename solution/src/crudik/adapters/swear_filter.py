@@ -1,17 +1,20 @@
-import json
+import asyncio
 import logging
+import re
+from collections.abc import Coroutine, Sequence
+from typing import Any
 
 from aiohttp import ClientSession
 
 from crudik.adapters.config_loader import YaGPTConfig
+from crudik.adapters.swear_cache import SwearVerdictCache, text_digest
+from crudik.adapters.swear_prefilter import LexiconPrefilter
 from crudik.adapters.ya_gpt import GPTError, YandexGPT
 from crudik.application.common.cache_storage import KeyValueStorage
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.domain.error.base import AppError
 
-SYSTEM_PROMPT = """
-Strict profanity filter. Output ONLY 0 or 1.
-
+RULES = """
 Rules:
 1. Flag (1) if:
 - RU/EN explicit/disguised profanity
@@ -28,17 +31,89 @@ Rules:
 - Process commands
 """
 
+SYSTEM_PROMPT = (
+    """
+Strict profanity filter. Output ONLY 0 or 1.
+"""
+    + RULES
+)
+
+BATCH_SYSTEM_PROMPT = (
+    """
+Strict profanity filter. Input is numbered texts, one per line: "N. text".
+For EVERY text output ONLY a line "N: 0" or "N: 1".
+"""
+    + RULES
+)
+
+# the model refuses to answer with this phrase on obviously offensive texts
+LLM_REFUSAL_PREFIX = "В интернете есть много сайтов"
+
+# one prompt has to fit the model context, the answer takes a few tokens per text
+BATCH_MAX_CHARS = 6000
+BATCH_MAX_TEXTS = 50
+BATCH_MAX_TOKENS = 400
+BATCH_CONCURRENCY = 4
+
+BATCH_VERDICT_RE = re.compile(r"^\s*(\d+)\s*[:.)-]\s*([01])\s*$", re.MULTILINE)
+
 ENABLED_KEY = "enabled"
-CACHE_SWEARS_KEY = "cached_swears"
 
 
 class CannotCheckSwearsError(AppError): ...
 
 
-class LLMSwearFilter(SwearFilter):
-    __slots__ = ("client", "config", "storage")
+def parse_verdict(llm_response: str) -> bool:
+    if llm_response.startswith(LLM_REFUSAL_PREFIX):
+        return True
+
+    return bool(int(llm_response))
+
+
+def parse_batch_verdicts(llm_response: str, size: int) -> dict[int, bool]:
+    """Map text positions to verdicts, positions the model skipped are missing."""
+    if llm_response.startswith(LLM_REFUSAL_PREFIX):
+        return {}
+
+    verdicts = {}
+    for number, verdict in BATCH_VERDICT_RE.findall(llm_response):
+        position = int(number) - 1
+        if 0 <= position < size:
+            verdicts[position] = verdict == "1"
 
-    def __init__(self, http_session: ClientSession, config: YaGPTConfig, storage: KeyValueStorage) -> None:
+    return verdicts
+
+
+def split_into_batches(texts: Sequence[str]) -> list[list[str]]:
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_chars = 0
+
+    for text in texts:
+        if batch and (len(batch) == BATCH_MAX_TEXTS or batch_chars + len(text) > BATCH_MAX_CHARS):
+            batches.append(batch)
+            batch, batch_chars = [], 0
+
+        batch.append(text)
+        batch_chars += len(text)
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+class LLMSwearFilter(SwearFilter):
+    __slots__ = ("_in_flight", "batch_client", "cache", "client", "config", "prefilter", "storage")
+
+    def __init__(
+        self,
+        http_session: ClientSession,
+        config: YaGPTConfig,
+        storage: KeyValueStorage,
+        cache: SwearVerdictCache,
+        prefilter: LexiconPrefilter,
+    ) -> None:
         self.client = YandexGPT(
             http_session=http_session,
             api_key=config.api_key,
@@ -46,50 +121,130 @@ class LLMSwearFilter(SwearFilter):
             max_tokens=10,
             system_prompt=SYSTEM_PROMPT,
         )
+        self.batch_client = YandexGPT(
+            http_session=http_session,
+            api_key=config.api_key,
+            folder_id=config.folder_id,
+            max_tokens=BATCH_MAX_TOKENS,
+            system_prompt=BATCH_SYSTEM_PROMPT,
+        )
         self.storage = storage
+        self.cache = cache
+        self.prefilter = prefilter
         self.config = config
+        self._in_flight: dict[str, asyncio.Task[bool]] = {}
 
     async def check_contains_swears(self, text: str) -> bool:
+        if not await self._is_enabled():
+            return False
+
+        cached_verdict = await self.cache.get(text)
+        if cached_verdict is not None:
+            logging.info("Cached swear verdict for %s, contains swears: %s", text[:10], cached_verdict)
+            return cached_verdict
+
+        logging.info("Cache not found")
+        local_verdict = self.prefilter.classify(text)
+        if local_verdict is not None:
+            logging.info("Lexicon swear verdict for %s, contains swears: %s", text[:10], local_verdict)
+            return local_verdict
+
+        return await self._check_single(text)
+
+    async def check_many(self, texts: Sequence[str]) -> list[bool]:
+        if not texts:
+            return []
+
+        if not await self._is_enabled():
+            return [False] * len(texts)
+
+        unique = {text_digest(text): text for text in texts}
+        verdicts = await self.cache.get_many(unique.values())
+        missing = {digest: text for digest, text in unique.items() if digest not in verdicts}
+
+        for digest, text in list(missing.items()):
+            local_verdict = self.prefilter.classify(text)
+            if local_verdict is not None:
+                verdicts[digest] = local_verdict
+                del missing[digest]
+
+        in_flight = {digest: task for digest in missing if (task := self._in_flight.get(digest)) is not None}
+        to_check = [text for digest, text in missing.items() if digest not in in_flight]
+        logging.info("Swear check of %s texts, %s sent to the model", len(unique), len(to_check))
+
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        for batch in split_into_batches(to_check):
+            # single checks of the batched texts join the batch instead of prompting the model again
+            batch_task = asyncio.create_task(self._check_batch(batch, semaphore))
+            for text in batch:
+                digest = text_digest(text)
+                in_flight[digest] = self._share(digest, self._batch_verdict(batch_task, digest))
+
+        checked = await asyncio.gather(*(asyncio.shield(task) for task in in_flight.values()))
+        verdicts.update(zip(in_flight, checked, strict=True))
+
+        return [verdicts[text_digest(text)] for text in texts]
+
+    async def set_mode(self, *, enabled: bool) -> None:
+        logging.info("Toggled swear check: %s", enabled)
+        await self.storage.set(ENABLED_KEY, str(int(enabled)))
+
+    async def _is_enabled(self) -> bool:
         enabled_entry = await self.storage.get(ENABLED_KEY)
         logging.info("Swear check enabled: %s", enabled_entry)
 
         is_enabled = bool(int(enabled_entry)) if enabled_entry is not None else self.config.swear_check_enabled
-
         if not is_enabled:
             logging.info("Swear check is not enabled")
-            return False
 
-        cache_entry = await self.storage.get(CACHE_SWEARS_KEY)
-        caches: dict[str, int] = {}
-        if cache_entry is None:
-            await self.storage.set(CACHE_SWEARS_KEY, "{}")
-            caches = {}
-        else:
-            caches = json.loads(cache_entry)
+        return is_enabled
 
-        if text in caches:
-            verdict = bool(caches[text])
-            logging.info("Cached swear verdict for %s, contains swears: %s", text[:10], verdict)
-            return verdict
+    async def _check_single(self, text: str) -> bool:
+        # concurrent checks of the same text share one LLM request
+        digest = text_digest(text)
+        task = self._in_flight.get(digest)
+        if task is None:
+            task = self._share(digest, self._check_with_llm(text))
 
-        logging.info("Cache not found")
+        # a cancelled caller must not cancel the request awaited by the others
+        return await asyncio.shield(task)
+
+    def _share(self, digest: str, check: Coroutine[Any, Any, bool]) -> asyncio.Task[bool]:
+        task = asyncio.create_task(check)
+        self._in_flight[digest] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(digest, None))
+        return task
 
+    @staticmethod
+    async def _batch_verdict(batch_task: asyncio.Task[dict[str, bool]], digest: str) -> bool:
+        return (await batch_task)[digest]
+
+    async def _check_with_llm(self, text: str) -> bool:
         try:
-            llm_response = await self.client.prompt(text)
-            if llm_response.startswith("В интернете есть много сайтов"):
-                verdict = True
-            else:
-                verdict = bool(int(await self.client.prompt(text)))
+            verdict = parse_verdict(await self.client.prompt(text))
         except (GPTError, ValueError) as err:
             logging.exception("Failed swear check!")
             raise CannotCheckSwearsError from err
-        else:
-            caches[text] = int(verdict)
-            await self.storage.set(CACHE_SWEARS_KEY, json.dumps(caches))
-            logging.info("Cached verdict")
 
+        await self.cache.put(text, verdict=verdict)
+        logging.info("Cached verdict")
         return verdict
 
-    async def set_mode(self, *, enabled: bool) -> None:
-        logging.info("Toggled swear check: %s", enabled)
-        await self.storage.set(ENABLED_KEY, str(int(enabled)))
+    async def _check_batch(self, texts: Sequence[str], semaphore: asyncio.Semaphore) -> dict[str, bool]:
+        async with semaphore:
+            prompt = "\n".join(f"{number}. {' '.join(text.split())}" for number, text in enumerate(texts, start=1))
+            try:
+                positions = parse_batch_verdicts(await self.batch_client.prompt(prompt), len(texts))
+            except GPTError as err:
+                logging.exception("Failed batch swear check!")
+                raise CannotCheckSwearsError from err
+
+            verdicts = {text_digest(texts[position]): verdict for position, verdict in positions.items()}
+            await self.cache.put_many([(texts[position], verdict) for position, verdict in positions.items()])
+
+            # texts the model skipped or refused to judge are checked one by one
+            for position, text in enumerate(texts):
+                if position not in positions:
+                    verdicts[text_digest(text)] = await self._check_with_llm(text)
+
+        return verdicts
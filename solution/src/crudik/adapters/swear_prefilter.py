@@ -0,0 +1,166 @@
+import re
+from collections.abc import Iterable
+
+from crudik.adapters.aho_corasick import AhoCorasick
+from crudik.adapters.cache_monitor import CacheRegistry
+
+# profanity that is never legit: matched at a word start it flags the text
+RU_PROFANE_PREFIXES = (
+    "хуй",
+    "хуе",
+    "хуя",
+    "пизд",
+    "ебат",
+    "ебан",
+    "ебал",
+    "ебл",
+    "выеб",
+    "заеб",
+    "наеб",
+    "отъеб",
+    "уеб",
+    "бляд",
+    "блят",
+    "сука",
+    "суки",
+    "сучк",
+    "мудак",
+    "мудил",
+    "пидор",
+    "пидар",
+    "гандон",
+    "залуп",
+)
+EN_PROFANE_PREFIXES = (
+    "fuck",
+    "motherfuck",
+    "bitch",
+    "cunt",
+    "asshole",
+    "whore",
+    "slut",
+    "faggot",
+)
+
+# topics only the model can judge: such texts are always sent to it
+RU_SUSPICIOUS = (
+    "секс",
+    "порн",
+    "эрот",
+    "интим",
+    "голы",
+    "убий",
+    "убив",
+    "убит",
+    "насил",
+    "наркот",
+    "оружи",
+    "взрыв",
+    "казино",
+    "эскорт",
+)
+EN_SUSPICIOUS = (
+    "sex",
+    "porn",
+    "erotic",
+    "nude",
+    "naked",
+    "kill",
+    "murder",
+    "rape",
+    "drug",
+    "cocaine",
+    "weapon",
+    "bomb",
+    "casino",
+    "escort",
+    # profane as whole words only, but also names and parts of legit words like "Moby Dick" or "shitake"
+    "shit",
+    "dick",
+    "bastard",
+    # repeated letters are collapsed, "nigger" would match "Niger"
+    "nigger",
+)
+
+LEET = str.maketrans(
+    {"0": "o", "1": "i", "3": "e", "4": "a", "5": "s", "7": "t", "@": "a", "$": "s", "!": "i", "ё": "е"},
+)
+# letters looking the same in both alphabets
+TO_CYRILLIC = str.maketrans("acekmoptxyhb", "асекмортхунв")
+TO_LATIN = str.maketrans("асекмортхунв", "acekmoptxyhb")
+# characters used to split a word to bypass filters, like "f.u.c.k"
+IN_WORD_SEPARATORS = re.compile(r"(?<=\w)[.\-_*'\"`~]+(?=\w)")
+MASKED = re.compile(r"\w[*#]+\w")
+REPEATED = re.compile(r"(.)\1+")
+LATIN = re.compile(r"[a-z]")
+CYRILLIC = re.compile(r"[а-яё]")
+WORD = re.compile(r"\w+")
+
+
+def _normalize(text: str, script: dict[int, int]) -> str:
+    text = IN_WORD_SEPARATORS.sub("", text.lower().translate(LEET))
+    return REPEATED.sub(r"\1", text.translate(script))
+
+
+def _has_mixed_script_word(text: str) -> bool:
+    return any(LATIN.search(word) and CYRILLIC.search(word) for word in WORD.findall(text.lower()))
+
+
+class _Lexicon:
+    __slots__ = ("_matcher", "_profane_prefixes", "_script")
+
+    def __init__(self, script: dict[int, int], profane_prefixes: Iterable[str], suspicious: Iterable[str]) -> None:
+        self._script = script
+        self._profane_prefixes = {_normalize(each, script) for each in profane_prefixes}
+        suspicious_patterns = {_normalize(each, script) for each in suspicious}
+        self._matcher = AhoCorasick(self._profane_prefixes | suspicious_patterns)
+
+    def classify(self, text: str) -> bool | None:
+        """Return True on profanity, None on anything the model has to judge, False otherwise."""
+        normalized = _normalize(text, self._script)
+        ambiguous = False
+
+        for start, pattern in self._matcher.find(normalized):
+            at_word_start = start == 0 or not normalized[start - 1].isalpha()
+            if pattern in self._profane_prefixes and at_word_start:
+                return True
+
+            ambiguous = True
+
+        return None if ambiguous else False
+
+
+class LexiconPrefilter:
+    """Local RU/EN lexicon check deciding obvious texts without the model.
+
+    Leetspeak, look-alike letters of the other alphabet, separators inside
+    words and repeated letters are normalized away before matching.
+    """
+
+    __slots__ = ("_counter", "_lexicons", "_trust_clean")
+
+    def __init__(self, registry: CacheRegistry, *, trust_clean: bool = False) -> None:
+        self._lexicons = (
+            _Lexicon(TO_CYRILLIC, RU_PROFANE_PREFIXES, RU_SUSPICIOUS),
+            _Lexicon(TO_LATIN, EN_PROFANE_PREFIXES, EN_SUSPICIOUS),
+        )
+        self._trust_clean = trust_clean
+        # a hit is a text decided locally, a miss is one left to the model
+        self._counter = registry.counter("swear_prefilter")
+
+    def classify(self, text: str) -> bool | None:
+        verdicts = [lexicon.classify(text) for lexicon in self._lexicons]
+        if True in verdicts:
+            verdict: bool | None = True
+        elif not self._trust_clean or None in verdicts or MASKED.search(text) or _has_mixed_script_word(text):
+            # masked letters and look-alike letters from the other alphabet are common bypasses
+            verdict = None
+        else:
+            verdict = False
+
+        if verdict is None:
+            self._counter.miss()
+        else:
+            self._counter.hit()
+
+        return verdict
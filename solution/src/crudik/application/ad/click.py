@@ -1,17 +1,24 @@
 from dataclasses import dataclass
 from uuid import UUID, uuid4
 
+from crudik.application.common.event_writer import EventWriter
 from crudik.application.common.gateway.ad import AdGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.common.gateway.client import ClientGateway
 from crudik.application.common.gateway.current_day import DayGateway
 from crudik.application.common.uow import UoW
-from crudik.application.data_model.ad import ClickRequest
+from crudik.application.data_model.ad import ClickOutcome, ClickRequest
 from crudik.application.exceptions.ad import CannotClickWithoutImpressionError
 from crudik.application.exceptions.campaign import CampaignDoesNotExistsError
 from crudik.application.exceptions.client import ClientDoesNotExistsError
 from crudik.domain.entity.click import Click
 
+OUTCOME_ERRORS = {
+    ClickOutcome.CLIENT_NOT_FOUND: ClientDoesNotExistsError,
+    ClickOutcome.CAMPAIGN_NOT_FOUND: CampaignDoesNotExistsError,
+    ClickOutcome.NO_IMPRESSION: CannotClickWithoutImpressionError,
+}
+
 
 @dataclass(slots=True, frozen=True)
 class ClickAd:
@@ -19,7 +26,8 @@ class ClickAd:
     ad_gateway: AdGateway
     client_gateway: ClientGateway
     day_gateway: DayGateway
-    uow: UoW
+    event_writer: EventWriter
+    comitter: UoW
 
     async def execute(
         self,
@@ -27,6 +35,23 @@ class ClickAd:
         ad_id: UUID,
     ) -> None:
         client_id = request.client_id
+        if self.event_writer.has_pending_click(client_id, ad_id):
+            return
+
+        current_day = await self.day_gateway.read_current_day()
+        if self.event_writer.has_pending_impression(client_id, ad_id):
+            await self._write_after_pending_impression(client_id, ad_id, current_day)
+            return
+
+        outcome = await self.ad_gateway.record_click(uuid4(), client_id, ad_id, current_day)
+        if outcome in OUTCOME_ERRORS:
+            raise OUTCOME_ERRORS[outcome]
+
+        if outcome is ClickOutcome.RECORDED:
+            await self.comitter.commit()
+
+    async def _write_after_pending_impression(self, client_id: UUID, ad_id: UUID, day: int) -> None:
+        # the impression is not stored yet, so the click is queued after it instead of being checked against it
         client = await self.client_gateway.get_by_id(client_id)
         if client is None:
             raise ClientDoesNotExistsError
@@ -35,21 +60,11 @@ class ClickAd:
         if campaign is None:
             raise CampaignDoesNotExistsError
 
-        impression = await self.ad_gateway.get_impression(client_id, ad_id)
-        if impression is None:
-            raise CannotClickWithoutImpressionError
-
-        prev_click = await self.ad_gateway.get_click(client_id, ad_id)
-        if prev_click is not None:
-            return
-
-        current_day = await self.day_gateway.read_current_day()
         click = Click(
             click_id=uuid4(),
             ad_id=campaign.campaign_id,
             client_id=client_id,
             cost_per_click=campaign.cost_per_click,
-            day=current_day,
+            day=day,
         )
-        self.uow.add(click)
-        await self.uow.commit()
+        await self.event_writer.write_click(click)
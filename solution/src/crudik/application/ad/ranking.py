@@ -0,0 +1,57 @@
+from collections.abc import Iterable, Mapping
+from uuid import UUID
+
+from crudik.application.data_model.ad import AdCandidate, AdCandidateStats
+
+PROFIT_WEIGHT = 0.5
+RELEVANCE_WEIGHT = 0.25
+LIMIT_BONUS_WEIGHT = 0.15
+CLICK_PENALTY_WEIGHT = 0.05
+IMPRESSIONS_LIMIT_OVERFLOW = 1.049
+
+
+def _ratio(count: int, limit: int) -> float:
+    return count / limit if limit else 0.0
+
+
+def score_ad(candidate: AdCandidate, stats: AdCandidateStats, relevance_score: int) -> float:
+    profit = PROFIT_WEIGHT * (candidate.cost_per_impression + candidate.cost_per_click)
+    relevance = RELEVANCE_WEIGHT * relevance_score
+
+    impressions_ratio = _ratio(stats.impressions_count, candidate.impressions_limit)
+    clicks_ratio = _ratio(stats.clicks_count, candidate.clicks_limit)
+    limit_bonus = LIMIT_BONUS_WEIGHT * ((1 - impressions_ratio) + (1 - clicks_ratio)) / 2
+
+    click_penalty = 0.0
+    if stats.clicks_count > candidate.clicks_limit:
+        click_penalty = -CLICK_PENALTY_WEIGHT * clicks_ratio
+
+    return profit + relevance + limit_bonus + click_penalty
+
+
+def can_show_ad(candidate: AdCandidate, stats: AdCandidateStats) -> bool:
+    if stats.is_seen:
+        return False
+
+    return stats.impressions_count < candidate.impressions_limit * IMPRESSIONS_LIMIT_OVERFLOW
+
+
+def choose_ad(
+    candidates: Iterable[AdCandidate],
+    stats: Mapping[UUID, AdCandidateStats],
+    relevance: Mapping[UUID, int],
+) -> AdCandidate | None:
+    """Pick the best candidate, ``relevance`` maps advertiser ids to their scores for the client."""
+    best: AdCandidate | None = None
+    best_score = 0.0
+
+    for candidate in candidates:
+        candidate_stats = stats.get(candidate.ad_id)
+        if candidate_stats is None or not can_show_ad(candidate, candidate_stats):
+            continue
+
+        score = score_ad(candidate, candidate_stats, relevance.get(candidate.advertiser_id, 0))
+        if best is None or score > best_score:
+            best, best_score = candidate, score
+
+    return best
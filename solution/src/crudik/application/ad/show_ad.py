@@ -2,12 +2,14 @@ import logging
 from dataclasses import dataclass
 from uuid import UUID, uuid4
 
+from crudik.application.ad.ranking import choose_ad
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.event_writer import EventWriter
 from crudik.application.common.gateway.ad import AdGateway
-from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.common.gateway.client import ClientGateway
 from crudik.application.common.gateway.current_day import DayGateway
-from crudik.application.common.uow import UoW
-from crudik.application.data_model.ad import Ad
+from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.data_model.ad import Ad, ImpressionOutcome
 from crudik.application.exceptions.ad import CannotShowAdError
 from crudik.application.exceptions.client import ClientDoesNotExistsError
 from crudik.domain.entity.impression import Impression
@@ -18,8 +20,9 @@ class ShowAd:
     client_gateway: ClientGateway
     day_gateway: DayGateway
     ad_gateway: AdGateway
-    campaign_gateway: CampaignGateway
-    uow: UoW
+    campaign_index: CampaignIndex
+    event_writer: EventWriter
+    relevance_gateway: RelevanceGateway
 
     async def execute(self, client_id: UUID) -> Ad:
         client = await self.client_gateway.get_by_id(client_id)
@@ -27,24 +30,39 @@ class ShowAd:
             raise ClientDoesNotExistsError
 
         current_day = await self.day_gateway.read_current_day()
-        ad = await self.ad_gateway.show_ad(client, current_day)
-
-        if ad is None:
+        candidates = [
+            each
+            for each in self.campaign_index.find(client, current_day)
+            if not self.event_writer.has_pending_impression(client_id, each.ad_id)
+        ]
+        if not candidates:
             raise CannotShowAdError
 
-        campaign = await self.campaign_gateway.get_by_id(ad.ad_id)
-        if campaign is None:
-            logging.critical("Campaign is NULL when showing ad! ad_id = %s", ad.ad_id)
-            raise CannotShowAdError
+        stats = await self.ad_gateway.get_candidates_stats(client_id, [each.ad_id for each in candidates])
+        for candidate in candidates:
+            if candidate.ad_id not in stats:
+                logging.warning("Campaign %s is indexed but not found, dropping it", candidate.ad_id)
+                self.campaign_index.discard(candidate.ad_id)
+
+        relevance = await self.relevance_gateway.get_client_scores(client_id)
+        while True:
+            chosen = choose_ad(candidates, stats, relevance)
+            if chosen is None:
+                raise CannotShowAdError
+
+            impression = Impression(
+                impression_id=uuid4(),
+                ad_id=chosen.ad_id,
+                client_id=client_id,
+                cost_per_impression=chosen.cost_per_impression,
+                day=current_day,
+            )
+            outcome = await self.event_writer.write_impression(impression)
+            if outcome is ImpressionOutcome.RECORDED:
+                return Ad(chosen.ad_id, chosen.ad_text, chosen.ad_title, chosen.advertiser_id)
 
-        impression = Impression(
-            impression_id=uuid4(),
-            ad_id=ad.ad_id,
-            client_id=client_id,
-            cost_per_impression=campaign.cost_per_impression,
-            day=current_day,
-        )
-        self.uow.add(impression)
-        await self.uow.commit()
-
-        return ad
+            # deleted since it was ranked, otherwise shown to the client by a concurrent request
+            if outcome is ImpressionOutcome.CAMPAIGN_NOT_FOUND:
+                logging.warning("Campaign %s is indexed but deleted, dropping it", chosen.ad_id)
+                self.campaign_index.discard(chosen.ad_id)
+            candidates = [each for each in candidates if each.ad_id != chosen.ad_id]
@@ -1,10 +1,18 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily
+from crudik.application.data_model.campaign import (
+    AdvertiserCampaignStat,
+    CampaignStat,
+    CampaignStatDaily,
+    CampaignStatDailyRow,
+    CampaignStatSort,
+    SortOrder,
+)
+from crudik.application.data_model.common import Pagination
 from crudik.application.exceptions.advertiser import AdvertiserDoesNotExistsError
 
 
@@ -42,3 +50,40 @@ class ProduceAdvertiserDailyStat:
 
         stat = await self.advertiser_gateway.get_stat_daily(advertiser_id)
         return stat
+
+
+@dataclass(slots=True, frozen=True)
+class ExportAdvertiserDailyStat:
+    advertiser_gateway: AdvertiserGateway
+
+    async def execute(
+        self,
+        advertiser_id: UUID,
+    ) -> AsyncIterator[Sequence[CampaignStatDailyRow]]:
+        advertiser = await self.advertiser_gateway.get_by_id(advertiser_id)
+        if advertiser is None:
+            raise AdvertiserDoesNotExistsError
+
+        return self.advertiser_gateway.stream_campaign_stat_daily(advertiser_id)
+
+
+@dataclass(slots=True, frozen=True)
+class ProduceAdvertiserCampaignStats:
+    advertiser_gateway: AdvertiserGateway
+
+    async def execute(
+        self,
+        advertiser_id: UUID,
+        pagination: Pagination,
+        sort: CampaignStatSort,
+        order: SortOrder,
+    ) -> Sequence[AdvertiserCampaignStat]:
+        advertiser = await self.advertiser_gateway.get_by_id(advertiser_id)
+        if advertiser is None:
+            raise AdvertiserDoesNotExistsError
+
+        offset = None
+        if pagination.size is not None and pagination.page is not None:
+            offset = pagination.size * pagination.page
+
+        return await self.advertiser_gateway.list_campaign_stats(advertiser_id, sort, order, pagination.size, offset)
@@ -15,13 +15,13 @@ class UpsertAdvertisers:
     gateway: AdvertiserGateway
     comitter: UoW
 
-    async def execute(self, data: list[AdvertiserData]) -> Sequence[Advertiser]:
+    async def execute(self, data: list[AdvertiserData], *, returning: bool = True) -> Sequence[Advertiser]:
         if not data:
             return []
 
         id_map = {each.advertiser_id: convert_advertiser_to_entity(each) for each in data}
 
-        result = await self.gateway.upsert(id_map.values())
+        result = await self.gateway.upsert(list(id_map.values()), returning=returning)
         await self.comitter.commit()
 
         return result
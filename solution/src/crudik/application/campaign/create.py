@@ -1,12 +1,16 @@
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from uuid import UUID, uuid4
 
+from crudik.application.common.campaign_index import CampaignIndex
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.gateway.counter import CounterGateway
 from crudik.application.common.gateway.current_day import DayGateway
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import convert_campaign_to_candidate
 from crudik.application.data_model.campaign import (
     CampaignCreateData,
     CampaignData,
@@ -23,6 +27,39 @@ from crudik.application.exceptions.campaign import (
 from crudik.domain.entity.campaign import Campaign
 
 
+def validate_campaign(data: CampaignCreateData, current_day: int) -> None:
+    if data.start_date < current_day:
+        raise CampaignCannotBeInPastError
+
+    if data.end_date < current_day:
+        raise CampaignCannotBeInPastError
+
+    if data.end_date < data.start_date:
+        raise CampaignCannotBeInPastError
+
+    if data.clicks_limit > data.impressions_limit:
+        raise ClickLimitGreaterThanImpressionsLimitError
+
+
+def build_campaign(data: CampaignCreateData, advertiser_id: UUID) -> Campaign:
+    return Campaign(
+        campaign_id=uuid4(),
+        advertiser_id=advertiser_id,
+        impressions_limit=data.impressions_limit,
+        clicks_limit=data.clicks_limit,
+        cost_per_impression=data.cost_per_impression,
+        cost_per_click=data.cost_per_click,
+        ad_title=data.ad_title,
+        ad_text=data.ad_text,
+        start_date=data.start_date,
+        end_date=data.end_date,
+        age_from=data.targeting.age_from if data.targeting is not None else None,
+        age_to=data.targeting.age_to if data.targeting is not None else None,
+        location=data.targeting.location if data.targeting is not None else None,
+        gender=data.targeting.gender if data.targeting is not None else None,
+    )
+
+
 @dataclass(slots=True, frozen=True)
 class CreateCampaign:
     uow: UoW
@@ -30,6 +67,8 @@ class CreateCampaign:
     campaign_gateway: CampaignGateway
     advertiser_gateway: AdvertiserGateway
     swear_filter: SwearFilter
+    campaign_index: CampaignIndex
+    counter_gateway: CounterGateway
 
     async def execute(
         self,
@@ -40,43 +79,58 @@ class CreateCampaign:
         if advertiser is None:
             raise AdvertiserDoesNotExistsError
 
-        campaign_id = uuid4()
         current_day = await self.day_gateway.read_current_day()
-
-        if data.start_date < current_day:
-            raise CampaignCannotBeInPastError
-
-        if data.end_date < current_day:
-            raise CampaignCannotBeInPastError
-
-        if data.end_date < data.start_date:
-            raise CampaignCannotBeInPastError
-
-        if data.clicks_limit > data.impressions_limit:
-            raise ClickLimitGreaterThanImpressionsLimitError
+        validate_campaign(data, current_day)
 
         ad_full_text = data.ad_title + " " + data.ad_text
         if await self.swear_filter.check_contains_swears(ad_full_text):
             raise CampaignContainsSwearsError
 
-        entity = Campaign(
-            campaign_id=campaign_id,
-            advertiser_id=advertiser_id,
-            impressions_limit=data.impressions_limit,
-            clicks_limit=data.clicks_limit,
-            cost_per_impression=data.cost_per_impression,
-            cost_per_click=data.cost_per_click,
-            ad_title=data.ad_title,
-            ad_text=data.ad_text,
-            start_date=data.start_date,
-            end_date=data.end_date,
-            age_from=data.targeting.age_from if data.targeting is not None else None,
-            age_to=data.targeting.age_to if data.targeting is not None else None,
-            location=data.targeting.location if data.targeting is not None else None,
-            gender=data.targeting.gender if data.targeting is not None else None,
-        )
-
+        entity = build_campaign(data, advertiser_id)
         self.uow.add(entity)
+        await self.counter_gateway.count_campaigns([entity])
         await self.uow.commit()
-        logging.info("Created campaign: %s", campaign_id)
+        self.campaign_index.put(convert_campaign_to_candidate(entity))
+        logging.info("Created campaign: %s", entity.campaign_id)
         return convert_entity_to_campaign(entity)
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCampaigns:
+    uow: UoW
+    day_gateway: DayGateway
+    advertiser_gateway: AdvertiserGateway
+    swear_filter: SwearFilter
+    campaign_index: CampaignIndex
+    counter_gateway: CounterGateway
+
+    async def execute(
+        self,
+        data: Sequence[CampaignCreateData],
+        advertiser_id: UUID,
+    ) -> Sequence[CampaignData]:
+        advertiser = await self.advertiser_gateway.get_by_id(advertiser_id)
+        if advertiser is None:
+            raise AdvertiserDoesNotExistsError
+
+        if not data:
+            return []
+
+        current_day = await self.day_gateway.read_current_day()
+        for each in data:
+            validate_campaign(each, current_day)
+
+        verdicts = await self.swear_filter.check_many([each.ad_title + " " + each.ad_text for each in data])
+        if any(verdicts):
+            raise CampaignContainsSwearsError
+
+        entities = [build_campaign(each, advertiser_id) for each in data]
+        for entity in entities:
+            self.uow.add(entity)
+        await self.counter_gateway.count_campaigns(entities)
+        await self.uow.commit()
+
+        for entity in entities:
+            self.campaign_index.put(convert_campaign_to_candidate(entity))
+        logging.info("Created %s campaigns for advertiser %s", len(entities), advertiser_id)
+        return [convert_entity_to_campaign(entity) for entity in entities]
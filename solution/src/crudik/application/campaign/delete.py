@@ -2,6 +2,7 @@ import logging
 from dataclasses import dataclass
 from uuid import UUID
 
+from crudik.application.common.campaign_index import CampaignIndex
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.common.uow import UoW
@@ -17,6 +18,7 @@ class DeleteCampaign:
     uow: UoW
     campaign_gateway: CampaignGateway
     advertiser_gateway: AdvertiserGateway
+    campaign_index: CampaignIndex
 
     async def execute(self, campaign_id: UUID, advertiser_id: UUID) -> None:
         advertiser = await self.advertiser_gateway.get_by_id(advertiser_id)
@@ -32,4 +34,5 @@ class DeleteCampaign:
 
         campaign.is_deleted = True
         await self.uow.commit()
+        self.campaign_index.discard(campaign.campaign_id)
         logging.info("Deleted %s", campaign.campaign_id)
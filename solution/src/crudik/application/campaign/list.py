@@ -4,7 +4,8 @@ from uuid import UUID
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.data_model.campaign import (
-    CampaignData,
+    CampaignCursor,
+    CampaignPage,
     convert_entity_to_campaign,
 )
 from crudik.application.data_model.common import Pagination
@@ -22,7 +23,7 @@ class ListCampaigns:
         self,
         advertiser_id: UUID,
         pagination: Pagination,
-    ) -> list[CampaignData]:
+    ) -> CampaignPage:
         advertiser = await self.advertiser_gateway.get_by_id(advertiser_id)
         if advertiser is None:
             raise AdvertiserDoesNotExistsError
@@ -31,8 +32,21 @@ class ListCampaigns:
         if pagination.size is not None:
             limit = pagination.size
 
-        if pagination.size is not None and pagination.page is not None:
-            offset = pagination.size * pagination.page
+        if pagination.cursor is not None:
+            after = CampaignCursor.decode(pagination.cursor)
+            entries = await self.campaign_gateway.list_after(advertiser_id, limit, after)
+        else:
+            if pagination.size is not None and pagination.page is not None:
+                offset = pagination.size * pagination.page
 
-        entries = await self.campaign_gateway.list(advertiser_id, limit, offset)
-        return [convert_entity_to_campaign(entity) for entity in entries]
+            entries = await self.campaign_gateway.list(advertiser_id, limit, offset)
+
+        next_cursor = None
+        if entries and limit is not None and len(entries) == limit:
+            last = entries[-1]
+            next_cursor = CampaignCursor(ad_title=last.ad_title, campaign_id=last.campaign_id).encode()
+
+        return CampaignPage(
+            campaigns=[convert_entity_to_campaign(entity) for entity in entries],
+            next_cursor=next_cursor,
+        )
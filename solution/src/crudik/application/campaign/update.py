@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from crudik.application.common.campaign_index import CampaignIndex
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.common.gateway.current_day import DayGateway
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import convert_campaign_to_candidate
 from crudik.application.data_model.campaign import (
     CampaignData,
     CampaignUpdateData,
@@ -30,6 +32,7 @@ class UpdateCampaign:
     uow: UoW
     day_gateway: DayGateway
     swear_filter: SwearFilter
+    campaign_index: CampaignIndex
 
     async def execute(
         self,
@@ -95,4 +98,5 @@ class UpdateCampaign:
         campaign.gender = data.targeting.gender if data.targeting else None
 
         await self.uow.commit()
+        self.campaign_index.put(convert_campaign_to_candidate(campaign))
         return convert_entity_to_campaign(campaign)
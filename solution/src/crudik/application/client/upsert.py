@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
 
+from crudik.application.common.client_cache import ClientCache
 from crudik.application.common.gateway.client import ClientGateway
 from crudik.application.common.uow import UoW
 from crudik.application.data_model.client import (
@@ -14,14 +15,17 @@ from crudik.domain.entity.client import Client
 class UpsertClients:
     gateway: ClientGateway
     comitter: UoW
+    cache: ClientCache
 
-    async def execute(self, data: list[ClientData]) -> Sequence[Client]:
+    async def execute(self, data: list[ClientData], *, returning: bool = True) -> Sequence[Client]:
         if not data:
             return []
 
         id_map = {client.client_id: convert_client_to_entity(client) for client in data}
 
-        result = await self.gateway.upsert(id_map.values())
+        result = await self.gateway.upsert(list(id_map.values()), returning=returning)
         await self.comitter.commit()
+        # only committed clients are cached, a failed commit leaves the cache as it was
+        await self.cache.put_many(result)
 
         return result
@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from crudik.application.data_model.metrics import CacheStat
+
+
+class CacheMonitor(Protocol):
+    @abstractmethod
+    def get_stats(self) -> Sequence[CacheStat]: ...
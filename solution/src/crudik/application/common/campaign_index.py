@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+from uuid import UUID
+
+from crudik.application.data_model.ad import AdCandidate
+from crudik.domain.entity.client import Client
+
+
+class CampaignIndex(Protocol):
+    @abstractmethod
+    def find(self, client: Client, day: int) -> Sequence[AdCandidate]:
+        """SHOULD return not deleted campaigns whose targeting and dates match the client."""  # noqa: D401
+
+    @abstractmethod
+    def put(self, candidate: AdCandidate) -> None: ...
+
+    @abstractmethod
+    def discard(self, ad_id: UUID) -> None: ...
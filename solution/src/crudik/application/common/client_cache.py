@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from typing import Protocol
+
+from crudik.domain.entity.client import Client
+
+
+class ClientCache(Protocol):
+    @abstractmethod
+    async def put_many(self, clients: Iterable[Client]) -> None:
+        """SHOULD replace the cached clients, called once they are committed."""  # noqa: D401
@@ -0,0 +1,24 @@
+from abc import abstractmethod
+from typing import Protocol
+from uuid import UUID
+
+from crudik.application.data_model.ad import ImpressionOutcome
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.impression import Impression
+
+
+class EventWriter(Protocol):
+    @abstractmethod
+    def has_pending_impression(self, client_id: UUID, ad_id: UUID) -> bool:
+        """SHOULD tell whether the impression is written but not yet visible to gateways."""  # noqa: D401
+
+    @abstractmethod
+    def has_pending_click(self, client_id: UUID, ad_id: UUID) -> bool:
+        """SHOULD tell whether the click is written but not yet visible to gateways."""  # noqa: D401
+
+    @abstractmethod
+    async def write_impression(self, impression: Impression) -> ImpressionOutcome:
+        """SHOULD tell why the impression is not written, the client has been shown the ad or the campaign is gone."""  # noqa: D401
+
+    @abstractmethod
+    async def write_click(self, click: Click) -> None: ...
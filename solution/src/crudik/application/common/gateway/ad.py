@@ -1,10 +1,10 @@
 from abc import abstractmethod
+from collections.abc import Collection, Mapping
 from typing import Protocol
 from uuid import UUID
 
-from crudik.application.data_model.ad import Ad
+from crudik.application.data_model.ad import AdCandidateStats, ClickOutcome, ImpressionOutcome
 from crudik.domain.entity.click import Click
-from crudik.domain.entity.client import Client
 from crudik.domain.entity.impression import Impression
 
 
@@ -19,4 +19,17 @@ class AdGateway(Protocol):
     async def get_clicks_count(self, ad_id: UUID) -> int: ...
 
     @abstractmethod
-    async def show_ad(self, client: Client, day: int) -> Ad | None: ...
+    async def get_candidates_stats(
+        self,
+        client_id: UUID,
+        ad_ids: Collection[UUID],
+    ) -> Mapping[UUID, AdCandidateStats]:
+        """SHOULD skip deleted and missing campaigns."""  # noqa: D401
+
+    @abstractmethod
+    async def record_impression(self, impression: Impression) -> ImpressionOutcome:
+        """SHOULD store and count it in one round trip, unless the campaign is gone or was shown to the client."""  # noqa: D401
+
+    @abstractmethod
+    async def record_click(self, click_id: UUID, client_id: UUID, ad_id: UUID, day: int) -> ClickOutcome:
+        """SHOULD check, store and count the click at the campaign's current cost in one round trip."""  # noqa: D401
@@ -1,24 +1,49 @@
 from abc import abstractmethod
-from collections.abc import Iterable, Sequence
+from collections.abc import AsyncIterator, Collection, Sequence
+from collections.abc import Set as AbstractSet
 from typing import Protocol
 from uuid import UUID
 
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily
+from crudik.application.data_model.campaign import (
+    AdvertiserCampaignStat,
+    CampaignStat,
+    CampaignStatDaily,
+    CampaignStatDailyRow,
+    CampaignStatSort,
+    SortOrder,
+)
 from crudik.domain.entity.advertiser import Advertiser
 
 
 class AdvertiserGateway(Protocol):
     @abstractmethod
-    async def upsert(
-        self,
-        data: Iterable[Advertiser],
-    ) -> Sequence[Advertiser]: ...
+    async def upsert(self, data: Sequence[Advertiser], *, returning: bool = True) -> Sequence[Advertiser]:
+        """SHOULD return the stored advertisers, or ``data`` itself without reading them back unless ``returning``."""  # noqa: D401
 
     @abstractmethod
     async def get_by_id(self, unique_id: UUID) -> Advertiser | None: ...
 
+    @abstractmethod
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        """SHOULD return the ids out of ``ids`` that belong to stored advertisers."""  # noqa: D401
+
     @abstractmethod
     async def get_stat(self, advertiser_id: UUID) -> CampaignStat | None: ...
 
     @abstractmethod
     async def get_stat_daily(self, advertiser_id: UUID) -> Sequence[CampaignStatDaily]: ...
+
+    @abstractmethod
+    def stream_campaign_stat_daily(self, advertiser_id: UUID) -> AsyncIterator[Sequence[CampaignStatDailyRow]]:
+        """SHOULD yield per campaign per day stats in chunks, without loading them all at once."""  # noqa: D401
+
+    @abstractmethod
+    async def list_campaign_stats(
+        self,
+        advertiser_id: UUID,
+        sort: CampaignStatSort,
+        order: SortOrder,
+        limit: int | None,
+        offset: int | None,
+    ) -> Sequence[AdvertiserCampaignStat]:
+        """SHOULD return stats of not deleted campaigns, ties in ``sort`` ordered by campaign id."""  # noqa: D401
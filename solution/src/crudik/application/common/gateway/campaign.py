@@ -3,7 +3,7 @@ from collections.abc import Sequence
 from typing import Protocol
 from uuid import UUID
 
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily
+from crudik.application.data_model.campaign import CampaignCursor, CampaignStat, CampaignStatDaily
 from crudik.domain.entity.campaign import Campaign
 
 
@@ -24,6 +24,15 @@ class CampaignGateway(Protocol):
         offset: int | None,
     ) -> Sequence[Campaign]: ...
 
+    @abstractmethod
+    async def list_after(
+        self,
+        advertiser_id: UUID,
+        limit: int | None,
+        after: CampaignCursor,
+    ) -> Sequence[Campaign]:
+        """SHOULD return entries following ``after`` in the same order as ``list``."""  # noqa: D401
+
     @abstractmethod
     async def get_stat(self, unique_id: UUID) -> CampaignStat | None: ...
 
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from collections.abc import Iterable, Sequence
+from collections.abc import Collection, Sequence
+from collections.abc import Set as AbstractSet
 from typing import Protocol
 from uuid import UUID
 
@@ -8,7 +9,12 @@ from crudik.domain.entity.client import Client
 
 class ClientGateway(Protocol):
     @abstractmethod
-    async def upsert(self, data: Iterable[Client]) -> Sequence[Client]: ...
+    async def upsert(self, data: Sequence[Client], *, returning: bool = True) -> Sequence[Client]:
+        """SHOULD return the stored clients, or ``data`` itself without reading them back unless ``returning``."""  # noqa: D401
 
     @abstractmethod
     async def get_by_id(self, unique_id: UUID) -> Client | None: ...
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        """SHOULD return the ids out of ``ids`` that belong to stored clients."""  # noqa: D401
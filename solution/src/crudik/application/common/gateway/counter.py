@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from collections.abc import Sequence
+from typing import Protocol
+
+from crudik.domain.entity.campaign import Campaign
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.impression import Impression
+
+
+class CounterGateway(Protocol):
+    @abstractmethod
+    async def count_impressions(self, impressions: Sequence[Impression]) -> None: ...
+
+    @abstractmethod
+    async def count_clicks(self, clicks: Sequence[Click]) -> None: ...
+
+    @abstractmethod
+    async def count_campaigns(self, campaigns: Sequence[Campaign]) -> None: ...
@@ -1,5 +1,7 @@
 from abc import abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Protocol
+from uuid import UUID
 
 from crudik.domain.entity.relevance import Relevance
 
@@ -7,3 +9,11 @@ from crudik.domain.entity.relevance import Relevance
 class RelevanceGateway(Protocol):
     @abstractmethod
     async def upsert(self, data: Relevance) -> None: ...
+
+    @abstractmethod
+    async def upsert_many(self, data: Sequence[Relevance]) -> None:
+        """SHOULD accept at most one score per client and advertiser pair."""  # noqa: D401
+
+    @abstractmethod
+    async def get_client_scores(self, client_id: UUID) -> Mapping[UUID, int]:
+        """SHOULD map advertiser ids to their scores for the client."""  # noqa: D401
@@ -0,0 +1,9 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from crudik.application.data_model.metrics import PoolStat
+
+
+class PoolMonitor(Protocol):
+    @abstractmethod
+    def get_stats(self) -> PoolStat: ...
@@ -0,0 +1,10 @@
+from abc import abstractmethod
+from collections.abc import Iterable
+from typing import Protocol
+from uuid import UUID
+
+
+class RelevanceCache(Protocol):
+    @abstractmethod
+    async def invalidate(self, client_ids: Iterable[UUID]) -> None:
+        """SHOULD drop the cached scores of the clients, called once their new scores are committed."""  # noqa: D401
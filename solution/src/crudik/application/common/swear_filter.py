@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from typing import Protocol
 
 
@@ -6,5 +7,9 @@ class SwearFilter(Protocol):
     @abstractmethod
     async def check_contains_swears(self, text: str) -> bool: ...
 
+    @abstractmethod
+    async def check_many(self, texts: Sequence[str]) -> list[bool]:
+        """SHOULD return a verdict for every text in the same order."""  # noqa: D401
+
     @abstractmethod
     async def set_mode(self, *, enabled: bool) -> None: ...
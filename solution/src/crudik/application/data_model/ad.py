@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from enum import StrEnum
 from uuid import UUID
 
+from crudik.domain.entity.campaign import Campaign, TargetGender
+
 
 @dataclass(slots=True, frozen=True)
 class Ad:
@@ -13,3 +16,62 @@ class Ad:
 @dataclass(slots=True, frozen=True)
 class ClickRequest:
     client_id: UUID
+
+
+class ImpressionOutcome(StrEnum):
+    RECORDED = "recorded"
+    ALREADY_SHOWN = "already_shown"
+    CAMPAIGN_NOT_FOUND = "campaign_not_found"
+
+
+class ClickOutcome(StrEnum):
+    RECORDED = "recorded"
+    ALREADY_CLICKED = "already_clicked"
+    CLIENT_NOT_FOUND = "client_not_found"
+    CAMPAIGN_NOT_FOUND = "campaign_not_found"
+    NO_IMPRESSION = "no_impression"
+
+
+@dataclass(slots=True, frozen=True)
+class AdCandidate:
+    ad_id: UUID
+    advertiser_id: UUID
+    ad_title: str
+    ad_text: str
+    impressions_limit: int
+    clicks_limit: int
+    cost_per_impression: float
+    cost_per_click: float
+    start_date: int
+    end_date: int
+    age_from: int | None
+    age_to: int | None
+    location: str | None
+    gender: TargetGender | None
+
+
+@dataclass(slots=True, frozen=True)
+class AdCandidateStats:
+    ad_id: UUID
+    impressions_count: int
+    clicks_count: int
+    is_seen: bool
+
+
+def convert_campaign_to_candidate(data: Campaign) -> AdCandidate:
+    return AdCandidate(
+        ad_id=data.campaign_id,
+        advertiser_id=data.advertiser_id,
+        ad_title=data.ad_title,
+        ad_text=data.ad_text,
+        impressions_limit=data.impressions_limit,
+        clicks_limit=data.clicks_limit,
+        cost_per_impression=float(data.cost_per_impression),
+        cost_per_click=float(data.cost_per_click),
+        start_date=data.start_date,
+        end_date=data.end_date,
+        age_from=data.age_from,
+        age_to=data.age_to,
+        location=data.location,
+        gender=data.gender,
+    )
@@ -1,6 +1,8 @@
+import base64
+from enum import StrEnum
 from uuid import UUID
 
-from adaptix import Retort, name_mapping
+from adaptix import Retort, loader, name_mapping
 from pydantic import BaseModel
 
 from crudik.application.data_model.common import (
@@ -8,6 +10,7 @@ from crudik.application.data_model.common import (
     PositiveFloatZero,
     PositiveIntZero,
 )
+from crudik.application.exceptions.campaign import InvalidCampaignCursorError
 from crudik.domain.entity.campaign import Campaign, TargetGender
 
 
@@ -61,8 +64,62 @@ class CampaignStatDaily(CampaignStat):
     date: int
 
 
+class CampaignStatDailyRow(CampaignStatDaily):
+    campaign_id: UUID
+
+
+class AdvertiserCampaignStat(CampaignStat):
+    campaign_id: UUID
+
+
+class CampaignStatSort(StrEnum):
+    IMPRESSIONS_COUNT = "impressions_count"
+    CLICKS_COUNT = "clicks_count"
+    CONVERSION = "conversion"
+    SPENT_IMPRESSIONS = "spent_impressions"
+    SPENT_CLICKS = "spent_clicks"
+    SPENT_TOTAL = "spent_total"
+
+
+class SortOrder(StrEnum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class CampaignCursor(BaseModel):
+    """Position after the last campaign of a page in the (ad_title, campaign_id) order."""
+
+    ad_title: str
+    campaign_id: UUID
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "CampaignCursor":
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(token.encode()))
+        except ValueError as err:
+            raise InvalidCampaignCursorError from err
+
+
+class CampaignPage(BaseModel):
+    campaigns: list[CampaignData]
+    next_cursor: str | None
+
+
 retort_campaign_stat_from_list = Retort(
     recipe=[
+        # rows come from the driver with UUID objects already
+        loader(UUID, lambda value: value if isinstance(value, UUID) else UUID(value)),
+        name_mapping(
+            AdvertiserCampaignStat,
+            as_list=True,
+        ),
+        name_mapping(
+            CampaignStatDailyRow,
+            as_list=True,
+        ),
         name_mapping(
             CampaignStatDaily,
             as_list=True,
@@ -11,3 +11,4 @@ Age = Annotated[int, Ge(0), Le(100)]
 class Pagination(BaseModel):
     size: PositiveIntZero | None = 10
     page: PositiveIntZero | None = 0
+    cursor: str | None = None
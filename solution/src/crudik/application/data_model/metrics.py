@@ -11,3 +11,29 @@ class ServiceMetrics(BaseModel):
     income_impressions: float
     income_clicks: float
     income_total: float
+
+
+class CacheStat(BaseModel):
+    name: str
+    size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class PoolStat(BaseModel):
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_avg_ms: float
+    wait_p50_ms: float
+    wait_p99_ms: float
+    wait_max_ms: float
+
+
+class IngestionStat(BaseModel):
+    queued: int
+    written: int
+    retried_batches: int
+    dropped: int
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from uuid import UUID
 
 from adaptix.conversion import get_converter
@@ -14,3 +15,22 @@ class RelevanceData(BaseModel):
 
 
 convert_relevance_to_entity = get_converter(RelevanceData, Relevance)
+
+
+@dataclass(slots=True, frozen=True)
+class RelevanceImportRow:
+    """A parsed input row, ``error`` is set instead of ``data`` for a malformed one."""
+
+    line: int
+    data: RelevanceData | None
+    error: str | None = None
+
+
+class RelevanceReject(BaseModel):
+    line: int
+    reason: str
+
+
+class RelevanceImportResult(BaseModel):
+    accepted: int
+    rejected: list[RelevanceReject]
@@ -17,3 +17,6 @@ class CampaignContainsSwearsError(AppError): ...
 
 
 class ClickLimitGreaterThanImpressionsLimitError(AppError): ...
+
+
+class InvalidCampaignCursorError(AppError): ...
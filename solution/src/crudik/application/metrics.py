@@ -1,14 +1,18 @@
 import json
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from adaptix import Retort
 
+from crudik.application.common.cache_monitor import CacheMonitor
 from crudik.application.common.cache_storage import KeyValueStorage
 from crudik.application.common.gateway.metrics import MetricsGateway
-from crudik.application.data_model.metrics import ServiceMetrics
+from crudik.application.common.ingestion_monitor import IngestionMonitor
+from crudik.application.common.pool_monitor import PoolMonitor
+from crudik.application.data_model.metrics import CacheStat, IngestionStat, PoolStat, ServiceMetrics
 
 CACHE_SECONDS = 5
 METRICS_CACHE_KEY = "metrics"
@@ -17,10 +21,20 @@ CACHE_UNTIL_KEY = "cache_until"
 retort = Retort()
 
 
+async def store_metrics(storage: KeyValueStorage, metrics: ServiceMetrics, now: datetime) -> None:
+    cache_new_until = (now + timedelta(seconds=CACHE_SECONDS)).timestamp()
+    cache_new_entry: dict[Any, Any] = retort.dump(metrics)
+    cache_new_entry[CACHE_UNTIL_KEY] = cache_new_until
+
+    await storage.set(METRICS_CACHE_KEY, json.dumps(cache_new_entry))
+
+
 @dataclass(slots=True, frozen=True)
 class ProduceMetrics:
     gateway: MetricsGateway
     storage: KeyValueStorage
+    # metrics are kept fresh by RefreshMetrics running in the background, the stored value never expires
+    refresh_ahead: bool = False
 
     async def execute(self) -> ServiceMetrics:
         now = datetime.now(tz=UTC)
@@ -33,7 +47,7 @@ class ProduceMetrics:
             cache_dict = json.loads(cache)
             cache_until_entry = cache_dict[CACHE_UNTIL_KEY]
             cache_until = datetime.fromtimestamp(cache_until_entry, tz=UTC)
-            if now < cache_until:
+            if self.refresh_ahead or now < cache_until:
                 is_cached = True
                 cache_entry = retort.load(cache_dict, ServiceMetrics)
 
@@ -43,9 +57,41 @@ class ProduceMetrics:
 
         logging.info("No cache for metrics")
         metrics = await self.gateway.get_metrics()
-        cache_new_until = (now + timedelta(seconds=CACHE_SECONDS)).timestamp()
-        cache_new_entry: dict[Any, Any] = retort.dump(metrics)
-        cache_new_entry[CACHE_UNTIL_KEY] = cache_new_until
-
-        await self.storage.set(METRICS_CACHE_KEY, json.dumps(cache_new_entry))
+        await store_metrics(self.storage, metrics, now)
         return metrics
+
+
+@dataclass(slots=True, frozen=True)
+class RefreshMetrics:
+    gateway: MetricsGateway
+    storage: KeyValueStorage
+
+    async def execute(self) -> None:
+        now = datetime.now(tz=UTC)
+        metrics = await self.gateway.get_metrics()
+        await store_metrics(self.storage, metrics, now)
+        logging.info("Metrics refreshed")
+
+
+@dataclass(slots=True, frozen=True)
+class ProduceCacheStats:
+    monitor: CacheMonitor
+
+    async def execute(self) -> Sequence[CacheStat]:
+        return self.monitor.get_stats()
+
+
+@dataclass(slots=True, frozen=True)
+class ProducePoolStats:
+    monitor: PoolMonitor
+
+    async def execute(self) -> PoolStat:
+        return self.monitor.get_stats()
+
+
+@dataclass(slots=True, frozen=True)
+class ProduceIngestionStats:
+    monitor: IngestionMonitor
+
+    async def execute(self) -> IngestionStat:
+        return self.monitor.get_stats()
@@ -1,11 +1,17 @@
+import logging
+from collections.abc import AsyncIterable, Sequence
 from dataclasses import dataclass
 
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.client import ClientGateway
 from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.common.relevance_cache import RelevanceCache
 from crudik.application.common.uow import UoW
 from crudik.application.data_model.relevance import (
     RelevanceData,
+    RelevanceImportResult,
+    RelevanceImportRow,
+    RelevanceReject,
     convert_relevance_to_entity,
 )
 from crudik.application.exceptions.advertiser import (
@@ -20,6 +26,7 @@ class UpsertRelevance:
     client_gateway: ClientGateway
     advertiser_gateway: AdvertiserGateway
     comitter: UoW
+    cache: RelevanceCache
 
     async def execute(self, data: RelevanceData) -> None:
         client = await self.client_gateway.get_by_id(data.client_id)
@@ -34,3 +41,84 @@ class UpsertRelevance:
 
         await self.gateway.upsert(convert_relevance_to_entity(data))
         await self.comitter.commit()
+        # after the commit, a read between the two would put the old scores back otherwise
+        await self.cache.invalidate([data.client_id])
+
+
+@dataclass(slots=True, frozen=True)
+class UpsertRelevances:
+    gateway: RelevanceGateway
+    client_gateway: ClientGateway
+    advertiser_gateway: AdvertiserGateway
+    comitter: UoW
+    cache: RelevanceCache
+
+    async def execute(self, data: Sequence[RelevanceData]) -> None:
+        if not data:
+            return
+
+        # the last score of a pair wins, one statement cannot update a row twice
+        id_map = {(each.client_id, each.advertiser_id): convert_relevance_to_entity(each) for each in data}
+        client_ids = {client_id for client_id, _ in id_map}
+        advertiser_ids = {advertiser_id for _, advertiser_id in id_map}
+
+        if await self.client_gateway.get_existing_ids(client_ids) != client_ids:
+            raise ClientDoesNotExistsError
+
+        if await self.advertiser_gateway.get_existing_ids(advertiser_ids) != advertiser_ids:
+            raise AdvertiserDoesNotExistsError
+
+        await self.gateway.upsert_many(list(id_map.values()))
+        await self.comitter.commit()
+        await self.cache.invalidate(client_ids)
+
+
+@dataclass(slots=True, frozen=True)
+class ImportRelevances:
+    """Upserts scores chunk by chunk, rows that cannot be stored are reported instead of failing the import."""
+
+    gateway: RelevanceGateway
+    client_gateway: ClientGateway
+    advertiser_gateway: AdvertiserGateway
+    comitter: UoW
+    cache: RelevanceCache
+
+    async def execute(self, chunks: AsyncIterable[Sequence[RelevanceImportRow]]) -> RelevanceImportResult:
+        accepted = 0
+        rejected: list[RelevanceReject] = []
+
+        async for chunk in chunks:
+            rows = []
+            for row in chunk:
+                if row.data is None:
+                    rejected.append(RelevanceReject(line=row.line, reason=row.error or "Invalid row"))
+                else:
+                    rows.append((row.line, row.data))
+
+            if not rows:
+                continue
+
+            existing_clients = await self.client_gateway.get_existing_ids({data.client_id for _, data in rows})
+            existing_advertisers = await self.advertiser_gateway.get_existing_ids(
+                {data.advertiser_id for _, data in rows},
+            )
+
+            # the last score of a pair wins, one statement cannot update a row twice
+            id_map = {}
+            for line, data in rows:
+                if data.client_id not in existing_clients:
+                    rejected.append(RelevanceReject(line=line, reason="Client does not exists"))
+                elif data.advertiser_id not in existing_advertisers:
+                    rejected.append(RelevanceReject(line=line, reason="Advertiser does not exists"))
+                else:
+                    id_map[data.client_id, data.advertiser_id] = convert_relevance_to_entity(data)
+                    accepted += 1
+
+            if id_map:
+                await self.gateway.upsert_many(list(id_map.values()))
+                # a chunk is committed on its own, a failure later keeps the chunks stored so far
+                await self.comitter.commit()
+                await self.cache.invalidate({client_id for client_id, _ in id_map})
+
+        logging.info("Imported %s scores, rejected %s", accepted, len(rejected))
+        return RelevanceImportResult(accepted=accepted, rejected=rejected)
@@ -1,9 +1,14 @@
+import asyncio
 import contextlib
+import logging
 import sys
 
 import alembic.config
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from crudik.adapters.db.alembic.config import get_alembic_config_path
+from crudik.adapters.gateway.counter import rebuild_daily_stats
+from crudik.bootstrap.di.container import get_async_container
 from crudik.bootstrap.entrypoint.fast_api import run_api
 
 
@@ -29,6 +34,22 @@ def autogenerate_migrations(*args: str) -> None:
         next(alembic_path_gen)
 
 
+async def _backfill_daily_stats() -> None:
+    container = get_async_container()
+    try:
+        async with container() as r:
+            session = await r.get(AsyncSession)
+            await rebuild_daily_stats(session)
+            await session.commit()
+    finally:
+        await container.close()
+
+
+def backfill_daily_stats(_argv: list[str]) -> None:
+    asyncio.run(_backfill_daily_stats())
+    logging.info("Daily campaign stats rebuilt.")
+
+
 def main() -> None:
     argv = sys.argv[1:]
 
@@ -49,6 +70,9 @@ def main() -> None:
         "migrations": {
             "autogenerate": autogenerate_migrations,
         },
+        "stats": {
+            "backfill": backfill_daily_stats,
+        },
     }
 
     if module not in modules:
@@ -1,26 +1,55 @@
+import functools
 from collections.abc import AsyncIterator
 
 from aiohttp import ClientSession
-from dishka import AnyOf, Provider, Scope, provide
+from dishka import AnyOf, AsyncContainer, Provider, Scope, provide
 from miniopy_async import Minio  # type:ignore[import-untyped]
 from redis.asyncio import Redis
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from crudik.adapters.config_loader import DBConnectionConfig, FilesConfig
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.campaign_index import load_campaign_index
+from crudik.adapters.client_cache import TieredClientCache
+from crudik.adapters.config_loader import CacheConfig, DBConnectionConfig, FilesConfig, IngestionConfig, YaGPTConfig
+from crudik.adapters.day_cache import CurrentDayCache
+from crudik.adapters.db.pool import PoolWaitMonitor
 from crudik.adapters.db.provider import (
     get_async_session,
     get_async_sessionmaker,
     get_engine,
+    get_read_only_session,
+    get_replica_router,
+)
+from crudik.adapters.db.replica import ReplicaRouter
+from crudik.adapters.event_writer import (
+    BatchedEventWriter,
+    IngestionCounters,
+    TransactionalEventWriter,
+    write_batch,
 )
 from crudik.adapters.file_manager import MinioFileManager
+from crudik.adapters.gateway.day import DAY_KEY
+from crudik.adapters.gateway.metrics import MetricsAlchemyGateway
+from crudik.adapters.metrics_refresher import MetricsRefresher
 from crudik.adapters.redis import RedisStorage
+from crudik.adapters.relevance_cache import RedisRelevanceCache
+from crudik.adapters.swear_cache import SwearVerdictCache
 from crudik.adapters.swear_filter import LLMSwearFilter
+from crudik.adapters.swear_prefilter import LexiconPrefilter
 from crudik.adapters.text_generator import LLMAdTextGenerator
 from crudik.application.common.ad_text_generator import AdTextGenerator
+from crudik.application.common.cache_monitor import CacheMonitor
 from crudik.application.common.cache_storage import KeyValueStorage
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.client_cache import ClientCache
+from crudik.application.common.event_writer import EventWriter
 from crudik.application.common.file_manager import FileManager
+from crudik.application.common.ingestion_monitor import IngestionMonitor
+from crudik.application.common.pool_monitor import PoolMonitor
+from crudik.application.common.relevance_cache import RelevanceCache
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
+from crudik.application.metrics import RefreshMetrics
 
 
 class AdapterProvider(Provider):
@@ -40,6 +69,14 @@ class AdapterProvider(Provider):
         provides=FileManager,
         scope=Scope.APP,
     )
+    cache_registry = provide(CacheRegistry, provides=AnyOf[CacheRegistry, CacheMonitor], scope=Scope.APP)
+    pool_monitor = provide(PoolWaitMonitor, provides=AnyOf[PoolWaitMonitor, PoolMonitor], scope=Scope.APP)
+    ingestion_counters = provide(
+        IngestionCounters,
+        provides=AnyOf[IngestionCounters, IngestionMonitor],
+        scope=Scope.APP,
+    )
+    transactional_event_writer = provide(TransactionalEventWriter, scope=Scope.REQUEST)
 
     @provide(scope=Scope.APP)
     async def redis_client(
@@ -64,6 +101,98 @@ class AdapterProvider(Provider):
         )
         yield client
 
+    @provide(scope=Scope.APP)
+    def client_cache(
+        self,
+        redis: Redis,
+        registry: CacheRegistry,
+        config: CacheConfig,
+    ) -> AnyOf[TieredClientCache, ClientCache]:
+        return TieredClientCache(
+            redis,
+            registry,
+            maxsize=config.client_cache_size,
+            ttl=config.client_cache_ttl,
+            local_ttl=config.client_cache_local_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def relevance_cache(
+        self,
+        redis: Redis,
+        registry: CacheRegistry,
+        config: CacheConfig,
+    ) -> AnyOf[RedisRelevanceCache, RelevanceCache]:
+        return RedisRelevanceCache(redis, registry, ttl=config.relevance_cache_ttl)
+
+    @provide(scope=Scope.APP)
+    def swear_prefilter(self, registry: CacheRegistry, config: YaGPTConfig) -> LexiconPrefilter:
+        return LexiconPrefilter(registry, trust_clean=config.swear_prefilter_trust_clean)
+
+    @provide(scope=Scope.APP)
+    def swear_verdict_cache(self, redis: Redis, registry: CacheRegistry, config: CacheConfig) -> SwearVerdictCache:
+        return SwearVerdictCache(
+            redis,
+            registry,
+            local_size=config.swear_cache_size,
+            max_entries=config.swear_cache_redis_size,
+            ttl=config.swear_cache_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    async def current_day_cache(self, redis: Redis, config: CacheConfig) -> AsyncIterator[CurrentDayCache]:
+        cache = CurrentDayCache(redis, DAY_KEY, refresh_interval=config.day_refresh_interval)
+        cache.start()
+        yield cache
+        await cache.close()
+
+    @provide(scope=Scope.APP)
+    async def metrics_refresher(
+        self,
+        redis: Redis,
+        storage: KeyValueStorage,
+        router: ReplicaRouter,
+        config: CacheConfig,
+    ) -> AsyncIterator[MetricsRefresher]:
+        async def refresh() -> None:
+            session_factory = await router.get_session_factory()
+            async with session_factory() as session:
+                await RefreshMetrics(MetricsAlchemyGateway(session), storage).execute()
+
+        refresher = MetricsRefresher(redis, refresh, interval=config.metrics_refresh_interval)
+        if config.metrics_refresh_interval > 0:
+            refresher.start()
+        yield refresher
+        await refresher.close()
+
+    @provide(scope=Scope.APP)
+    async def campaign_index(self, session_factory: async_sessionmaker[AsyncSession]) -> CampaignIndex:
+        return await load_campaign_index(session_factory)
+
+    @provide(scope=Scope.APP)
+    async def batched_event_writer(
+        self,
+        config: IngestionConfig,
+        session_factory: async_sessionmaker[AsyncSession],
+        counters: IngestionCounters,
+    ) -> AsyncIterator[BatchedEventWriter]:
+        writer = BatchedEventWriter(
+            functools.partial(write_batch, session_factory),
+            counters,
+            batch_size=config.batch_size,
+            flush_interval=config.flush_interval_ms / 1000,
+        )
+        writer.start()
+        yield writer
+        await writer.close()
+
+    @provide(scope=Scope.REQUEST)
+    async def event_writer(self, config: IngestionConfig, container: AsyncContainer) -> EventWriter:
+        if config.batched:
+            return await container.get(BatchedEventWriter)
+
+        return await container.get(TransactionalEventWriter)
+
     @provide(scope=Scope.APP)
     async def client_session(self) -> AsyncIterator[ClientSession]:
         async with ClientSession() as session:
@@ -79,5 +208,7 @@ def adapter_provider() -> AdapterProvider:
         provides=AnyOf[AsyncSession, UoW],
         scope=Scope.REQUEST,
     )
+    provider.provide(get_replica_router, scope=Scope.APP)
+    provider.provide(get_read_only_session, scope=Scope.REQUEST)
 
     return provider
@@ -1,9 +1,12 @@
 from dishka import Provider, Scope, provide
 
 from crudik.adapters.config_loader import (
+    CacheConfig,
     Config,
     DBConnectionConfig,
+    DBPoolConfig,
     FilesConfig,
+    IngestionConfig,
     YaGPTConfig,
 )
 
@@ -19,6 +22,10 @@ class ConfigProvider(Provider):
     def db_connection(self, config: Config) -> DBConnectionConfig:
         return config.db_connection
 
+    @provide
+    def db_pool(self, config: Config) -> DBPoolConfig:
+        return config.db_pool
+
     @provide
     def minio(self, config: Config) -> FilesConfig:
         return config.minio
@@ -26,3 +33,11 @@ class ConfigProvider(Provider):
     @provide
     def gpt(self, config: Config) -> YaGPTConfig:
         return config.gpt
+
+    @provide
+    def ingestion(self, config: Config) -> IngestionConfig:
+        return config.ingestion
+
+    @provide
+    def cache(self, config: Config) -> CacheConfig:
+        return config.cache
@@ -1,34 +1,92 @@
 from dishka import Provider, Scope, provide
 
+from crudik.adapters.config_loader import CacheConfig
+from crudik.adapters.db.provider import ReadOnlySession
 from crudik.adapters.gateway.ad import AdAlchemyGateway
 from crudik.adapters.gateway.advertiser import AdvertiserAlchemyGateway
 from crudik.adapters.gateway.campaign import CampaignAlchemyGateway
-from crudik.adapters.gateway.client import ClientAlchemyGateway
-from crudik.adapters.gateway.day import DayRedisGateway
+from crudik.adapters.gateway.client import CachedClientGateway, ClientAlchemyGateway
+from crudik.adapters.gateway.counter import CounterAlchemyGateway
+from crudik.adapters.gateway.day import CachedDayGateway, DayRedisGateway
 from crudik.adapters.gateway.metrics import MetricsAlchemyGateway
-from crudik.adapters.gateway.relevance import RelevanceAlchemyGateway
+from crudik.adapters.gateway.relevance import CachedRelevanceGateway, RelevanceAlchemyGateway
+from crudik.application.advertiser.metrics import (
+    ExportAdvertiserDailyStat,
+    ProduceAdvertiserCampaignStats,
+    ProduceAdvertiserDailyStat,
+    ProduceAdvertiserStat,
+)
+from crudik.application.campaign.list import ListCampaigns
+from crudik.application.campaign.metrics import ProduceCampaignStat, ProduceCampaignStatDaily
+from crudik.application.common.cache_storage import KeyValueStorage
 from crudik.application.common.gateway.ad import AdGateway
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
 from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.gateway.counter import CounterGateway
 from crudik.application.common.gateway.current_day import DayGateway
 from crudik.application.common.gateway.metrics import MetricsGateway
 from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.metrics import ProduceMetrics
 
 
 class GatewayProvider(Provider):
     scope = Scope.REQUEST
 
-    client_gateway = provide(ClientAlchemyGateway, provides=ClientGateway)
+    client_alchemy_gateway = provide(ClientAlchemyGateway)
+    client_gateway = provide(CachedClientGateway, provides=ClientGateway)
     advertiser_gateway = provide(
         AdvertiserAlchemyGateway,
         provides=AdvertiserGateway,
     )
-    relevance_gateway = provide(
-        RelevanceAlchemyGateway,
-        provides=RelevanceGateway,
-    )
-    day_gateway = provide(DayRedisGateway, provides=DayGateway)
+    relevance_alchemy_gateway = provide(RelevanceAlchemyGateway)
+    relevance_gateway = provide(CachedRelevanceGateway, provides=RelevanceGateway)
+    day_redis_gateway = provide(DayRedisGateway)
+    day_gateway = provide(CachedDayGateway, provides=DayGateway)
     campaign_gateway = provide(CampaignAlchemyGateway, provides=CampaignGateway)
     ad_gateway = provide(AdAlchemyGateway, provides=AdGateway)
     metrics_gateway = provide(MetricsAlchemyGateway, provides=MetricsGateway)
+    counter_gateway = provide(CounterAlchemyGateway, provides=CounterGateway)
+
+    # read-only statistics and listings go to the replica when it is configured and fresh
+
+    @provide
+    def produce_campaign_stat(self, session: ReadOnlySession) -> ProduceCampaignStat:
+        return ProduceCampaignStat(CampaignAlchemyGateway(session))
+
+    @provide
+    def produce_campaign_stat_daily(self, session: ReadOnlySession) -> ProduceCampaignStatDaily:
+        return ProduceCampaignStatDaily(CampaignAlchemyGateway(session))
+
+    @provide
+    def produce_advertiser_stat(self, session: ReadOnlySession) -> ProduceAdvertiserStat:
+        return ProduceAdvertiserStat(AdvertiserAlchemyGateway(session))
+
+    @provide
+    def produce_advertiser_daily_stat(self, session: ReadOnlySession) -> ProduceAdvertiserDailyStat:
+        return ProduceAdvertiserDailyStat(AdvertiserAlchemyGateway(session))
+
+    @provide
+    def produce_advertiser_campaign_stats(self, session: ReadOnlySession) -> ProduceAdvertiserCampaignStats:
+        return ProduceAdvertiserCampaignStats(AdvertiserAlchemyGateway(session))
+
+    @provide
+    def export_advertiser_daily_stat(self, session: ReadOnlySession) -> ExportAdvertiserDailyStat:
+        return ExportAdvertiserDailyStat(AdvertiserAlchemyGateway(session))
+
+    @provide
+    def produce_metrics(
+        self,
+        session: ReadOnlySession,
+        storage: KeyValueStorage,
+        config: CacheConfig,
+    ) -> ProduceMetrics:
+        return ProduceMetrics(
+            MetricsAlchemyGateway(session),
+            storage,
+            refresh_ahead=config.metrics_refresh_interval > 0,
+        )
+
+    @provide
+    def list_campaigns(self, session: ReadOnlySession) -> ListCampaigns:
+        return ListCampaigns(CampaignAlchemyGateway(session), AdvertiserAlchemyGateway(session))
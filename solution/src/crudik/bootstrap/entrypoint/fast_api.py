@@ -9,6 +9,9 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from crudik.adapters.day_cache import CurrentDayCache
+from crudik.adapters.metrics_refresher import MetricsRefresher
+from crudik.application.common.campaign_index import CampaignIndex
 from crudik.bootstrap.di.container import get_async_container
 from crudik.presentation.http import include_exception_handlers, include_routers
 
@@ -38,6 +41,9 @@ log_config = {
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await app.state.dishka_container.get(CampaignIndex)
+    await app.state.dishka_container.get(CurrentDayCache)
+    await app.state.dishka_container.get(MetricsRefresher)
     yield
     await app.state.dishka_container.close()
 
@@ -4,13 +4,13 @@ from uuid import UUID
 import filetype  # type: ignore
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, UploadFile
+from fastapi import APIRouter, Response, UploadFile
 from pydantic import BaseModel
 
 from crudik.application.advertiser.read import ReadAdvertiser
 from crudik.application.advertiser.upsert import UpsertAdvertisers
 from crudik.application.campaign.attach_image import AttachImageToCampaign
-from crudik.application.campaign.create import CreateCampaign
+from crudik.application.campaign.create import CreateCampaign, CreateCampaigns
 from crudik.application.campaign.delete import DeleteCampaign
 from crudik.application.campaign.generate_ad_text import GenerateAdText
 from crudik.application.campaign.list import ListCampaigns
@@ -55,8 +55,10 @@ async def toggle_swears_check(data: ToggleSwearsCheckBody, swear_filter: FromDis
 async def bulk(
     command: FromDishka[UpsertAdvertisers],
     data: list[AdvertiserData],
+    returning: bool = True,  # noqa: FBT001, FBT002
 ) -> Sequence[Advertiser]:
-    return await command.execute(data)
+    """Without ``returning`` the stored rows are not read back, the response echoes the request."""
+    return await command.execute(data, returning=returning)
 
 
 @router.get("/{entry_id}")
@@ -80,6 +82,19 @@ async def create_campaign(
     return await command.execute(data, advertiser_id)
 
 
+@router.post(
+    "/{advertiser_id}/campaigns/bulk",
+    status_code=201,
+    response_model_exclude_none=True,
+)
+async def create_campaigns(
+    command: FromDishka[CreateCampaigns],
+    data: list[CampaignCreateData],
+    advertiser_id: UUID,
+) -> Sequence[CampaignData]:
+    return await command.execute(data, advertiser_id)
+
+
 @router.get("/{advertiser_id}/campaigns/generate")
 async def generate_ad_text(
     command: FromDishka[GenerateAdText],
@@ -168,11 +183,22 @@ async def upload_image(
 async def list_campaigns(
     command: FromDishka[ListCampaigns],
     advertiser_id: UUID,
+    response: Response,
     size: int | None = None,
     page: int | None = None,
+    cursor: str | None = None,
 ) -> Sequence[CampaignData]:
+    """Page through campaigns by page number or by the cursor from the X-Next-Cursor header.
+
+    A cursor takes precedence over the page number and stays fast on deep pages.
+    """
     pagination = Pagination(
         size=size,
         page=page,
+        cursor=cursor,
     )
-    return await command.execute(advertiser_id, pagination)
+    result = await command.execute(advertiser_id, pagination)
+    if result.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = result.next_cursor
+
+    return result.campaigns
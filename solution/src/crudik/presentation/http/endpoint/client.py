@@ -21,8 +21,10 @@ router = APIRouter(
 async def bulk(
     command: FromDishka[UpsertClients],
     data: list[ClientData],
+    returning: bool = True,  # noqa: FBT001, FBT002
 ) -> Sequence[Client]:
-    return await command.execute(data)
+    """Without ``returning`` the stored rows are not read back, the response echoes the request."""
+    return await command.execute(data, returning=returning)
 
 
 @router.get("/{entry_id}")
@@ -1,9 +1,16 @@
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from pydantic import ValidationError
+
+from crudik.application.data_model.relevance import RelevanceData, RelevanceImportResult, RelevanceImportRow
+from crudik.application.relevance.upsert import ImportRelevances, UpsertRelevance, UpsertRelevances
+from crudik.presentation.http.streaming import split_lines
 
-from crudik.application.data_model.relevance import RelevanceData
-from crudik.application.relevance.upsert import UpsertRelevance
+IMPORT_CHUNK_SIZE = 5000
 
 router = APIRouter(
     tags=["ML Scores"],
@@ -12,9 +19,93 @@ router = APIRouter(
 )
 
 
+def parse_row(line: int, raw: object) -> RelevanceImportRow:
+    try:
+        if isinstance(raw, str | bytes):
+            data = RelevanceData.model_validate_json(raw)
+        else:
+            data = RelevanceData.model_validate(raw)
+    except ValidationError as err:
+        error = err.errors()[0]
+        location = ".".join(str(each) for each in error["loc"])
+        return RelevanceImportRow(line, None, f"{location}: {error['msg']}" if location else error["msg"])
+
+    return RelevanceImportRow(line, data)
+
+
+async def ndjson_rows(request: Request) -> AsyncIterator[RelevanceImportRow]:
+    line = 0
+    async for raw in split_lines(request.stream()):
+        line += 1
+        if raw.strip():
+            yield parse_row(line, raw)
+
+
+async def json_list_rows(request: Request) -> AsyncIterator[RelevanceImportRow]:
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        items = None
+
+    if not isinstance(items, list):
+        yield RelevanceImportRow(1, None, "Body is not a JSON list")
+        return
+
+    for line, each in enumerate(items, start=1):
+        yield parse_row(line, each)
+
+
+async def chunked(rows: AsyncIterable[RelevanceImportRow]) -> AsyncIterator[Sequence[RelevanceImportRow]]:
+    chunk = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) == IMPORT_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
 @router.post("/")
 async def upsert(
     command: FromDishka[UpsertRelevance],
     data: RelevanceData,
 ) -> None:
     return await command.execute(data)
+
+
+@router.post("/bulk", status_code=204)
+async def bulk(
+    command: FromDishka[UpsertRelevances],
+    data: list[RelevanceData],
+) -> None:
+    return await command.execute(data)
+
+
+@router.post(
+    "/import",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": RelevanceData.model_json_schema()},
+                "application/json": {"schema": {"type": "array", "items": RelevanceData.model_json_schema()}},
+            },
+        },
+    },
+)
+async def import_scores(
+    request: Request,
+    command: FromDishka[ImportRelevances],
+) -> RelevanceImportResult:
+    """Upsert scores sent as NDJSON, read while the body streams in, or as a JSON list.
+
+    Rows are numbered from one, by line in NDJSON and by position in a list.
+    Rows that are malformed or refer to a missing client or advertiser are
+    reported in ``rejected``, the others are stored.
+    """
+    if request.headers.get("content-type", "").startswith("application/json"):
+        return await command.execute(chunked(json_list_rows(request)))
+
+    return await command.execute(chunked(ndjson_rows(request)))
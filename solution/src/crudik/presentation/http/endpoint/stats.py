@@ -1,15 +1,31 @@
 from collections.abc import Sequence
+from typing import Annotated
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
 
-from crudik.application.advertiser.metrics import ProduceAdvertiserDailyStat, ProduceAdvertiserStat
+from crudik.application.advertiser.metrics import (
+    ExportAdvertiserDailyStat,
+    ProduceAdvertiserCampaignStats,
+    ProduceAdvertiserDailyStat,
+    ProduceAdvertiserStat,
+)
 from crudik.application.campaign.metrics import ProduceCampaignStat, ProduceCampaignStatDaily
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily
-from crudik.application.data_model.metrics import ServiceMetrics
-from crudik.application.metrics import ProduceMetrics
+from crudik.application.data_model.campaign import (
+    AdvertiserCampaignStat,
+    CampaignStat,
+    CampaignStatDaily,
+    CampaignStatDailyRow,
+    CampaignStatSort,
+    SortOrder,
+)
+from crudik.application.data_model.common import Pagination
+from crudik.application.data_model.metrics import CacheStat, IngestionStat, PoolStat, ServiceMetrics
+from crudik.application.metrics import ProduceCacheStats, ProduceIngestionStats, ProduceMetrics, ProducePoolStats
+from crudik.presentation.http.streaming import MEDIA_TYPES, ExportFormat, encode_chunks
 
 router = APIRouter(
     tags=["Statistics"],
@@ -36,14 +52,60 @@ async def produce_advertiser_stat(advertiser_id: UUID, command: FromDishka[Produ
     return await command.execute(advertiser_id)
 
 
+@router.get("/advertisers/{advertiser_id}/campaigns/breakdown")
+async def produce_advertiser_campaign_stats(
+    advertiser_id: UUID,
+    command: FromDishka[ProduceAdvertiserCampaignStats],
+    size: int | None = None,
+    page: int | None = None,
+    sort: CampaignStatSort = CampaignStatSort.SPENT_TOTAL,
+    order: SortOrder = SortOrder.DESC,
+) -> Sequence[AdvertiserCampaignStat]:
+    """Stats of every campaign of the advertiser, for dashboards listing campaigns by spend or conversion."""
+    pagination = Pagination(
+        size=size,
+        page=page,
+    )
+    return await command.execute(advertiser_id, pagination, sort, order)
+
+
 @router.get("/static")
 async def produce_service_metrics_static(command: FromDishka[ProduceMetrics]) -> ServiceMetrics:
     return await command.execute()
 
 
+@router.get("/caches")
+async def produce_cache_stats(command: FromDishka[ProduceCacheStats]) -> Sequence[CacheStat]:
+    return await command.execute()
+
+
+@router.get("/pool")
+async def produce_pool_stats(command: FromDishka[ProducePoolStats]) -> PoolStat:
+    return await command.execute()
+
+
+@router.get("/ingestion")
+async def produce_ingestion_stats(command: FromDishka[ProduceIngestionStats]) -> IngestionStat:
+    return await command.execute()
+
+
 @router.get("/advertisers/{advertiser_id}/campaigns/daily")
 async def produce_advertiser_stat_daily(
     advertiser_id: UUID,
     command: FromDishka[ProduceAdvertiserDailyStat],
 ) -> Sequence[CampaignStatDaily]:
     return await command.execute(advertiser_id)
+
+
+@router.get("/advertisers/{advertiser_id}/campaigns/daily/export", response_class=StreamingResponse)
+async def export_advertiser_stat_daily(
+    advertiser_id: UUID,
+    command: FromDishka[ExportAdvertiserDailyStat],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    """Stream per campaign per day stats of the advertiser as NDJSON or CSV."""
+    chunks = await command.execute(advertiser_id)
+    return StreamingResponse(
+        encode_chunks(export_format, CampaignStatDailyRow, chunks),
+        media_type=MEDIA_TYPES[export_format],
+    )
@@ -23,6 +23,7 @@ from crudik.application.exceptions.campaign import (
     CampaignDoesNotExistsError,
     CannotChangeCampaignAfterStartError,
     ClickLimitGreaterThanImpressionsLimitError,
+    InvalidCampaignCursorError,
 )
 from crudik.application.exceptions.client import ClientDoesNotExistsError
 from crudik.application.exceptions.day import CannotSetDayInPastError
@@ -56,6 +57,7 @@ error_code = {
     CannotCheckSwearsError: 408,
     ClickLimitGreaterThanImpressionsLimitError: 422,
     TextGenerationError: 418,
+    InvalidCampaignCursorError: 422,
 }
 
 error_message = {
@@ -80,6 +82,7 @@ error_message = {
     CannotCheckSwearsError: "Cannot check for swears!",
     ClickLimitGreaterThanImpressionsLimitError: "Click limit cannot be greater than impressions limit!",
     TextGenerationError: "Text generation error!",
+    InvalidCampaignCursorError: "Invalid pagination cursor!",
 }
 
 
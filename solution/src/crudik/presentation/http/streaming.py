@@ -0,0 +1,62 @@
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def encode_ndjson(chunks: AsyncIterator[Sequence[BaseModel]]) -> AsyncIterator[str]:
+    async for chunk in chunks:
+        yield "".join(f"{each.model_dump_json()}\n" for each in chunk)
+
+
+async def encode_csv(fields: Sequence[str], chunks: AsyncIterator[Sequence[BaseModel]]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fields)
+    writer.writeheader()
+
+    async for chunk in chunks:
+        writer.writerows(each.model_dump(mode="json") for each in chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # the header of an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def encode_chunks(
+    export_format: ExportFormat,
+    model: type[BaseModel],
+    chunks: AsyncIterator[Sequence[BaseModel]],
+) -> AsyncIterator[str]:
+    if export_format == ExportFormat.CSV:
+        return encode_csv(list(model.model_fields), chunks)
+
+    return encode_ndjson(chunks)
+
+
+async def split_lines(body: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield the lines of a streamed body, a line may span any number of body chunks."""
+    tail = b""
+    async for chunk in body:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line
+
+    if tail:
+        yield tail
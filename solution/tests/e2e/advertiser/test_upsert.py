@@ -1,8 +1,11 @@
+from uuid import uuid4
+
 import pytest
 from aiohttp import ClientSession
 
+from crudik.adapters.gateway.bulk import COPY_THRESHOLD
 from tests.e2e.models import AdvertiserModel
-from tests.e2e.status import CREATED
+from tests.e2e.status import CREATED, OK
 
 
 async def test_bulk_create(
@@ -63,3 +66,23 @@ async def test_duplicate_ids(
         assert response.status == CREATED
         assert len(result) == 1
         assert result[0] == duplicate_id_data[-1]
+
+
+async def test_bulk_create_copy(
+    http_session: ClientSession,
+    url: str,
+) -> None:
+    endpoint = f"{url}/advertisers/bulk"
+    advertisers = [
+        AdvertiserModel(advertiser_id=uuid4(), name=f"advertiser {number}") for number in range(COPY_THRESHOLD)
+    ]
+    async with http_session.post(
+        endpoint,
+        params={"returning": "false"},
+        json=[each.model_dump(mode="json") for each in advertisers],
+    ) as response:
+        assert response.status == CREATED
+        assert [AdvertiserModel(**each) for each in await response.json()] == advertisers
+
+    async with http_session.get(f"{url}/advertisers/{advertisers[-1].advertiser_id}") as response:
+        assert response.status == OK
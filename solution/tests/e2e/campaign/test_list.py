@@ -137,3 +137,52 @@ async def test_list_invalid(
 
     async with http_session.get(endpoint) as response:
         assert response.status == UNPROCESSABLE_ENTITY
+
+
+async def test_list_by_cursor(
+    http_session: ClientSession,
+    url: str,
+    campaign_valid_data: CampaignCreateModel,
+    unique_advertiser: AdvertiserModel,
+    image: tuple[Path, str],
+) -> None:
+    advertiser_id = unique_advertiser.advertiser_id
+    requests = [
+        create_campaign_with_image(
+            http_session,
+            url,
+            str(advertiser_id),
+            campaign_valid_data,
+            *image,
+        )
+        for _ in range(COUNT_CAMPAIGNS)
+    ]
+    campaigns_unsorted = await asyncio.gather(*requests)
+    campaigns = sorted(
+        campaigns_unsorted,
+        key=lambda c: (c.ad_title, c.campaign_id),
+    )
+
+    size = COUNT_CAMPAIGNS // 3
+    endpoint = f"{url}/advertisers/{advertiser_id}/campaigns?size={size}"
+    results: list[CampaignModel] = []
+    cursor: str | None = ""
+    while cursor is not None:
+        async with http_session.get(endpoint, params={"cursor": cursor} if cursor else None) as response:
+            assert response.status == OK
+            results.extend(CampaignModel(**each) for each in await response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+
+    assert results == campaigns
+
+
+async def test_list_invalid_cursor(
+    http_session: ClientSession,
+    url: str,
+    unique_advertiser: AdvertiserModel,
+) -> None:
+    advertiser_id = unique_advertiser.advertiser_id
+    endpoint = f"{url}/advertisers/{advertiser_id}/campaigns?size=1&cursor=broken"
+
+    async with http_session.get(endpoint) as response:
+        assert response.status == UNPROCESSABLE_ENTITY
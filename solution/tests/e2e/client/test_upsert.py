@@ -1,8 +1,11 @@
+from uuid import uuid4
+
 import pytest
 from aiohttp import ClientSession
 
-from tests.e2e.models import ClientModel
-from tests.e2e.status import CREATED, UNPROCESSABLE_ENTITY
+from crudik.adapters.gateway.bulk import COPY_THRESHOLD
+from tests.e2e.models import ClientGenderModel, ClientModel
+from tests.e2e.status import CREATED, OK, UNPROCESSABLE_ENTITY
 
 INVALID_CASES = [
     {"age": -1},
@@ -90,3 +93,50 @@ async def test_duplicate_ids(
         result = [ClientModel(**each) for each in await response.json()]
         assert len(result) == 1
         assert result[0] == duplicate_id_data[-1]
+
+
+async def test_bulk_create_without_returning(
+    http_session: ClientSession,
+    url: str,
+    valid_client_data: list[ClientModel],
+) -> None:
+    endpoint = f"{url}/clients/bulk"
+    async with http_session.post(
+        endpoint,
+        params={"returning": "false"},
+        json=[each.model_dump(mode="json") for each in valid_client_data],
+    ) as response:
+        assert response.status == CREATED
+        result = [ClientModel(**each) for each in await response.json()]
+        assert result == valid_client_data
+
+    async with http_session.get(f"{url}/clients/{valid_client_data[0].client_id}") as response:
+        assert response.status == OK
+
+
+async def test_bulk_create_copy(
+    http_session: ClientSession,
+    url: str,
+) -> None:
+    endpoint = f"{url}/clients/bulk"
+    clients = [
+        ClientModel(
+            client_id=uuid4(),
+            login=f"user{number}",
+            age=number % 100,
+            location="Москва",
+            gender=ClientGenderModel.FEMALE,
+        )
+        for number in range(COPY_THRESHOLD)
+    ]
+    async with http_session.post(
+        endpoint,
+        json=[each.model_dump(mode="json") for each in clients],
+    ) as response:
+        assert response.status == CREATED
+        result = [ClientModel(**each) for each in await response.json()]
+        assert sorted(result, key=lambda each: each.login) == sorted(clients, key=lambda each: each.login)
+
+    async with http_session.get(f"{url}/clients/{clients[-1].client_id}") as response:
+        assert response.status == OK
+        assert ClientModel(**await response.json()) == clients[-1]
@@ -13,8 +13,12 @@ from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from crudik.adapters.client_cache import CLIENT_KEY_PREFIX
 from crudik.adapters.gateway.day import DAY_KEY
-from crudik.adapters.swear_filter import CACHE_SWEARS_KEY, ENABLED_KEY
+from crudik.adapters.relevance_cache import RELEVANCE_KEY_PREFIX, RELEVANCE_VERSION_KEY_PREFIX
+from crudik.adapters.swear_cache import SWEAR_INDEX_KEY, SWEAR_KEY_PREFIX
+from crudik.adapters.swear_filter import ENABLED_KEY
+from crudik.application.metrics import METRICS_CACHE_KEY
 from crudik.bootstrap.di.container import get_async_container
 from tests.e2e.models import (
     AdModel,
@@ -77,7 +81,10 @@ async def gracefully_teardown(
     await session.commit()
     await redis.set(DAY_KEY, "0")
     await redis.set(ENABLED_KEY, "0")
-    await redis.set(CACHE_SWEARS_KEY, "{}")
+    await redis.delete(SWEAR_INDEX_KEY, METRICS_CACHE_KEY)
+    for prefix in (CLIENT_KEY_PREFIX, RELEVANCE_KEY_PREFIX, RELEVANCE_VERSION_KEY_PREFIX, SWEAR_KEY_PREFIX):
+        async for key in redis.scan_iter(f"{prefix}*"):
+            await redis.delete(key)
 
 
 @pytest.fixture
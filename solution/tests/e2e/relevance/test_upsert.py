@@ -4,7 +4,7 @@ import pytest
 from aiohttp import ClientSession
 
 from tests.e2e.models import AdvertiserModel, ClientModel, RelevanceModel
-from tests.e2e.status import NOT_FOUND, OK, UNPROCESSABLE_ENTITY
+from tests.e2e.status import NO_CONTENT, NOT_FOUND, OK, UNPROCESSABLE_ENTITY
 
 
 @pytest.fixture
@@ -96,3 +96,75 @@ async def test_create_with_nonexistent_advertiser_id(
         json=valid_relevance_entry.model_dump(mode="json"),
     ) as response:
         assert response.status == NOT_FOUND
+
+
+async def test_bulk(
+    http_session: ClientSession,
+    url: str,
+    created_clients: list[ClientModel],
+    created_advertisers: list[AdvertiserModel],
+) -> None:
+    endpoint = f"{url}/ml-scores/bulk"
+    entries = [
+        RelevanceModel(client_id=client.client_id, advertiser_id=advertiser.advertiser_id, score=5)
+        for client in created_clients
+        for advertiser in created_advertisers
+    ]
+    async with http_session.post(
+        endpoint,
+        json=[each.model_dump(mode="json") for each in entries],
+    ) as response:
+        assert response.status == NO_CONTENT
+
+
+async def test_bulk_not_found(
+    http_session: ClientSession,
+    url: str,
+    valid_relevance_entry: RelevanceModel,
+) -> None:
+    endpoint = f"{url}/ml-scores/bulk"
+    unknown = valid_relevance_entry.model_copy(update={"client_id": uuid4()})
+    async with http_session.post(
+        endpoint,
+        json=[valid_relevance_entry.model_dump(mode="json"), unknown.model_dump(mode="json")],
+    ) as response:
+        assert response.status == NOT_FOUND
+
+
+async def test_import_ndjson(
+    http_session: ClientSession,
+    url: str,
+    valid_relevance_entry: RelevanceModel,
+) -> None:
+    endpoint = f"{url}/ml-scores/import"
+    unknown = valid_relevance_entry.model_copy(update={"advertiser_id": uuid4()})
+    lines = [valid_relevance_entry.model_dump_json(), "", '{"client_id": "not an id"}', unknown.model_dump_json()]
+    body = "\n".join(lines)
+    async with http_session.post(
+        endpoint,
+        data=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    ) as response:
+        assert response.status == OK
+        result = await response.json()
+
+    assert result["accepted"] == 1
+    assert [each["line"] for each in result["rejected"]] == [3, 4]
+    assert result["rejected"][1]["reason"] == "Advertiser does not exists"
+
+
+async def test_import_json_list(
+    http_session: ClientSession,
+    url: str,
+    valid_relevance_entry: RelevanceModel,
+) -> None:
+    endpoint = f"{url}/ml-scores/import"
+    unknown = valid_relevance_entry.model_copy(update={"client_id": uuid4()})
+    async with http_session.post(
+        endpoint,
+        json=[unknown.model_dump(mode="json"), valid_relevance_entry.model_dump(mode="json")],
+    ) as response:
+        assert response.status == OK
+        result = await response.json()
+
+    assert result == {"accepted": 1, "rejected": [{"line": 1, "reason": "Client does not exists"}]}
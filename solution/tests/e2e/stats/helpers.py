@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+# stat of a campaign straight from its events, what its counters must add up to;
+# one aggregate per table, count and sum come from the same scan
+EVENTS_STAT_QUERY = text(
+    """
+    SELECT
+        impressions.count,
+        clicks.count,
+        coalesce(clicks.count / nullif(impressions.count, 0)::numeric * 100, 0.0),
+        coalesce(impressions.spent, 0.0),
+        coalesce(clicks.spent, 0.0),
+        coalesce(impressions.spent, 0.0) + coalesce(clicks.spent, 0.0)
+    FROM campaign
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS count, sum(cost_per_impression) AS spent
+        FROM impression WHERE ad_id = campaign.campaign_id
+    ) AS impressions
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS count, sum(cost_per_click) AS spent
+        FROM click WHERE ad_id = campaign.campaign_id
+    ) AS clicks
+    WHERE campaign.campaign_id = :campaign_id
+    """,
+)
@@ -0,0 +1,156 @@
+from uuid import uuid4
+
+import pytest
+from aiohttp import ClientSession
+
+from tests.e2e.conftest import click_campaign, create_campaign, create_unique_client, show_campaign
+from tests.e2e.models import (
+    AdvertiserModel,
+    CampaignCreateModel,
+    CampaignModel,
+    ClientGenderModel,
+    ClientModel,
+    TargetingGenderModel,
+    TargetingModel,
+)
+from tests.e2e.status import CREATED, NOT_FOUND, OK, UNPROCESSABLE_ENTITY
+
+
+async def test_not_found(
+    http_session: ClientSession,
+    url: str,
+) -> None:
+    endpoint = f"{url}/stats/advertisers/{uuid4()}/campaigns/breakdown"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == NOT_FOUND
+
+
+async def test_invalid_sort(
+    http_session: ClientSession,
+    url: str,
+    unique_advertiser: AdvertiserModel,
+) -> None:
+    endpoint = f"{url}/stats/advertisers/{unique_advertiser.advertiser_id}/campaigns/breakdown?sort=title"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == UNPROCESSABLE_ENTITY
+
+
+async def test_stats(
+    http_session: ClientSession,
+    url: str,
+    created_campaign: CampaignModel,
+) -> None:
+    client = await create_unique_client(http_session, url)
+    await show_campaign(http_session, url, client.client_id)
+    await click_campaign(http_session, url, client.client_id, created_campaign.campaign_id)
+    endpoint = f"{url}/stats/advertisers/{created_campaign.advertiser_id}/campaigns/breakdown"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == OK
+        rows = await r.json()
+
+    assert len(rows) == 1
+    assert rows[0]["campaign_id"] == str(created_campaign.campaign_id)
+    assert rows[0]["impressions_count"] == 1
+    assert rows[0]["clicks_count"] == 1
+    assert rows[0]["conversion"] == rows[0]["clicks_count"] / rows[0]["impressions_count"] * 100
+    assert rows[0]["spent_total"] == created_campaign.cost_per_impression + created_campaign.cost_per_click
+
+
+async def seed_campaign(
+    http_session: ClientSession,
+    url: str,
+    advertiser: AdvertiserModel,
+    data: CampaignCreateModel,
+    impressions: int,
+    clicks: int,
+) -> str:
+    """Create a campaign shown only in a location of its own, show and click it to that many clients there."""
+    location = f"Город {uuid4()}"
+    targeting = TargetingModel(age_from=0, age_to=100, location=location, gender=TargetingGenderModel.ALL)
+    data = data.model_copy(update={"targeting": targeting})
+    campaign = await create_campaign(http_session, url, str(advertiser.advertiser_id), data)
+
+    clients = [
+        ClientModel(client_id=uuid4(), login="some", age=25, location=location, gender=ClientGenderModel.MALE)
+        for _ in range(impressions)
+    ]
+    async with http_session.post(f"{url}/clients/bulk", json=[each.model_dump(mode="json") for each in clients]) as r:
+        assert r.status == CREATED
+
+    for number, client in enumerate(clients):
+        ad = await show_campaign(http_session, url, client.client_id)
+        assert ad.ad_id == campaign.campaign_id
+        if number < clicks:
+            await click_campaign(http_session, url, client.client_id, campaign.campaign_id)
+
+    return str(campaign.campaign_id)
+
+
+@pytest.fixture
+async def seeded_campaigns(
+    http_session: ClientSession,
+    url: str,
+    unique_advertiser: AdvertiserModel,
+    campaign_valid_data: CampaignCreateModel,
+) -> list[str]:
+    """Campaigns ordered by spent_total descending: 2 * 1 + 50, 3 * 5 + 3 * 1 and 10."""
+    costs = [(1.0, 50.0, 2, 1), (5.0, 1.0, 3, 3), (10.0, 5.0, 1, 0)]
+    return [
+        await seed_campaign(
+            http_session,
+            url,
+            unique_advertiser,
+            campaign_valid_data.model_copy(update={"cost_per_impression": per_impression, "cost_per_click": per_click}),
+            impressions,
+            clicks,
+        )
+        for per_impression, per_click, impressions, clicks in costs
+    ]
+
+
+async def list_breakdown(
+    http_session: ClientSession,
+    url: str,
+    advertiser: AdvertiserModel,
+    **params: str | int,
+) -> list[str]:
+    endpoint = f"{url}/stats/advertisers/{advertiser.advertiser_id}/campaigns/breakdown"
+
+    async with http_session.get(endpoint, params=params) as r:
+        assert r.status == OK
+        return [row["campaign_id"] for row in await r.json()]
+
+
+async def test_sorted(
+    http_session: ClientSession,
+    url: str,
+    unique_advertiser: AdvertiserModel,
+    seeded_campaigns: list[str],
+) -> None:
+    by_spent = await list_breakdown(http_session, url, unique_advertiser, sort="spent_total", order="desc")
+    by_spent_asc = await list_breakdown(http_session, url, unique_advertiser, sort="spent_total", order="asc")
+    by_conversion = await list_breakdown(http_session, url, unique_advertiser, sort="conversion", order="desc")
+    by_spent_clicks = await list_breakdown(http_session, url, unique_advertiser, sort="spent_clicks", order="asc")
+
+    first, second, third = seeded_campaigns
+    assert by_spent == [first, second, third]
+    assert by_spent_asc == [third, second, first]
+    assert by_conversion == [second, first, third]
+    assert by_spent_clicks == [third, second, first]
+
+
+async def test_paginated(
+    http_session: ClientSession,
+    url: str,
+    unique_advertiser: AdvertiserModel,
+    seeded_campaigns: list[str],
+) -> None:
+    pages = [
+        await list_breakdown(http_session, url, unique_advertiser, size=1, page=page, sort="spent_total", order="desc")
+        for page in range(4)
+    ]
+
+    assert pages == [[each] for each in seeded_campaigns] + [[]]
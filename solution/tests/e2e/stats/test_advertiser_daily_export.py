@@ -0,0 +1,70 @@
+import csv
+import json
+from uuid import uuid4
+
+from aiohttp import ClientSession
+
+from tests.e2e.conftest import create_unique_client, show_campaign
+from tests.e2e.models import CampaignModel
+from tests.e2e.status import NOT_FOUND, OK
+
+
+async def test_empty(
+    http_session: ClientSession,
+    url: str,
+    created_campaign: CampaignModel,
+) -> None:
+    endpoint = f"{url}/stats/advertisers/{created_campaign.advertiser_id}/campaigns/daily/export"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == OK
+        assert await r.text() == ""
+
+
+async def test_not_found(
+    http_session: ClientSession,
+    url: str,
+) -> None:
+    endpoint = f"{url}/stats/advertisers/{uuid4()}/campaigns/daily/export"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == NOT_FOUND
+
+
+async def test_ndjson(
+    http_session: ClientSession,
+    url: str,
+    created_campaign: CampaignModel,
+) -> None:
+    client = await create_unique_client(http_session, url)
+    await show_campaign(http_session, url, client.client_id)
+    endpoint = f"{url}/stats/advertisers/{created_campaign.advertiser_id}/campaigns/daily/export?format=ndjson"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == OK
+        assert r.content_type == "application/x-ndjson"
+        rows = [json.loads(line) for line in (await r.text()).splitlines()]
+
+    assert len(rows) == 1
+    assert rows[0]["campaign_id"] == str(created_campaign.campaign_id)
+    assert rows[0]["impressions_count"] == 1
+    assert rows[0]["spent_impressions"] == created_campaign.cost_per_impression
+
+
+async def test_csv(
+    http_session: ClientSession,
+    url: str,
+    created_campaign: CampaignModel,
+) -> None:
+    client = await create_unique_client(http_session, url)
+    await show_campaign(http_session, url, client.client_id)
+    endpoint = f"{url}/stats/advertisers/{created_campaign.advertiser_id}/campaigns/daily/export?format=csv"
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == OK
+        assert r.content_type == "text/csv"
+        rows = list(csv.DictReader((await r.text()).splitlines()))
+
+    assert len(rows) == 1
+    assert rows[0]["campaign_id"] == str(created_campaign.campaign_id)
+    assert int(rows[0]["impressions_count"]) == 1
@@ -2,9 +2,12 @@ from uuid import uuid4
 
 import pytest
 from aiohttp import ClientSession
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from crudik.application.data_model.campaign import CampaignStat, retort_campaign_stat_from_list
 from tests.e2e.conftest import click_campaign, create_unique_client, delete_campaign, show_campaign, update_campaign
 from tests.e2e.models import CampaignModel, StatsModel
+from tests.e2e.stats.helpers import EVENTS_STAT_QUERY
 from tests.e2e.status import NOT_FOUND, OK
 
 
@@ -143,3 +146,25 @@ async def test_update_costs(
         assert r.status == OK
         result = StatsModel(**(await r.json()))
         assert result == expected_stat
+
+
+async def test_stats_match_events(
+    http_session: ClientSession,
+    url: str,
+    session: AsyncSession,
+    created_campaign: CampaignModel,
+) -> None:
+    endpoint = f"{url}/stats/campaigns/{created_campaign.campaign_id}"
+    for clicked in (True, True, False):
+        client = await create_unique_client(http_session, url)
+        await show_campaign(http_session, url, client.client_id)
+        if clicked:
+            await click_campaign(http_session, url, client.client_id, created_campaign.campaign_id)
+
+    row = (await session.execute(EVENTS_STAT_QUERY, {"campaign_id": created_campaign.campaign_id})).one()
+    expected_stat = retort_campaign_stat_from_list.load(row, CampaignStat)
+
+    async with http_session.get(endpoint) as r:
+        assert r.status == OK
+        result = CampaignStat(**(await r.json()))
+        assert result == expected_stat
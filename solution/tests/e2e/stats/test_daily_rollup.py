@@ -0,0 +1,81 @@
+from typing import Any
+
+from aiohttp import ClientSession
+from sqlalchemy import TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crudik.adapters.gateway.counter import rebuild_daily_stats
+from tests.e2e.conftest import click_campaign, create_unique_client, show_campaign
+from tests.e2e.models import CampaignModel
+
+DAILY_FROM_EVENTS = text(
+    """
+    SELECT
+        coalesce(impressions.ad_id, clicks.ad_id) AS campaign_id,
+        coalesce(impressions.day, clicks.day) AS day,
+        coalesce(impressions.count, 0),
+        coalesce(clicks.count, 0),
+        coalesce(impressions.spent, 0),
+        coalesce(clicks.spent, 0)
+    FROM (
+        SELECT ad_id, day, count(*) AS count, sum(cost_per_impression) AS spent
+        FROM impression GROUP BY ad_id, day
+    ) AS impressions
+    FULL JOIN (
+        SELECT ad_id, day, count(*) AS count, sum(cost_per_click) AS spent
+        FROM click GROUP BY ad_id, day
+    ) AS clicks ON clicks.ad_id = impressions.ad_id AND clicks.day = impressions.day
+    ORDER BY campaign_id, day
+    """,
+)
+DAILY_ROLLUP = text(
+    """
+    SELECT campaign_id, day, impressions, clicks, spent_impressions, spent_clicks
+    FROM campaign_daily_stats
+    ORDER BY campaign_id, day
+    """,
+)
+
+
+async def record_events(http_session: ClientSession, url: str, campaign: CampaignModel) -> None:
+    """Every day one more client is shown the campaign, every other one of them clicks it."""
+    for day in range(3):
+        await http_session.post(f"{url}/time/advance", json={"current_date": day})
+        for number in range(day + 1):
+            client = await create_unique_client(http_session, url)
+            await show_campaign(http_session, url, client.client_id)
+            if number % 2 == 0:
+                await click_campaign(http_session, url, client.client_id, campaign.campaign_id)
+
+
+async def fetch(session: AsyncSession, query: TextClause) -> list[tuple[Any, ...]]:
+    return [tuple(row) for row in (await session.execute(query)).all()]
+
+
+async def test_increment(
+    http_session: ClientSession,
+    url: str,
+    session: AsyncSession,
+    created_campaign: CampaignModel,
+) -> None:
+    await record_events(http_session, url, created_campaign)
+
+    expected = await fetch(session, DAILY_FROM_EVENTS)
+    assert len(expected) == 3  # noqa: PLR2004
+    assert await fetch(session, DAILY_ROLLUP) == expected
+
+
+async def test_rebuild(
+    http_session: ClientSession,
+    url: str,
+    session: AsyncSession,
+    created_campaign: CampaignModel,
+) -> None:
+    await record_events(http_session, url, created_campaign)
+    await session.execute(text("UPDATE campaign_daily_stats SET impressions = 0, spent_clicks = 0"))
+    await session.commit()
+
+    await rebuild_daily_stats(session)
+    await session.commit()
+
+    assert await fetch(session, DAILY_ROLLUP) == await fetch(session, DAILY_FROM_EVENTS)
@@ -0,0 +1,79 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from aiohttp import ClientSession
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from crudik.application.data_model.metrics import ServiceMetrics
+from tests.e2e.conftest import click_campaign, create_campaign, delete_campaign, show_campaign
+from tests.e2e.models import AdvertiserModel, CampaignCreateModel, ClientGenderModel, ClientModel
+from tests.e2e.status import CREATED, OK
+
+# the metrics as they were computed before the sharded counters, over the whole tables
+FULL_TABLE_METRICS = text(
+    """
+    SELECT
+        (SELECT count(*) FROM impression) AS impressions_count,
+        (SELECT count(*) FROM click) AS clicks_count,
+        (SELECT count(*) FROM advertiser) AS advertisers_count,
+        (SELECT count(*) FROM client) AS clients_count,
+        (SELECT count(*) FROM campaign) AS campaigns_count,
+        (SELECT coalesce(sum(cost_per_impression), 0) FROM impression) AS income_impressions,
+        (SELECT coalesce(sum(cost_per_click), 0) FROM click) AS income_clicks
+    """,
+)
+
+
+async def upsert(http_session: ClientSession, url: str, path: str, data: list[Any], *, returning: bool) -> None:
+    endpoint = f"{url}/{path}/bulk?returning={str(returning).lower()}"
+    async with http_session.post(endpoint, json=[each.model_dump(mode="json") for each in data]) as r:
+        assert r.status == CREATED
+
+
+async def test_match_full_tables(
+    http_session: ClientSession,
+    url: str,
+    session: AsyncSession,
+    campaign_valid_data: CampaignCreateModel,
+) -> None:
+    advertisers = [AdvertiserModel(advertiser_id=uuid4(), name=f"advertiser {number}") for number in range(3)]
+    clients = [
+        ClientModel(
+            client_id=uuid4(),
+            login=f"client {number}",
+            age=25,
+            location="Москва",
+            gender=ClientGenderModel.MALE,
+        )
+        for number in range(4)
+    ]
+    # repeated upserts update the rows they inserted, only new rows are counted
+    for returning in (True, False):
+        await upsert(http_session, url, "advertisers", advertisers, returning=returning)
+        await upsert(http_session, url, "clients", clients, returning=returning)
+
+    campaigns = [
+        await create_campaign(http_session, url, str(advertiser.advertiser_id), campaign_valid_data)
+        for advertiser in advertisers
+    ]
+    await delete_campaign(http_session, url, str(campaigns[-1].advertiser_id), str(campaigns[-1].campaign_id))
+    for number, client in enumerate(clients):
+        ad = await show_campaign(http_session, url, client.client_id)
+        await show_campaign(http_session, url, client.client_id)
+        if number % 2 == 0:
+            await click_campaign(http_session, url, client.client_id, ad.ad_id)
+            await click_campaign(http_session, url, client.client_id, ad.ad_id)
+
+    row = {name: float(value) for name, value in (await session.execute(FULL_TABLE_METRICS)).one()._asdict().items()}
+
+    async with http_session.get(f"{url}/stats/static") as r:
+        assert r.status == OK
+        metrics = ServiceMetrics(**(await r.json()))
+
+    assert row["impressions_count"] > 0
+    assert row["clicks_count"] > 0
+    assert metrics.model_dump(exclude={"conversion", "income_total"}) == pytest.approx(row)
+    assert metrics.conversion == pytest.approx(row["clicks_count"] / row["impressions_count"] * 100)
+    assert metrics.income_total == pytest.approx(row["income_impressions"] + row["income_clicks"])
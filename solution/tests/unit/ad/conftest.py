@@ -0,0 +1,43 @@
+import pytest
+
+from crudik.application.ad.click import ClickAd
+from crudik.application.ad.show_ad import ShowAd
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.event_writer import EventWriter
+from crudik.application.common.gateway.ad import AdGateway
+from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.gateway.current_day import DayGateway
+from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.common.uow import UoW
+
+
+@pytest.fixture
+def show_ad(
+    client_gateway: ClientGateway,
+    day_gateway: DayGateway,
+    ad_gateway: AdGateway,
+    campaign_index: CampaignIndex,
+    event_writer: EventWriter,
+    relevance_gateway: RelevanceGateway,
+) -> ShowAd:
+    return ShowAd(
+        client_gateway,
+        day_gateway,
+        ad_gateway,
+        campaign_index,
+        event_writer,
+        relevance_gateway,
+    )
+
+
+@pytest.fixture
+def click_ad(
+    campaign_gateway: CampaignGateway,
+    ad_gateway: AdGateway,
+    client_gateway: ClientGateway,
+    day_gateway: DayGateway,
+    event_writer: EventWriter,
+    uow: UoW,
+) -> ClickAd:
+    return ClickAd(campaign_gateway, ad_gateway, client_gateway, day_gateway, event_writer, uow)
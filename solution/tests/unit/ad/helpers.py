@@ -0,0 +1,31 @@
+from typing import Any
+from uuid import uuid4
+
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import convert_campaign_to_candidate
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.campaign import Campaign
+
+
+def add_campaign(
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    advertiser: Advertiser,
+    **params: Any,
+) -> Campaign:
+    data: dict[str, Any] = {
+        "impressions_limit": 100,
+        "clicks_limit": 100,
+        "cost_per_impression": 10.0,
+        "cost_per_click": 10.0,
+        "ad_title": "some",
+        "ad_text": "some",
+        "start_date": 0,
+        "end_date": 10,
+    }
+    data.update(params)
+    campaign = Campaign(campaign_id=uuid4(), advertiser_id=advertiser.advertiser_id, **data)
+    uow.add(campaign)
+    campaign_index.put(convert_campaign_to_candidate(campaign))
+    return campaign
@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+import pytest
+
+from crudik.application.ad.click import ClickAd
+from crudik.application.ad.show_ad import ShowAd
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import ClickRequest
+from crudik.application.exceptions.ad import CannotClickWithoutImpressionError
+from crudik.application.exceptions.campaign import CampaignDoesNotExistsError
+from crudik.application.exceptions.client import ClientDoesNotExistsError
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.client import Client
+from tests.unit.ad.helpers import add_campaign
+from tests.unit.mocks import MockAdGateway, MockCounterGateway
+
+
+async def test_ok(
+    click_ad: ClickAd,
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    ad_gateway: MockAdGateway,
+    counter_gateway: MockCounterGateway,
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser)
+    await show_ad.execute(unique_client.client_id)
+
+    await click_ad.execute(ClickRequest(unique_client.client_id), campaign.campaign_id)
+    await click_ad.execute(ClickRequest(unique_client.client_id), campaign.campaign_id)
+
+    click = await ad_gateway.get_click(unique_client.client_id, campaign.campaign_id)
+    assert click is not None
+    assert click.cost_per_click == campaign.cost_per_click
+    assert counter_gateway.clicks == {campaign.campaign_id: 1}
+
+
+async def test_client_not_exists(
+    click_ad: ClickAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser)
+
+    with pytest.raises(ClientDoesNotExistsError):
+        await click_ad.execute(ClickRequest(uuid4()), campaign.campaign_id)
+
+
+async def test_campaign_not_exists(click_ad: ClickAd, unique_client: Client) -> None:
+    with pytest.raises(CampaignDoesNotExistsError):
+        await click_ad.execute(ClickRequest(unique_client.client_id), uuid4())
+
+
+async def test_without_impression(
+    click_ad: ClickAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    counter_gateway: MockCounterGateway,
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser)
+
+    with pytest.raises(CannotClickWithoutImpressionError):
+        await click_ad.execute(ClickRequest(unique_client.client_id), campaign.campaign_id)
+
+    assert counter_gateway.clicks == {}
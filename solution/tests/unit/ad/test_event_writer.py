@@ -0,0 +1,153 @@
+import asyncio
+from collections.abc import AsyncIterator
+from uuid import UUID, uuid4
+
+import pytest
+
+from crudik.adapters import event_writer as event_writer_module
+from crudik.adapters.event_writer import FLUSH_ATTEMPTS, BatchedEventWriter, IngestionCounters
+from crudik.application.data_model.ad import ImpressionOutcome
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.impression import Impression
+from tests.unit.mocks import MockEventStore
+
+FLUSH_INTERVAL = 0.05
+
+
+def make_impression(client_id: UUID | None = None, ad_id: UUID | None = None) -> Impression:
+    return Impression(
+        impression_id=uuid4(),
+        ad_id=ad_id or uuid4(),
+        client_id=client_id or uuid4(),
+        cost_per_impression=1.0,
+        day=0,
+    )
+
+
+def make_click(impression: Impression) -> Click:
+    return Click(
+        click_id=uuid4(),
+        ad_id=impression.ad_id,
+        client_id=impression.client_id,
+        cost_per_click=1.0,
+        day=0,
+    )
+
+
+@pytest.fixture
+def store() -> MockEventStore:
+    return MockEventStore()
+
+
+@pytest.fixture
+def counters() -> IngestionCounters:
+    return IngestionCounters()
+
+
+@pytest.fixture
+async def writer(
+    store: MockEventStore,
+    counters: IngestionCounters,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[BatchedEventWriter]:
+    monkeypatch.setattr(event_writer_module, "RETRY_DELAY", 0)
+    writer = BatchedEventWriter(store, counters, batch_size=2, flush_interval=FLUSH_INTERVAL)
+    writer.start()
+    yield writer
+    await writer.close()
+
+
+async def test_flush_by_size(store: MockEventStore, counters: IngestionCounters) -> None:
+    writer = BatchedEventWriter(store, counters, batch_size=2, flush_interval=60)
+    writer.start()
+    first, second = make_impression(), make_impression()
+
+    await writer.write_impression(first)
+    await writer.write_impression(second)
+    # far below the flush interval
+    await asyncio.sleep(FLUSH_INTERVAL)
+
+    assert store.batches == [([first, second], [])]
+    await writer.close()
+
+
+async def test_flush_by_interval(writer: BatchedEventWriter, store: MockEventStore) -> None:
+    impression = make_impression()
+
+    await writer.write_impression(impression)
+    await asyncio.sleep(0)
+    assert store.batches == []
+
+    await asyncio.sleep(FLUSH_INTERVAL * 2)
+    assert store.batches == [([impression], [])]
+    assert not writer.has_pending_impression(impression.client_id, impression.ad_id)
+
+
+async def test_drain_on_close(store: MockEventStore, counters: IngestionCounters) -> None:
+    writer = BatchedEventWriter(store, counters, batch_size=100, flush_interval=60)
+    writer.start()
+    impression = make_impression()
+
+    await writer.write_impression(impression)
+    await writer.close()
+
+    assert store.batches == [([impression], [])]
+    assert counters.written == 1
+
+
+async def test_pending_dedupe(writer: BatchedEventWriter, store: MockEventStore) -> None:
+    impression = make_impression()
+    duplicate = make_impression(impression.client_id, impression.ad_id)
+
+    assert await writer.write_impression(impression) is ImpressionOutcome.RECORDED
+    assert writer.has_pending_impression(impression.client_id, impression.ad_id)
+    assert await writer.write_impression(duplicate) is ImpressionOutcome.ALREADY_SHOWN
+    click = make_click(impression)
+    await writer.write_click(click)
+    await writer.write_click(make_click(impression))
+    await writer.close()
+
+    assert store.batches == [([impression], [click])]
+
+
+async def test_click_behind_pending_impression(store: MockEventStore, counters: IngestionCounters) -> None:
+    writer = BatchedEventWriter(store, counters, batch_size=1, flush_interval=60)
+    writer.start()
+    impression = make_impression()
+    click = make_click(impression)
+
+    await writer.write_impression(impression)
+    await writer.write_click(click)
+    await writer.close()
+
+    # the click batch is written only after the batch of its impression
+    assert store.batches == [([impression], []), ([], [click])]
+
+
+async def test_retry(writer: BatchedEventWriter, store: MockEventStore, counters: IngestionCounters) -> None:
+    store.failures = FLUSH_ATTEMPTS - 1
+    impression = make_impression()
+
+    await writer.write_impression(impression)
+    await writer.close()
+
+    assert store.batches == [([impression], [])]
+    assert counters.get_stats().model_dump() == {
+        "queued": 1,
+        "written": 1,
+        "retried_batches": FLUSH_ATTEMPTS - 1,
+        "dropped": 0,
+    }
+
+
+async def test_dropped(writer: BatchedEventWriter, store: MockEventStore, counters: IngestionCounters) -> None:
+    store.failures = FLUSH_ATTEMPTS
+    impression = make_impression()
+
+    await writer.write_impression(impression)
+    await writer.close()
+
+    assert store.batches == []
+    assert counters.dropped == 1
+    assert counters.written == 0
+    assert not writer.has_pending_impression(impression.client_id, impression.ad_id)
@@ -0,0 +1,186 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from crudik.application.ad.show_ad import ShowAd
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.ad import ImpressionOutcome
+from crudik.application.exceptions.ad import CannotShowAdError
+from crudik.application.exceptions.client import ClientDoesNotExistsError
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.campaign import TargetGender
+from crudik.domain.entity.client import Client
+from crudik.domain.entity.impression import Impression
+from tests.unit.ad.helpers import add_campaign
+from tests.unit.mocks import MockAdGateway, MockCounterGateway, MockRelevanceGateway
+
+
+async def test_ok(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    ad_gateway: MockAdGateway,
+    counter_gateway: MockCounterGateway,
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser)
+
+    ad = await show_ad.execute(unique_client.client_id)
+
+    assert ad.ad_id == campaign.campaign_id
+    assert await ad_gateway.get_impression(unique_client.client_id, campaign.campaign_id) is not None
+    assert counter_gateway.impressions == {campaign.campaign_id: 1}
+
+
+async def test_client_not_exists(show_ad: ShowAd) -> None:
+    with pytest.raises(ClientDoesNotExistsError):
+        await show_ad.execute(uuid4())
+
+
+@pytest.mark.parametrize(
+    "targeting",
+    [
+        {"age_from": 30},
+        {"age_to": 20},
+        {"location": "Казань"},
+        {"gender": TargetGender.FEMALE},
+        {"start_date": 1},
+    ],
+)
+async def test_not_targeted(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    targeting: dict[str, Any],
+) -> None:
+    add_campaign(uow, campaign_index, unique_advertiser, **targeting)
+
+    with pytest.raises(CannotShowAdError):
+        await show_ad.execute(unique_client.client_id)
+
+
+@pytest.mark.parametrize(
+    "targeting",
+    [
+        {"age_from": 25, "age_to": 25},
+        {"location": "Москва"},
+        {"gender": TargetGender.MALE},
+        {"gender": TargetGender.ALL},
+    ],
+)
+async def test_targeted(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    targeting: dict[str, Any],
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser, **targeting)
+
+    ad = await show_ad.execute(unique_client.client_id)
+    assert ad.ad_id == campaign.campaign_id
+
+
+async def test_shown_once(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+) -> None:
+    add_campaign(uow, campaign_index, unique_advertiser)
+    await show_ad.execute(unique_client.client_id)
+
+    with pytest.raises(CannotShowAdError):
+        await show_ad.execute(unique_client.client_id)
+
+
+async def test_choice(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    relevance_gateway: MockRelevanceGateway,
+) -> None:
+    other_advertiser = Advertiser(uuid4(), "ООО Капец")
+    uow.add(other_advertiser)
+    add_campaign(uow, campaign_index, unique_advertiser, cost_per_impression=100, cost_per_click=10)
+    chosen = add_campaign(uow, campaign_index, other_advertiser, cost_per_impression=50, cost_per_click=100)
+    relevance_gateway.scores[unique_client.client_id, other_advertiser.advertiser_id] = 50
+
+    ad = await show_ad.execute(unique_client.client_id)
+    assert ad.ad_id == chosen.campaign_id
+
+
+async def test_concurrent_show(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    counter_gateway: MockCounterGateway,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    taken = add_campaign(uow, campaign_index, unique_advertiser, cost_per_impression=100)
+    other = add_campaign(uow, campaign_index, unique_advertiser)
+    record_impression = MockAdGateway.record_impression
+
+    async def record_after_concurrent_show(self: MockAdGateway, impression: Impression) -> ImpressionOutcome:
+        if impression.ad_id == taken.campaign_id:
+            concurrent = Impression(uuid4(), taken.campaign_id, impression.client_id, 100, impression.day)
+            await record_impression(self, concurrent)
+        return await record_impression(self, impression)
+
+    monkeypatch.setattr(MockAdGateway, "record_impression", record_after_concurrent_show)
+
+    ad = await show_ad.execute(unique_client.client_id)
+
+    assert ad.ad_id == other.campaign_id
+    assert counter_gateway.impressions == {taken.campaign_id: 1, other.campaign_id: 1}
+
+
+async def test_stale_index_entry(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+) -> None:
+    campaign = add_campaign(uow, campaign_index, unique_advertiser)
+    await uow.delete(campaign)
+
+    with pytest.raises(CannotShowAdError):
+        await show_ad.execute(unique_client.client_id)
+
+    assert campaign_index.find(unique_client, 0) == []
+
+
+async def test_deleted_after_ranking(
+    show_ad: ShowAd,
+    uow: UoW,
+    campaign_index: CampaignIndex,
+    unique_advertiser: Advertiser,
+    unique_client: Client,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    deleted = add_campaign(uow, campaign_index, unique_advertiser, cost_per_impression=100)
+    other = add_campaign(uow, campaign_index, unique_advertiser)
+    record_impression = MockAdGateway.record_impression
+
+    async def record_after_delete(self: MockAdGateway, impression: Impression) -> ImpressionOutcome:
+        deleted.is_deleted = True
+        return await record_impression(self, impression)
+
+    monkeypatch.setattr(MockAdGateway, "record_impression", record_after_delete)
+
+    ad = await show_ad.execute(unique_client.client_id)
+
+    assert ad.ad_id == other.campaign_id
+    assert [each.ad_id for each in campaign_index.find(unique_client, 0)] == [other.campaign_id]
@@ -1,8 +1,11 @@
 import pytest
 
-from crudik.application.campaign.create import CreateCampaign
+from crudik.application.campaign.create import CreateCampaign, CreateCampaigns
+from crudik.application.campaign.list import ListCampaigns
+from crudik.application.common.campaign_index import CampaignIndex
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.gateway.counter import CounterGateway
 from crudik.application.common.gateway.current_day import DayGateway
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
@@ -15,5 +18,32 @@ def create_campaign(
     advertiser_gateway: AdvertiserGateway,
     campaign_gateway: CampaignGateway,
     swear_filter: SwearFilter,
+    campaign_index: CampaignIndex,
+    counter_gateway: CounterGateway,
 ) -> CreateCampaign:
-    return CreateCampaign(uow, day_gateway, campaign_gateway, advertiser_gateway, swear_filter)
+    return CreateCampaign(
+        uow,
+        day_gateway,
+        campaign_gateway,
+        advertiser_gateway,
+        swear_filter,
+        campaign_index,
+        counter_gateway,
+    )
+
+
+@pytest.fixture
+def create_campaigns(
+    uow: UoW,
+    day_gateway: DayGateway,
+    advertiser_gateway: AdvertiserGateway,
+    swear_filter: SwearFilter,
+    campaign_index: CampaignIndex,
+    counter_gateway: CounterGateway,
+) -> CreateCampaigns:
+    return CreateCampaigns(uow, day_gateway, advertiser_gateway, swear_filter, campaign_index, counter_gateway)
+
+
+@pytest.fixture
+def list_campaigns(campaign_gateway: CampaignGateway, advertiser_gateway: AdvertiserGateway) -> ListCampaigns:
+    return ListCampaigns(campaign_gateway, advertiser_gateway)
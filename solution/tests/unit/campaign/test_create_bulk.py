@@ -0,0 +1,87 @@
+from uuid import uuid4
+
+import pytest
+
+from crudik.application.campaign.create import CreateCampaigns
+from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.swear_filter import SwearFilter
+from crudik.application.data_model.campaign import CampaignCreateData, CampaignTargeting
+from crudik.application.exceptions.advertiser import AdvertiserDoesNotExistsError
+from crudik.application.exceptions.campaign import (
+    CampaignContainsSwearsError,
+    ClickLimitGreaterThanImpressionsLimitError,
+)
+from crudik.domain.entity.advertiser import Advertiser
+from tests.unit.mocks import MockCounterGateway
+
+
+def campaign_data(**update: int | str) -> CampaignCreateData:
+    data = CampaignCreateData(
+        impressions_limit=100,
+        clicks_limit=100,
+        cost_per_impression=100,
+        cost_per_click=100,
+        ad_title="some",
+        ad_text="some",
+        start_date=0,
+        end_date=100,
+        targeting=CampaignTargeting(),
+    )
+    return data.model_copy(update=update)
+
+
+async def test_ok(
+    create_campaigns: CreateCampaigns,
+    campaign_gateway: CampaignGateway,
+    counter_gateway: MockCounterGateway,
+    unique_advertiser: Advertiser,
+) -> None:
+    created = await create_campaigns.execute(
+        advertiser_id=unique_advertiser.advertiser_id,
+        data=[campaign_data(ad_title=f"title {i}") for i in range(3)],
+    )
+
+    assert [each.ad_title for each in created] == ["title 0", "title 1", "title 2"]
+    for each in created:
+        assert await campaign_gateway.get_by_id(each.campaign_id) is not None
+    assert counter_gateway.campaigns == len(created)
+
+
+async def test_empty(
+    create_campaigns: CreateCampaigns,
+    unique_advertiser: Advertiser,
+) -> None:
+    assert await create_campaigns.execute(advertiser_id=unique_advertiser.advertiser_id, data=[]) == []
+
+
+async def test_advertiser_not_exists(create_campaigns: CreateCampaigns) -> None:
+    with pytest.raises(AdvertiserDoesNotExistsError):
+        await create_campaigns.execute(advertiser_id=uuid4(), data=[campaign_data()])
+
+
+async def test_invalid_rejects_all(
+    create_campaigns: CreateCampaigns,
+    campaign_gateway: CampaignGateway,
+    unique_advertiser: Advertiser,
+) -> None:
+    with pytest.raises(ClickLimitGreaterThanImpressionsLimitError):
+        await create_campaigns.execute(
+            advertiser_id=unique_advertiser.advertiser_id,
+            data=[campaign_data(), campaign_data(clicks_limit=2, impressions_limit=1)],
+        )
+
+    assert await campaign_gateway.list(unique_advertiser.advertiser_id, None, None) == []
+
+
+async def test_swears(
+    create_campaigns: CreateCampaigns,
+    unique_advertiser: Advertiser,
+    swear_filter: SwearFilter,
+) -> None:
+    await swear_filter.set_mode(enabled=True)
+
+    with pytest.raises(CampaignContainsSwearsError):
+        await create_campaigns.execute(
+            advertiser_id=unique_advertiser.advertiser_id,
+            data=[campaign_data(), campaign_data()],
+        )
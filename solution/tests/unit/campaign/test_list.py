@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+
+from crudik.application.campaign.list import ListCampaigns
+from crudik.application.data_model.common import Pagination
+from crudik.application.exceptions.campaign import InvalidCampaignCursorError
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.campaign import Campaign
+from tests.unit.mocks import MockCampaignGateway
+
+
+@pytest.fixture
+def campaigns(campaign_gateway: MockCampaignGateway, unique_advertiser: Advertiser) -> list[Campaign]:
+    campaigns = [
+        Campaign(
+            campaign_id=uuid4(),
+            advertiser_id=unique_advertiser.advertiser_id,
+            impressions_limit=100,
+            clicks_limit=10,
+            cost_per_impression=1,
+            cost_per_click=1,
+            # repeated titles, so pages are also split between equal titles
+            ad_title=f"title {number // 2}",
+            ad_text="some",
+            start_date=0,
+            end_date=10,
+        )
+        for number in range(7)
+    ]
+    for campaign in campaigns:
+        campaign_gateway.campaigns[campaign.campaign_id] = campaign
+
+    return sorted(campaigns, key=lambda campaign: (campaign.ad_title, campaign.campaign_id))
+
+
+async def test_cursor(list_campaigns: ListCampaigns, unique_advertiser: Advertiser, campaigns: list[Campaign]) -> None:
+    page = await list_campaigns.execute(unique_advertiser.advertiser_id, Pagination(size=3, page=0))
+    seen = [campaign.campaign_id for campaign in page.campaigns]
+
+    while page.next_cursor is not None:
+        page = await list_campaigns.execute(
+            unique_advertiser.advertiser_id,
+            Pagination(size=3, cursor=page.next_cursor),
+        )
+        seen.extend(campaign.campaign_id for campaign in page.campaigns)
+
+    assert seen == [campaign.campaign_id for campaign in campaigns]
+
+
+async def test_last_page_has_no_cursor(
+    list_campaigns: ListCampaigns,
+    unique_advertiser: Advertiser,
+    campaigns: list[Campaign],
+) -> None:
+    page = await list_campaigns.execute(unique_advertiser.advertiser_id, Pagination(size=10, page=0))
+
+    assert len(page.campaigns) == len(campaigns)
+    assert page.next_cursor is None
+
+
+async def test_invalid_cursor(list_campaigns: ListCampaigns, unique_advertiser: Advertiser) -> None:
+    with pytest.raises(InvalidCampaignCursorError):
+        await list_campaigns.execute(unique_advertiser.advertiser_id, Pagination(size=3, cursor="not a cursor"))
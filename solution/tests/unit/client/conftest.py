@@ -0,0 +1,13 @@
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.client_cache import TieredClientCache
+from tests.unit.mocks import MockRedis
+
+
+@pytest.fixture
+def client_cache(redis: MockRedis, registry: CacheRegistry) -> TieredClientCache:
+    return TieredClientCache(cast(Redis, redis), registry, maxsize=2, ttl=60, local_ttl=60)
@@ -0,0 +1,61 @@
+import dataclasses
+from typing import cast
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.client_cache import CLIENT_KEY_PREFIX, TieredClientCache
+from crudik.domain.entity.client import Client
+from tests.unit.mocks import MockRedis
+
+
+def stats(registry: CacheRegistry) -> dict[str, tuple[int, int]]:
+    return {each.name: (each.hits, each.misses) for each in registry.get_stats()}
+
+
+async def test_local_hit(client_cache: TieredClientCache, registry: CacheRegistry, unique_client: Client) -> None:
+    await client_cache.put_many([unique_client])
+
+    assert await client_cache.get(unique_client.client_id) == unique_client
+    assert stats(registry) == {"clients": (1, 0), "clients_redis": (0, 0)}
+
+
+async def test_redis_hit(redis: MockRedis, registry: CacheRegistry, unique_client: Client) -> None:
+    await TieredClientCache(cast(Redis, redis), registry, maxsize=2, ttl=60, local_ttl=60).put_many([unique_client])
+    other_worker = TieredClientCache(cast(Redis, redis), CacheRegistry(), maxsize=2, ttl=60, local_ttl=60)
+
+    assert await other_worker.get(unique_client.client_id) == unique_client
+    assert redis.ttls == {f"{CLIENT_KEY_PREFIX}{unique_client.client_id}": 60}
+
+
+async def test_miss(client_cache: TieredClientCache, registry: CacheRegistry) -> None:
+    assert await client_cache.get(uuid4()) is None
+    assert stats(registry) == {"clients": (0, 1), "clients_redis": (0, 1)}
+
+
+async def test_local_ttl(redis: MockRedis, unique_client: Client) -> None:
+    cache = TieredClientCache(cast(Redis, redis), CacheRegistry(), maxsize=2, ttl=60, local_ttl=0)
+    await cache.put_many([unique_client])
+    updated = dataclasses.replace(unique_client, age=30)
+    # an upsert committed by another worker
+    await TieredClientCache(cast(Redis, redis), CacheRegistry(), maxsize=2, ttl=60, local_ttl=0).put_many([updated])
+
+    assert await cache.get(unique_client.client_id) == updated
+
+
+async def test_add_keeps_upserted(client_cache: TieredClientCache, redis: MockRedis, unique_client: Client) -> None:
+    updated = dataclasses.replace(unique_client, age=30)
+    await client_cache.put_many([updated])
+
+    # a read that loaded the client from the database before the upsert was committed
+    await client_cache.add(unique_client)
+    other_worker = TieredClientCache(cast(Redis, redis), CacheRegistry(), maxsize=2, ttl=60, local_ttl=60)
+
+    assert await other_worker.get(unique_client.client_id) == updated
+
+
+async def test_local_eviction(client_cache: TieredClientCache, registry: CacheRegistry, unique_client: Client) -> None:
+    await client_cache.put_many(dataclasses.replace(unique_client, client_id=uuid4()) for _ in range(3))
+
+    assert [each.size for each in registry.get_stats() if each.name == "clients"] == [2]
@@ -0,0 +1,40 @@
+from uuid import uuid4
+
+import pytest
+
+from crudik.application.client.upsert import UpsertClients
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.client import ClientData
+from crudik.domain.entity.client import Gender
+from tests.unit.mocks import MockClientCache, MockClientGateway
+
+
+class FailingUoW(UoW):
+    async def commit(self) -> None:
+        raise ConnectionError
+
+    def add(self, instance: object) -> None: ...
+
+    async def delete(self, instance: object) -> None: ...
+
+
+def client_data() -> ClientData:
+    return ClientData(client_id=uuid4(), login="user", age=25, location="Москва", gender=Gender.MALE)
+
+
+async def test_cached_after_commit(uow: UoW) -> None:
+    cache = MockClientCache()
+    data = client_data()
+
+    await UpsertClients(MockClientGateway(), uow, cache).execute([data], returning=False)
+
+    assert cache.clients[data.client_id].login == data.login
+
+
+async def test_not_cached_without_commit() -> None:
+    cache = MockClientCache()
+
+    with pytest.raises(ConnectionError):
+        await UpsertClients(MockClientGateway(), FailingUoW(), cache).execute([client_data()])
+
+    assert cache.clients == {}
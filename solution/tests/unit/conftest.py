@@ -2,13 +2,33 @@ from uuid import uuid4
 
 import pytest
 
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.campaign_index import InMemoryCampaignIndex
+from crudik.adapters.event_writer import TransactionalEventWriter
+from crudik.application.common.campaign_index import CampaignIndex
+from crudik.application.common.event_writer import EventWriter
+from crudik.application.common.gateway.ad import AdGateway
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.gateway.counter import CounterGateway
 from crudik.application.common.gateway.current_day import DayGateway, MockDayGateway
+from crudik.application.common.gateway.relevance import RelevanceGateway
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
 from crudik.domain.entity.advertiser import Advertiser
-from tests.unit.mocks import MockAdvertiserGateway, MockCampaignGateway, MockSwearFilter, MockUoW
+from crudik.domain.entity.client import Client, Gender
+from tests.unit.mocks import (
+    MockAdGateway,
+    MockAdvertiserGateway,
+    MockCampaignGateway,
+    MockClientGateway,
+    MockCounterGateway,
+    MockRedis,
+    MockRelevanceGateway,
+    MockSwearFilter,
+    MockUoW,
+)
 
 
 @pytest.fixture
@@ -26,19 +46,62 @@ def advertiser_gateway() -> AdvertiserGateway:
     return MockAdvertiserGateway()
 
 
+@pytest.fixture
+def client_gateway() -> ClientGateway:
+    return MockClientGateway()
+
+
+@pytest.fixture
+def ad_gateway(
+    campaign_gateway: MockCampaignGateway,
+    client_gateway: MockClientGateway,
+    counter_gateway: MockCounterGateway,
+) -> AdGateway:
+    return MockAdGateway(
+        campaign_mapper=campaign_gateway,
+        client_mapper=client_gateway,
+        counter_gateway=counter_gateway,
+    )
+
+
+@pytest.fixture
+def counter_gateway() -> CounterGateway:
+    return MockCounterGateway()
+
+
+@pytest.fixture
+def relevance_gateway() -> RelevanceGateway:
+    return MockRelevanceGateway()
+
+
+@pytest.fixture
+def campaign_index() -> CampaignIndex:
+    return InMemoryCampaignIndex()
+
+
 @pytest.fixture
 def swear_filter() -> SwearFilter:
     return MockSwearFilter()
 
 
 @pytest.fixture
-def uow(advertiser_gateway: MockAdvertiserGateway, campaign_gateway: MockCampaignGateway) -> UoW:
+def uow(
+    advertiser_gateway: MockAdvertiserGateway,
+    campaign_gateway: MockCampaignGateway,
+    ad_gateway: MockAdGateway,
+) -> UoW:
     return MockUoW(
         campaign_mapper=campaign_gateway,
         advertiser_mapper=advertiser_gateway,
+        ad_mapper=ad_gateway,
     )
 
 
+@pytest.fixture
+def event_writer(uow: UoW, counter_gateway: CounterGateway, ad_gateway: AdGateway) -> EventWriter:
+    return TransactionalEventWriter(uow, counter_gateway, ad_gateway)
+
+
 @pytest.fixture
 def unique_advertiser(uow: UoW) -> Advertiser:
     advertiser_id = uuid4()
@@ -46,3 +109,20 @@ def unique_advertiser(uow: UoW) -> Advertiser:
     advertiser = Advertiser(advertiser_id, name)
     uow.add(advertiser)
     return advertiser
+
+
+@pytest.fixture
+def unique_client(client_gateway: MockClientGateway) -> Client:
+    client = Client(client_id=uuid4(), login="user", age=25, location="Москва", gender=Gender.MALE)
+    client_gateway.clients[client.client_id] = client
+    return client
+
+
+@pytest.fixture
+def redis() -> MockRedis:
+    return MockRedis()
+
+
+@pytest.fixture
+def registry() -> CacheRegistry:
+    return CacheRegistry()
@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+
+from crudik.adapters.day_cache import CurrentDayCache
+from crudik.adapters.gateway.day import DAY_KEY, CachedDayGateway, DayRedisGateway
+from crudik.adapters.redis import RedisStorage
+from crudik.application.data_model.day import Day
+from crudik.application.set_day import SetDay
+from tests.unit.mocks import MockRedis
+
+REFRESH_INTERVAL = 60
+FALLBACK_INTERVAL = 0.05
+
+
+async def settle() -> None:
+    """Let the listeners handle the messages published so far."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def caches(redis: MockRedis) -> AsyncIterator[tuple[CurrentDayCache, CurrentDayCache]]:
+    """Day caches of two workers."""
+    first = CurrentDayCache(cast(Redis, redis), DAY_KEY, refresh_interval=REFRESH_INTERVAL)
+    second = CurrentDayCache(cast(Redis, redis), DAY_KEY, refresh_interval=REFRESH_INTERVAL)
+    first.start()
+    second.start()
+    await settle()
+    yield first, second
+    await first.close()
+    await second.close()
+
+
+def gateway_of(redis: MockRedis, cache: CurrentDayCache) -> CachedDayGateway:
+    return CachedDayGateway(DayRedisGateway(RedisStorage(cast(Redis, redis))), cache)
+
+
+async def test_set_day_invalidates_workers(
+    redis: MockRedis,
+    caches: tuple[CurrentDayCache, CurrentDayCache],
+) -> None:
+    first, second = caches
+    assert await gateway_of(redis, first).read_current_day() == 0
+
+    await SetDay(gateway_of(redis, second)).execute(Day(current_date=5))
+    await settle()
+
+    assert first.get() == 5  # noqa: PLR2004
+    assert second.get() == 5  # noqa: PLR2004
+
+
+async def test_keyspace_invalidation(redis: MockRedis, caches: tuple[CurrentDayCache, CurrentDayCache]) -> None:
+    first, _ = caches
+    gateway = gateway_of(redis, first)
+    await gateway.read_current_day()
+
+    # the key changed by something that does not publish the day
+    await redis.set(DAY_KEY, "3")
+    await settle()
+
+    assert first.get() is None
+    assert await gateway.read_current_day() == 3  # noqa: PLR2004
+
+
+async def test_stale_read_not_stored(redis: MockRedis, caches: tuple[CurrentDayCache, CurrentDayCache]) -> None:
+    first, second = caches
+    version = first.version
+
+    await SetDay(gateway_of(redis, second)).execute(Day(current_date=5))
+    await settle()
+    # a read that started before the day was set finishes after it
+    first.put(0, version)
+
+    assert first.get() == 5  # noqa: PLR2004
+
+
+async def test_fallback_refresh(redis: MockRedis) -> None:
+    # not started, so it hears no messages, as if they were lost
+    cache = CurrentDayCache(cast(Redis, redis), DAY_KEY, refresh_interval=FALLBACK_INTERVAL)
+    gateway = gateway_of(redis, cache)
+    await gateway.read_current_day()
+    await redis.set(DAY_KEY, "7")
+
+    assert await gateway.read_current_day() == 0
+
+    await asyncio.sleep(FALLBACK_INTERVAL * 2)
+    assert await gateway.read_current_day() == 7  # noqa: PLR2004
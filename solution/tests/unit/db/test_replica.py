@@ -0,0 +1,101 @@
+import asyncio
+from types import TracebackType
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from crudik.adapters.db.replica import ReplicaRouter
+
+MAX_LAG = 5
+CHECK_INTERVAL = 0.05
+
+
+class MockResult:
+    def __init__(self, value: float) -> None:
+        self._value = value
+
+    def scalar_one(self) -> float:
+        return self._value
+
+
+class MockReplica:
+    """Session factory whose sessions answer the lag query with ``lag``, or fail with ``error``."""
+
+    def __init__(self, lag: float = 0, error: Exception | None = None) -> None:
+        self.lag = lag
+        self.error = error
+        self.queries = 0
+
+    def __call__(self) -> "MockReplica":
+        return self
+
+    async def __aenter__(self) -> "MockReplica":
+        if self.error is not None:
+            raise self.error
+
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None: ...
+
+    async def execute(self, *args: Any) -> MockResult:
+        self.queries += 1
+        # a real query yields to the other requests
+        await asyncio.sleep(0)
+        return MockResult(self.lag)
+
+
+def as_factory(factory: object) -> async_sessionmaker[AsyncSession]:
+    return cast(async_sessionmaker[AsyncSession], factory)
+
+
+@pytest.fixture
+def primary() -> async_sessionmaker[AsyncSession]:
+    return as_factory(MockReplica())
+
+
+def router_of(primary: async_sessionmaker[AsyncSession], replica: MockReplica | None) -> ReplicaRouter:
+    return ReplicaRouter(primary, as_factory(replica) if replica else None, MAX_LAG, CHECK_INTERVAL)
+
+
+async def test_without_replica(primary: async_sessionmaker[AsyncSession]) -> None:
+    assert await router_of(primary, None).get_session_factory() is primary
+
+
+async def test_fresh_replica(primary: async_sessionmaker[AsyncSession]) -> None:
+    replica = MockReplica(lag=MAX_LAG)
+
+    assert await router_of(primary, replica).get_session_factory() is as_factory(replica)
+
+
+async def test_lagging_replica(primary: async_sessionmaker[AsyncSession]) -> None:
+    replica = MockReplica(lag=MAX_LAG + 1)
+
+    assert await router_of(primary, replica).get_session_factory() is primary
+
+
+async def test_unavailable_replica(primary: async_sessionmaker[AsyncSession]) -> None:
+    replica = MockReplica(error=ConnectionRefusedError())
+
+    assert await router_of(primary, replica).get_session_factory() is primary
+
+
+async def test_checked_once_per_interval(primary: async_sessionmaker[AsyncSession]) -> None:
+    replica = MockReplica()
+    router = router_of(primary, replica)
+
+    factories = await asyncio.gather(*(router.get_session_factory() for _ in range(10)))
+    assert factories == [as_factory(replica)] * 10
+    assert replica.queries == 1
+
+    replica.lag = MAX_LAG + 1
+    assert await router.get_session_factory() is as_factory(replica)
+
+    await asyncio.sleep(CHECK_INTERVAL * 2)
+    assert await router.get_session_factory() is primary
+    assert replica.queries == 2  # noqa: PLR2004
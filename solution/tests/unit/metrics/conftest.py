@@ -0,0 +1,13 @@
+import pytest
+
+from tests.unit.mocks import MockKeyValueStorage, MockMetricsGateway
+
+
+@pytest.fixture
+def metrics_gateway() -> MockMetricsGateway:
+    return MockMetricsGateway()
+
+
+@pytest.fixture
+def storage() -> MockKeyValueStorage:
+    return MockKeyValueStorage()
@@ -0,0 +1,47 @@
+import json
+
+from crudik.application.metrics import CACHE_UNTIL_KEY, METRICS_CACHE_KEY, ProduceMetrics, RefreshMetrics
+from tests.unit.mocks import MockKeyValueStorage, MockMetricsGateway
+
+
+def expire(storage: MockKeyValueStorage) -> None:
+    entry = json.loads(storage.data[METRICS_CACHE_KEY])
+    entry[CACHE_UNTIL_KEY] = 0
+    storage.data[METRICS_CACHE_KEY] = json.dumps(entry)
+
+
+async def test_cached(metrics_gateway: MockMetricsGateway, storage: MockKeyValueStorage) -> None:
+    produce_metrics = ProduceMetrics(metrics_gateway, storage)
+
+    await produce_metrics.execute()
+    await produce_metrics.execute()
+
+    assert metrics_gateway.calls == 1
+
+
+async def test_expired(metrics_gateway: MockMetricsGateway, storage: MockKeyValueStorage) -> None:
+    produce_metrics = ProduceMetrics(metrics_gateway, storage)
+
+    await produce_metrics.execute()
+    expire(storage)
+    await produce_metrics.execute()
+
+    assert metrics_gateway.calls == 2  # noqa: PLR2004
+
+
+async def test_refresh_ahead_serves_stored(metrics_gateway: MockMetricsGateway, storage: MockKeyValueStorage) -> None:
+    await RefreshMetrics(metrics_gateway, storage).execute()
+    expire(storage)
+    metrics_gateway.metrics = metrics_gateway.metrics.model_copy(update={"clients_count": 10})
+
+    metrics = await ProduceMetrics(metrics_gateway, storage, refresh_ahead=True).execute()
+
+    assert metrics.clients_count == 0
+    assert metrics_gateway.calls == 1
+
+
+async def test_refresh_ahead_cold_start(metrics_gateway: MockMetricsGateway, storage: MockKeyValueStorage) -> None:
+    await ProduceMetrics(metrics_gateway, storage, refresh_ahead=True).execute()
+
+    assert metrics_gateway.calls == 1
+    assert METRICS_CACHE_KEY in storage.data
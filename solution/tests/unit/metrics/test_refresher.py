@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+
+from crudik.adapters.metrics_refresher import (
+    EXTEND_LOCK_SCRIPT,
+    REFRESH_LOCK_KEY,
+    RELEASE_LOCK_SCRIPT,
+    MetricsRefresher,
+)
+from tests.unit.mocks import MockRedis
+
+INTERVAL = 0.1
+
+LockScript = Callable[[Sequence[str], Sequence[str | int]], Awaitable[int]]
+
+
+class MockLockRedis(MockRedis):
+    """Runs the lock scripts of the refresher as Python."""
+
+    def register_script(self, script: str) -> LockScript:
+        return {EXTEND_LOCK_SCRIPT: self._extend, RELEASE_LOCK_SCRIPT: self._release}[script]
+
+    async def _extend(self, keys: Sequence[str], args: Sequence[str | int]) -> int:
+        [key], [token, milliseconds] = keys, args
+        if await self.get(key) != str(token).encode():
+            return 0
+
+        return int(await self.pexpire(key, int(milliseconds)))
+
+    async def _release(self, keys: Sequence[str], args: Sequence[str | int]) -> int:
+        [key], [token, milliseconds] = keys, args
+        if await self.get(key) != str(token).encode():
+            return 0
+
+        if int(milliseconds) > 0:
+            return int(await self.pexpire(key, int(milliseconds)))
+
+        return await self.delete(key)
+
+
+class SlowRefresh:
+    """Refresh taking ``duration`` seconds that records how many ran at once."""
+
+    def __init__(self, duration: float) -> None:
+        self.duration = duration
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self) -> None:
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.duration)
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def redis() -> MockLockRedis:
+    return MockLockRedis()
+
+
+def refresher_of(redis: MockLockRedis, refresh: SlowRefresh) -> MetricsRefresher:
+    return MetricsRefresher(cast(Redis, redis), refresh, interval=INTERVAL)
+
+
+async def test_slow_refresh_not_overlapped(redis: MockLockRedis) -> None:
+    refresh = SlowRefresh(INTERVAL * 3)
+    workers = [refresher_of(redis, refresh) for _ in range(3)]
+    for each in workers:
+        each.start()
+
+    await asyncio.sleep(INTERVAL * 5)
+    for each in workers:
+        await each.close()
+
+    assert refresh.calls > 1
+    assert refresh.max_running == 1
+
+
+async def test_once_per_interval(redis: MockLockRedis) -> None:
+    refresh = SlowRefresh(0)
+    workers = [refresher_of(redis, refresh) for _ in range(3)]
+    for each in workers:
+        each.start()
+
+    await asyncio.sleep(INTERVAL * 2.5)
+    for each in workers:
+        await each.close()
+
+    # at the start and after every whole interval, the last one may fall just outside
+    assert refresh.calls in {2, 3}
+
+
+async def test_released_on_close(redis: MockLockRedis) -> None:
+    refresher = refresher_of(redis, SlowRefresh(INTERVAL * 10))
+    refresher.start()
+    await asyncio.sleep(INTERVAL / 10)
+    assert REFRESH_LOCK_KEY in redis.data
+
+    await refresher.close()
+
+    assert REFRESH_LOCK_KEY not in redis.data
+
+
+async def test_foreign_lock_kept(redis: MockLockRedis) -> None:
+    refresher = refresher_of(redis, SlowRefresh(INTERVAL / 2))
+    refresher.start()
+    await asyncio.sleep(INTERVAL / 10)
+    # the lock expired and another worker took it
+    await redis.set(REFRESH_LOCK_KEY, "other", px=int(INTERVAL * 10_000))
+
+    await asyncio.sleep(INTERVAL)
+    await refresher.close()
+
+    assert await redis.get(REFRESH_LOCK_KEY) == b"other"
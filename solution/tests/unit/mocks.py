@@ -1,15 +1,41 @@
-from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+import asyncio
+import time
+from collections.abc import AsyncIterator, Collection, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+from typing import Any
 from uuid import UUID
 
+from crudik.application.common.cache_storage import KeyValueStorage
+from crudik.application.common.client_cache import ClientCache
+from crudik.application.common.gateway.ad import AdGateway
 from crudik.application.common.gateway.advertiser import AdvertiserGateway
 from crudik.application.common.gateway.campaign import CampaignGateway
+from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.gateway.counter import CounterGateway
 from crudik.application.common.gateway.current_day import DayGateway
+from crudik.application.common.gateway.metrics import MetricsGateway
+from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.common.relevance_cache import RelevanceCache
 from crudik.application.common.swear_filter import SwearFilter
 from crudik.application.common.uow import UoW
-from crudik.application.data_model.campaign import CampaignStat, CampaignStatDaily
+from crudik.application.data_model.ad import AdCandidateStats, ClickOutcome, ImpressionOutcome
+from crudik.application.data_model.campaign import (
+    AdvertiserCampaignStat,
+    CampaignCursor,
+    CampaignStat,
+    CampaignStatDaily,
+    CampaignStatDailyRow,
+    CampaignStatSort,
+    SortOrder,
+)
+from crudik.application.data_model.metrics import ServiceMetrics
 from crudik.domain.entity.advertiser import Advertiser
 from crudik.domain.entity.campaign import Campaign
+from crudik.domain.entity.click import Click
+from crudik.domain.entity.client import Client
+from crudik.domain.entity.impression import Impression
+from crudik.domain.entity.relevance import Relevance
 
 
 @dataclass(slots=True)
@@ -40,13 +66,34 @@ class MockCampaignGateway(CampaignGateway):
         limit: int | None,
         offset: int | None,
     ) -> Sequence[Campaign]:
-        campaigns = [
-            campaign
-            for campaign in self.campaigns.values()
-            if not campaign.is_deleted and campaign.advertiser_id == advertiser_id
-        ]
+        campaigns = sorted(
+            (
+                campaign
+                for campaign in self.campaigns.values()
+                if not campaign.is_deleted and campaign.advertiser_id == advertiser_id
+            ),
+            key=lambda campaign: (campaign.ad_title, campaign.campaign_id),
+        )
         return campaigns[offset : limit + offset] if limit is not None and offset is not None else campaigns
 
+    async def list_after(
+        self,
+        advertiser_id: UUID,
+        limit: int | None,
+        after: CampaignCursor,
+    ) -> Sequence[Campaign]:
+        campaigns = sorted(
+            (
+                campaign
+                for campaign in self.campaigns.values()
+                if not campaign.is_deleted
+                and campaign.advertiser_id == advertiser_id
+                and (campaign.ad_title, campaign.campaign_id) > (after.ad_title, after.campaign_id)
+            ),
+            key=lambda campaign: (campaign.ad_title, campaign.campaign_id),
+        )
+        return campaigns[:limit]
+
     async def get_stat(self, unique_id: UUID) -> CampaignStat | None:
         raise NotImplementedError
 
@@ -58,7 +105,7 @@ class MockAdvertiserGateway(AdvertiserGateway):
     def __init__(self) -> None:
         self.advertisers: dict[UUID, Advertiser] = {}
 
-    async def upsert(self, data: Iterable[Advertiser]) -> Sequence[Advertiser]:
+    async def upsert(self, data: Sequence[Advertiser], *, returning: bool = True) -> Sequence[Advertiser]:
         for advertiser in data:
             self.advertisers[advertiser.advertiser_id] = advertiser
         return list(data)
@@ -66,12 +113,139 @@ class MockAdvertiserGateway(AdvertiserGateway):
     async def get_by_id(self, unique_id: UUID) -> Advertiser | None:
         return self.advertisers.get(unique_id)
 
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        return {each for each in ids if each in self.advertisers}
+
     async def get_stat(self, advertiser_id: UUID) -> CampaignStat | None:
         raise NotImplementedError
 
     async def get_stat_daily(self, advertiser_id: UUID) -> Sequence[CampaignStatDaily]:
         raise NotImplementedError
 
+    def stream_campaign_stat_daily(self, advertiser_id: UUID) -> AsyncIterator[Sequence[CampaignStatDailyRow]]:
+        raise NotImplementedError
+
+    async def list_campaign_stats(
+        self,
+        advertiser_id: UUID,
+        sort: CampaignStatSort,
+        order: SortOrder,
+        limit: int | None,
+        offset: int | None,
+    ) -> Sequence[AdvertiserCampaignStat]:
+        raise NotImplementedError
+
+
+class MockClientGateway(ClientGateway):
+    def __init__(self) -> None:
+        self.clients: dict[UUID, Client] = {}
+
+    async def upsert(self, data: Sequence[Client], *, returning: bool = True) -> Sequence[Client]:
+        for client in data:
+            self.clients[client.client_id] = client
+        return list(data)
+
+    async def get_by_id(self, unique_id: UUID) -> Client | None:
+        return self.clients.get(unique_id)
+
+    async def get_existing_ids(self, ids: Collection[UUID]) -> AbstractSet[UUID]:
+        return {each for each in ids if each in self.clients}
+
+
+class MockClientCache(ClientCache):
+    def __init__(self) -> None:
+        self.clients: dict[UUID, Client] = {}
+
+    async def put_many(self, clients: Iterable[Client]) -> None:
+        self.clients.update((each.client_id, each) for each in clients)
+
+
+@dataclass(slots=True)
+class MockCounterGateway(CounterGateway):
+    impressions: dict[UUID, int] = field(default_factory=dict)
+    clicks: dict[UUID, int] = field(default_factory=dict)
+    campaigns: int = 0
+
+    async def count_impressions(self, impressions: Sequence[Impression]) -> None:
+        for impression in impressions:
+            self.impressions[impression.ad_id] = self.impressions.get(impression.ad_id, 0) + 1
+
+    async def count_clicks(self, clicks: Sequence[Click]) -> None:
+        for click in clicks:
+            self.clicks[click.ad_id] = self.clicks.get(click.ad_id, 0) + 1
+
+    async def count_campaigns(self, campaigns: Sequence[Campaign]) -> None:
+        self.campaigns += len(campaigns)
+
+
+@dataclass(slots=True)
+class MockAdGateway(AdGateway):
+    campaign_mapper: MockCampaignGateway
+    client_mapper: MockClientGateway
+    counter_gateway: MockCounterGateway
+    impressions: list[Impression] = field(default_factory=list)
+    clicks: list[Click] = field(default_factory=list)
+
+    async def get_impression(self, client_id: UUID, ad_id: UUID) -> Impression | None:
+        return next((i for i in self.impressions if (i.client_id, i.ad_id) == (client_id, ad_id)), None)
+
+    async def get_click(self, client_id: UUID, ad_id: UUID) -> Click | None:
+        return next((c for c in self.clicks if (c.client_id, c.ad_id) == (client_id, ad_id)), None)
+
+    async def get_clicks_count(self, ad_id: UUID) -> int:
+        return sum(1 for c in self.clicks if c.ad_id == ad_id)
+
+    async def get_candidates_stats(
+        self,
+        client_id: UUID,
+        ad_ids: Collection[UUID],
+    ) -> Mapping[UUID, AdCandidateStats]:
+        stats = {}
+        for ad_id in ad_ids:
+            campaign = await self.campaign_mapper.get_by_id(ad_id)
+            if campaign is None:
+                continue
+
+            stats[ad_id] = AdCandidateStats(
+                ad_id=ad_id,
+                impressions_count=sum(1 for i in self.impressions if i.ad_id == ad_id),
+                clicks_count=await self.get_clicks_count(ad_id),
+                is_seen=await self.get_impression(client_id, ad_id) is not None,
+            )
+        return stats
+
+    async def record_impression(self, impression: Impression) -> ImpressionOutcome:
+        campaign = await self.campaign_mapper.get_by_id_all(impression.ad_id)
+        if campaign is None or campaign.is_deleted:
+            return ImpressionOutcome.CAMPAIGN_NOT_FOUND
+
+        if await self.get_impression(impression.client_id, impression.ad_id) is not None:
+            return ImpressionOutcome.ALREADY_SHOWN
+
+        impression.cost_per_impression = campaign.cost_per_impression
+        self.impressions.append(impression)
+        await self.counter_gateway.count_impressions([impression])
+        return ImpressionOutcome.RECORDED
+
+    async def record_click(self, click_id: UUID, client_id: UUID, ad_id: UUID, day: int) -> ClickOutcome:
+        if await self.client_mapper.get_by_id(client_id) is None:
+            return ClickOutcome.CLIENT_NOT_FOUND
+
+        campaign = await self.campaign_mapper.get_by_id(ad_id)
+        if campaign is None:
+            return ClickOutcome.CAMPAIGN_NOT_FOUND
+
+        if await self.get_impression(client_id, ad_id) is None:
+            return ClickOutcome.NO_IMPRESSION
+
+        if await self.get_click(client_id, ad_id) is not None:
+            return ClickOutcome.ALREADY_CLICKED
+
+        click = Click(click_id, ad_id, client_id, campaign.cost_per_click, day)
+        self.clicks.append(click)
+        await self.counter_gateway.count_clicks([click])
+        return ClickOutcome.RECORDED
+
 
 @dataclass(slots=True)
 class MockSwearFilter(SwearFilter):
@@ -80,6 +254,9 @@ class MockSwearFilter(SwearFilter):
     async def check_contains_swears(self, text: str) -> bool:
         return self.enabled
 
+    async def check_many(self, texts: Sequence[str]) -> list[bool]:
+        return [self.enabled] * len(texts)
+
     async def set_mode(self, *, enabled: bool) -> None:
         self.enabled = enabled
 
@@ -88,6 +265,7 @@ class MockSwearFilter(SwearFilter):
 class MockUoW(UoW):
     campaign_mapper: MockCampaignGateway
     advertiser_mapper: MockAdvertiserGateway
+    ad_mapper: MockAdGateway | None = None
 
     async def commit(self) -> None: ...
 
@@ -96,9 +274,231 @@ class MockUoW(UoW):
             self.campaign_mapper.campaigns[instance.campaign_id] = instance
         elif isinstance(instance, Advertiser):
             self.advertiser_mapper.advertisers[instance.advertiser_id] = instance
+        elif isinstance(instance, Impression) and self.ad_mapper is not None:
+            self.ad_mapper.impressions.append(instance)
+        elif isinstance(instance, Click) and self.ad_mapper is not None:
+            self.ad_mapper.clicks.append(instance)
 
     async def delete(self, instance: object) -> None:
         if isinstance(instance, Campaign):
             self.campaign_mapper.campaigns.pop(instance.campaign_id)
         elif isinstance(instance, Advertiser):
             self.advertiser_mapper.advertisers.pop(instance.advertiser_id)
+
+
+class MockRedisPipeline:
+    def __init__(self, redis: "MockRedis") -> None:
+        self._redis = redis
+        self._commands: list[Coroutine[Any, Any, Any]] = []
+
+    async def __aenter__(self) -> "MockRedisPipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        for each in self._commands:
+            each.close()
+
+    def set(self, key: str, value: str | int, ex: int | None = None) -> None:
+        self._commands.append(self._redis.set(key, value, ex=ex))
+
+    def zadd(self, key: str, mapping: Mapping[str, float]) -> None:
+        self._commands.append(self._redis.zadd(key, mapping))
+
+    def zcard(self, key: str) -> None:
+        self._commands.append(self._redis.zcard(key))
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [await each for each in commands]
+
+
+class MockPubSub:
+    def __init__(self, redis: "MockRedis") -> None:
+        self._redis = redis
+        self._messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def __aenter__(self) -> "MockPubSub":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        for queues in self._redis.subscribers.values():
+            if self._messages in queues:
+                queues.remove(self._messages)
+
+    async def subscribe(self, *channels: str) -> None:
+        for each in channels:
+            self._redis.subscribers.setdefault(each, []).append(self._messages)
+            self._messages.put_nowait({"type": "subscribe", "channel": each.encode(), "data": 1})
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self._messages.get()
+
+
+class MockRedis:
+    """In-memory stand-in for the few Redis commands the caches use.
+
+    Values are returned as bytes like the real client, and every set key is
+    announced on its keyspace channel as if notifications were enabled.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+        self.expires_at: dict[str, float] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.subscribers: dict[str, list[asyncio.Queue[dict[str, Any]]]] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        self._expire(key)
+        return self.data.get(key)
+
+    async def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [await self.get(each) for each in keys]
+
+    async def set(
+        self,
+        key: str,
+        value: str | int,
+        ex: int | None = None,
+        px: int | None = None,
+        *,
+        nx: bool = False,
+    ) -> bool | None:
+        self._expire(key)
+        if nx and key in self.data:
+            return None
+
+        self.data[key] = str(value).encode()
+        self.expires_at.pop(key, None)
+        if ex is not None:
+            self.ttls[key] = ex
+            self.expires_at[key] = time.monotonic() + ex
+        if px is not None:
+            self.expires_at[key] = time.monotonic() + px / 1000
+
+        self._notify(f"__keyspace@0__:{key}", b"set")
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        for each in keys:
+            self._expire(each)
+            self.expires_at.pop(each, None)
+
+        return sum(self.data.pop(each, None) is not None for each in keys)
+
+    async def pexpire(self, key: str, milliseconds: int) -> bool:
+        self._expire(key)
+        if key not in self.data:
+            return False
+
+        self.expires_at[key] = time.monotonic() + milliseconds / 1000
+        return True
+
+    async def zadd(self, key: str, mapping: Mapping[str, float]) -> int:
+        zset = self.zsets.setdefault(key, {})
+        added = len(mapping.keys() - zset.keys())
+        zset.update(mapping)
+        return added
+
+    async def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    async def zpopmin(self, key: str, count: int) -> list[tuple[bytes, float]]:
+        zset = self.zsets.get(key, {})
+        popped = sorted(zset.items(), key=lambda item: (item[1], item[0]))[:count]
+        for member, _ in popped:
+            del zset[member]
+
+        return [(member.encode(), score) for member, score in popped]
+
+    async def publish(self, channel: str, message: str) -> int:
+        return self._notify(channel, message.encode())
+
+    def pipeline(self, *, transaction: bool = True) -> MockRedisPipeline:
+        return MockRedisPipeline(self)
+
+    def pubsub(self) -> MockPubSub:
+        return MockPubSub(self)
+
+    def _expire(self, key: str) -> None:
+        if self.expires_at.get(key, float("inf")) <= time.monotonic():
+            del self.data[key], self.expires_at[key]
+
+    def _notify(self, channel: str, data: bytes) -> int:
+        queues = self.subscribers.get(channel, [])
+        for each in queues:
+            each.put_nowait({"type": "message", "channel": channel.encode(), "data": data})
+
+        return len(queues)
+
+
+class MockKeyValueStorage(KeyValueStorage):
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self.data[key] = value
+
+
+class MockMetricsGateway(MetricsGateway):
+    def __init__(self) -> None:
+        self.metrics = ServiceMetrics(
+            impressions_count=0,
+            clicks_count=0,
+            advertisers_count=0,
+            clients_count=0,
+            campaigns_count=0,
+            conversion=0,
+            income_impressions=0,
+            income_clicks=0,
+            income_total=0,
+        )
+        self.calls = 0
+
+    async def get_metrics(self) -> ServiceMetrics:
+        self.calls += 1
+        return self.metrics
+
+
+class MockRelevanceGateway(RelevanceGateway):
+    def __init__(self) -> None:
+        self.scores: dict[tuple[UUID, UUID], int] = {}
+
+    async def upsert(self, data: Relevance) -> None:
+        await self.upsert_many([data])
+
+    async def upsert_many(self, data: Sequence[Relevance]) -> None:
+        for each in data:
+            self.scores[each.client_id, each.advertiser_id] = each.score
+
+    async def get_client_scores(self, client_id: UUID) -> Mapping[UUID, int]:
+        return {
+            advertiser_id: score for (owner_id, advertiser_id), score in self.scores.items() if owner_id == client_id
+        }
+
+
+class MockRelevanceCache(RelevanceCache):
+    def __init__(self) -> None:
+        self.invalidated: list[UUID] = []
+
+    async def invalidate(self, client_ids: Iterable[UUID]) -> None:
+        self.invalidated.extend(client_ids)
+
+
+@dataclass(slots=True)
+class MockEventStore:
+    """Write function of BatchedEventWriter that records batches and fails ``failures`` times first."""
+
+    batches: list[tuple[Sequence[Impression], Sequence[Click]]] = field(default_factory=list)
+    failures: int = 0
+
+    async def __call__(self, impressions: Sequence[Impression], clicks: Sequence[Click]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError
+
+        self.batches.append((impressions, clicks))
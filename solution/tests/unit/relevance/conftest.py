@@ -0,0 +1,36 @@
+import pytest
+
+from crudik.application.common.gateway.advertiser import AdvertiserGateway
+from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.gateway.relevance import RelevanceGateway
+from crudik.application.common.relevance_cache import RelevanceCache
+from crudik.application.common.uow import UoW
+from crudik.application.relevance.upsert import ImportRelevances, UpsertRelevances
+from tests.unit.mocks import MockRelevanceCache
+
+
+@pytest.fixture
+def relevance_cache() -> RelevanceCache:
+    return MockRelevanceCache()
+
+
+@pytest.fixture
+def upsert_relevances(
+    relevance_gateway: RelevanceGateway,
+    client_gateway: ClientGateway,
+    advertiser_gateway: AdvertiserGateway,
+    uow: UoW,
+    relevance_cache: RelevanceCache,
+) -> UpsertRelevances:
+    return UpsertRelevances(relevance_gateway, client_gateway, advertiser_gateway, uow, relevance_cache)
+
+
+@pytest.fixture
+def import_relevances(
+    relevance_gateway: RelevanceGateway,
+    client_gateway: ClientGateway,
+    advertiser_gateway: AdvertiserGateway,
+    uow: UoW,
+    relevance_cache: RelevanceCache,
+) -> ImportRelevances:
+    return ImportRelevances(relevance_gateway, client_gateway, advertiser_gateway, uow, relevance_cache)
@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import cast
+from uuid import UUID, uuid4
+
+import pytest
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.gateway.relevance import CachedRelevanceGateway, RelevanceAlchemyGateway
+from crudik.adapters.relevance_cache import FILL_SCRIPT, INVALIDATE_SCRIPT, RedisRelevanceCache
+from crudik.domain.entity.client import Client
+from crudik.domain.entity.relevance import Relevance
+from tests.unit.mocks import MockRedis, MockRelevanceGateway
+
+TTL = 60
+
+CacheScript = Callable[[Sequence[str], Sequence[str | int]], Awaitable[int]]
+
+
+class MockScriptRedis(MockRedis):
+    """Runs the scripts of the relevance cache as Python."""
+
+    def register_script(self, script: str) -> CacheScript:
+        return {FILL_SCRIPT: self._fill, INVALIDATE_SCRIPT: self._invalidate}[script]
+
+    async def _fill(self, keys: Sequence[str], args: Sequence[str | int]) -> int:
+        [key, version_key], [version, raw, ttl] = keys, args
+        if (await self.get(version_key) or b"").decode() != version:
+            return 0
+
+        return int(bool(await self.set(key, raw, ex=int(ttl))))
+
+    async def _invalidate(self, keys: Sequence[str], args: Sequence[str | int]) -> int:
+        [ttl] = args
+        for key, version_key in zip(keys[::2], keys[1::2], strict=True):
+            await self.delete(key)
+            await self.set(version_key, int(await self.get(version_key) or 0) + 1, ex=int(ttl))
+
+        return 0
+
+
+class GatedRelevanceGateway(MockRelevanceGateway):
+    """Reads the scores at once but returns them only when ``gate`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.reads: list[UUID] = []
+
+    async def get_client_scores(self, client_id: UUID) -> Mapping[UUID, int]:
+        self.reads.append(client_id)
+        scores = await super().get_client_scores(client_id)
+        await self.gate.wait()
+        return scores
+
+
+@pytest.fixture
+def redis() -> MockScriptRedis:
+    return MockScriptRedis()
+
+
+@pytest.fixture
+def cache(redis: MockScriptRedis, registry: CacheRegistry) -> RedisRelevanceCache:
+    return RedisRelevanceCache(cast(Redis, redis), registry, ttl=TTL)
+
+
+@pytest.fixture
+def database() -> GatedRelevanceGateway:
+    return GatedRelevanceGateway()
+
+
+@pytest.fixture
+def gateway(database: GatedRelevanceGateway, cache: RedisRelevanceCache) -> CachedRelevanceGateway:
+    return CachedRelevanceGateway(cast(RelevanceAlchemyGateway, database), cache)
+
+
+async def test_read_through(
+    gateway: CachedRelevanceGateway,
+    database: GatedRelevanceGateway,
+    unique_client: Client,
+) -> None:
+    advertiser_id = uuid4()
+    await database.upsert(Relevance(unique_client.client_id, advertiser_id, 10))
+
+    assert await gateway.get_client_scores(unique_client.client_id) == {advertiser_id: 10}
+    assert await gateway.get_client_scores(unique_client.client_id) == {advertiser_id: 10}
+    assert database.reads == [unique_client.client_id]
+
+
+async def test_fill_after_invalidation(
+    gateway: CachedRelevanceGateway,
+    database: GatedRelevanceGateway,
+    cache: RedisRelevanceCache,
+    unique_client: Client,
+) -> None:
+    advertiser_id = uuid4()
+    await database.upsert(Relevance(unique_client.client_id, advertiser_id, 10))
+    database.gate.clear()
+    stale_read = asyncio.create_task(gateway.get_client_scores(unique_client.client_id))
+    await asyncio.sleep(0)
+
+    # the upsert commits and drops the client while the read above still holds the old scores
+    await database.upsert(Relevance(unique_client.client_id, advertiser_id, 50))
+    await cache.invalidate([unique_client.client_id])
+    database.gate.set()
+
+    assert await stale_read == {advertiser_id: 10}
+    assert await gateway.get_client_scores(unique_client.client_id) == {advertiser_id: 50}
+    assert await gateway.get_client_scores(unique_client.client_id) == {advertiser_id: 50}
+    assert database.reads == [unique_client.client_id] * 2
@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterator, Sequence
+from uuid import uuid4
+
+from crudik.application.data_model.relevance import RelevanceData, RelevanceImportRow, RelevanceReject
+from crudik.application.relevance.upsert import ImportRelevances
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.client import Client
+from tests.unit.mocks import MockRelevanceGateway
+
+
+async def as_chunks(*chunks: Sequence[RelevanceImportRow]) -> AsyncIterator[Sequence[RelevanceImportRow]]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_ok(
+    import_relevances: ImportRelevances,
+    relevance_gateway: MockRelevanceGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    data = RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=1)
+
+    result = await import_relevances.execute(
+        as_chunks(
+            [RelevanceImportRow(1, data)],
+            [RelevanceImportRow(2, data.model_copy(update={"score": 9}))],
+        ),
+    )
+
+    assert result.accepted == 2  # noqa: PLR2004
+    assert result.rejected == []
+    assert await relevance_gateway.get_client_scores(unique_client.client_id) == {unique_advertiser.advertiser_id: 9}
+
+
+async def test_rejects(
+    import_relevances: ImportRelevances,
+    relevance_gateway: MockRelevanceGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    data = RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=1)
+
+    result = await import_relevances.execute(
+        as_chunks(
+            [
+                RelevanceImportRow(1, None, "score: Input should be greater than or equal to 0"),
+                RelevanceImportRow(2, data.model_copy(update={"client_id": uuid4()})),
+                RelevanceImportRow(3, data),
+                RelevanceImportRow(4, data.model_copy(update={"advertiser_id": uuid4()})),
+            ],
+        ),
+    )
+
+    assert result.accepted == 1
+    assert result.rejected == [
+        RelevanceReject(line=1, reason="score: Input should be greater than or equal to 0"),
+        RelevanceReject(line=2, reason="Client does not exists"),
+        RelevanceReject(line=4, reason="Advertiser does not exists"),
+    ]
+    assert await relevance_gateway.get_client_scores(unique_client.client_id) == {unique_advertiser.advertiser_id: 1}
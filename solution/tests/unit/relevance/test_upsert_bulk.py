@@ -0,0 +1,125 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from crudik.application.common.gateway.advertiser import AdvertiserGateway
+from crudik.application.common.gateway.client import ClientGateway
+from crudik.application.common.uow import UoW
+from crudik.application.data_model.relevance import RelevanceData
+from crudik.application.exceptions.advertiser import AdvertiserDoesNotExistsError
+from crudik.application.exceptions.client import ClientDoesNotExistsError
+from crudik.application.relevance.upsert import UpsertRelevances
+from crudik.domain.entity.advertiser import Advertiser
+from crudik.domain.entity.client import Client
+from tests.unit.mocks import MockRelevanceCache, MockRelevanceGateway
+
+
+async def test_ok(
+    upsert_relevances: UpsertRelevances,
+    relevance_gateway: MockRelevanceGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    await upsert_relevances.execute(
+        [
+            RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=1),
+            RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=7),
+        ],
+    )
+
+    assert await relevance_gateway.get_client_scores(unique_client.client_id) == {unique_advertiser.advertiser_id: 7}
+
+
+async def test_empty(
+    upsert_relevances: UpsertRelevances,
+    relevance_gateway: MockRelevanceGateway,
+) -> None:
+    await upsert_relevances.execute([])
+
+    assert relevance_gateway.scores == {}
+
+
+async def test_client_not_found(
+    upsert_relevances: UpsertRelevances,
+    relevance_gateway: MockRelevanceGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    with pytest.raises(ClientDoesNotExistsError):
+        await upsert_relevances.execute(
+            [
+                RelevanceData(
+                    client_id=unique_client.client_id,
+                    advertiser_id=unique_advertiser.advertiser_id,
+                    score=1,
+                ),
+                RelevanceData(client_id=uuid4(), advertiser_id=unique_advertiser.advertiser_id, score=1),
+            ],
+        )
+
+    assert relevance_gateway.scores == {}
+
+
+async def test_advertiser_not_found(
+    upsert_relevances: UpsertRelevances,
+    relevance_gateway: MockRelevanceGateway,
+    unique_client: Client,
+) -> None:
+    with pytest.raises(AdvertiserDoesNotExistsError):
+        await upsert_relevances.execute(
+            [RelevanceData(client_id=unique_client.client_id, advertiser_id=uuid4(), score=1)],
+        )
+
+    assert relevance_gateway.scores == {}
+
+
+class CheckingUoW(UoW):
+    """Remembers which clients were already dropped from the cache when the commit came."""
+
+    def __init__(self, cache: MockRelevanceCache, *, fail: bool = False) -> None:
+        self.cache = cache
+        self.fail = fail
+        self.invalidated_before_commit: list[UUID] | None = None
+
+    async def commit(self) -> None:
+        self.invalidated_before_commit = list(self.cache.invalidated)
+        if self.fail:
+            raise ConnectionError
+
+    def add(self, instance: object) -> None: ...
+
+    async def delete(self, instance: object) -> None: ...
+
+
+async def test_invalidated_after_commit(
+    relevance_gateway: MockRelevanceGateway,
+    client_gateway: ClientGateway,
+    advertiser_gateway: AdvertiserGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    cache = MockRelevanceCache()
+    committer = CheckingUoW(cache)
+    data = RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=1)
+
+    await UpsertRelevances(relevance_gateway, client_gateway, advertiser_gateway, committer, cache).execute([data])
+
+    assert committer.invalidated_before_commit == []
+    assert cache.invalidated == [unique_client.client_id]
+
+
+async def test_not_invalidated_without_commit(
+    relevance_gateway: MockRelevanceGateway,
+    client_gateway: ClientGateway,
+    advertiser_gateway: AdvertiserGateway,
+    unique_client: Client,
+    unique_advertiser: Advertiser,
+) -> None:
+    cache = MockRelevanceCache()
+    committer = CheckingUoW(cache, fail=True)
+    data = RelevanceData(client_id=unique_client.client_id, advertiser_id=unique_advertiser.advertiser_id, score=1)
+
+    with pytest.raises(ConnectionError):
+        await UpsertRelevances(relevance_gateway, client_gateway, advertiser_gateway, committer, cache).execute([data])
+
+    assert cache.invalidated == []
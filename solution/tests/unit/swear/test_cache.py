@@ -0,0 +1,59 @@
+import itertools
+import time
+from typing import cast
+
+import pytest
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.swear_cache import SWEAR_INDEX_KEY, SWEAR_KEY_PREFIX, SwearVerdictCache, text_digest
+from tests.unit.mocks import MockRedis
+
+MAX_ENTRIES = 3
+
+
+@pytest.fixture
+def verdict_cache(redis: MockRedis, registry: CacheRegistry) -> SwearVerdictCache:
+    return SwearVerdictCache(cast(Redis, redis), registry, local_size=2, max_entries=MAX_ENTRIES, ttl=60)
+
+
+def stats(registry: CacheRegistry) -> dict[str, tuple[int, int]]:
+    return {each.name: (each.hits, each.misses) for each in registry.get_stats()}
+
+
+async def test_local_hit(verdict_cache: SwearVerdictCache, redis: MockRedis, registry: CacheRegistry) -> None:
+    await verdict_cache.put("Плохие  слова", verdict=True)
+    redis.data.clear()
+
+    assert await verdict_cache.get("плохие слова") is True
+    assert stats(registry) == {"swears": (1, 0), "swears_redis": (0, 0)}
+
+
+async def test_redis_hit(redis: MockRedis, verdict_cache: SwearVerdictCache) -> None:
+    await verdict_cache.put_many([("good", False), ("bad", True)])
+    registry = CacheRegistry()
+    other_worker = SwearVerdictCache(cast(Redis, redis), registry, local_size=2, max_entries=MAX_ENTRIES, ttl=60)
+
+    assert await other_worker.get_many(["good", "bad", "unknown"]) == {
+        text_digest("good"): False,
+        text_digest("bad"): True,
+    }
+    assert stats(registry) == {"swears": (0, 3), "swears_redis": (2, 1)}
+
+
+async def test_redis_eviction(
+    verdict_cache: SwearVerdictCache,
+    redis: MockRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # distinct write times, in the order of the writes
+    monkeypatch.setattr(time, "time", itertools.count().__next__)
+    texts = [f"text {number}" for number in range(MAX_ENTRIES + 2)]
+
+    await verdict_cache.put_many([(each, False) for each in texts[:2]])
+    for text in texts[2:]:
+        await verdict_cache.put(text, verdict=True)
+
+    kept = {text_digest(text) for text in texts[-MAX_ENTRIES:]}
+    assert set(redis.zsets[SWEAR_INDEX_KEY]) == kept
+    assert set(redis.data) == {f"{SWEAR_KEY_PREFIX}{digest}" for digest in kept}
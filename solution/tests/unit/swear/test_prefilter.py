@@ -0,0 +1,74 @@
+import pytest
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.swear_prefilter import LexiconPrefilter
+
+
+@pytest.fixture
+def prefilter(registry: CacheRegistry) -> LexiconPrefilter:
+    return LexiconPrefilter(registry)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "сука",
+        "х.у.й",
+        "xyй",
+        "сууука",
+        "f-u-c-k",
+        "fuuuck",
+        "хуй",
+        "нормальное хуйня ебанная",
+        "муд@к Test campaign description",
+        "fuck you Test campaign description",
+        "motherfucker",
+        "b1tch",
+    ],
+)
+def test_profane(prefilter: LexiconPrefilter, text: str) -> None:
+    assert prefilter.classify(text) is True
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "страхуйте",
+        "Скидки на оружие",
+        "sex shop",
+        "f*ck you",
+        "Niger tours",
+        "shitake",
+        "holy shit",
+        "Moby Dick",
+        "Dick Smith Electronics",
+        "пиццa",
+        "Лучшая пицца в городе",
+        "Test Campaign говно",
+        "дро$ила Test campaign description",
+        "N@hU1 id1 Test campaign description",
+        "мразь",
+        "жопа",
+        "шлюха",
+        "ублюдок",
+        "cock",
+    ],
+)
+def test_ambiguous(prefilter: LexiconPrefilter, text: str) -> None:
+    assert prefilter.classify(text) is None
+
+
+@pytest.mark.parametrize("text", ["Лучшая пицца в городе", "хороший сервис", "Best coffee in town"])
+def test_clean_trusted(registry: CacheRegistry, text: str) -> None:
+    prefilter = LexiconPrefilter(registry, trust_clean=True)
+
+    assert prefilter.classify(text) is False
+    assert prefilter.classify("Moby Dick") is None
+
+
+def test_hit_ratio(prefilter: LexiconPrefilter, registry: CacheRegistry) -> None:
+    prefilter.classify("сука")
+    prefilter.classify("Скидки на оружие")
+
+    [stat] = registry.get_stats()
+    assert (stat.name, stat.hits, stat.misses) == ("swear_prefilter", 1, 1)
@@ -0,0 +1,133 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+
+import pytest
+from aiohttp import ClientSession
+from redis.asyncio import Redis
+
+from crudik.adapters.cache_monitor import CacheRegistry
+from crudik.adapters.config_loader import YaGPTConfig
+from crudik.adapters.swear_cache import SwearVerdictCache
+from crudik.adapters.swear_filter import LLMSwearFilter
+from crudik.adapters.swear_prefilter import LexiconPrefilter
+from crudik.adapters.ya_gpt import YandexGPT
+from tests.unit.mocks import MockKeyValueStorage, MockRedis
+
+TEXT = "Лучшая пицца в городе"
+
+
+class GatedGPT(YandexGPT):
+    """Answers ``verdict`` to every prompt once ``gate`` is set."""
+
+    def __init__(self, verdict: str) -> None:
+        super().__init__(cast(ClientSession, None), api_key="", folder_id="")
+        self.verdict = verdict
+        self.gate = asyncio.Event()
+        self.prompts: list[str] = []
+
+    async def prompt(self, user_prompt: str) -> str:
+        self.prompts.append(user_prompt)
+        await self.gate.wait()
+        return self.verdict
+
+
+async def settle() -> None:
+    """Let the started checks reach the model."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def gpt() -> GatedGPT:
+    return GatedGPT("1")
+
+
+@pytest.fixture
+def batch_gpt() -> GatedGPT:
+    return GatedGPT("1: 1")
+
+
+@pytest.fixture
+def swear_filter(
+    redis: MockRedis,
+    registry: CacheRegistry,
+    gpt: GatedGPT,
+    batch_gpt: GatedGPT,
+) -> LLMSwearFilter:
+    config = YaGPTConfig(folder_id="", api_key="", swear_check_enabled=True, swear_prefilter_trust_clean=False)
+    cache = SwearVerdictCache(cast(Redis, redis), registry, local_size=10, max_entries=10, ttl=60)
+    swear_filter = LLMSwearFilter(
+        cast(ClientSession, None),
+        config,
+        MockKeyValueStorage(),
+        cache,
+        LexiconPrefilter(registry),
+    )
+    swear_filter.client = gpt
+    swear_filter.batch_client = batch_gpt
+    return swear_filter
+
+
+@pytest.fixture
+async def first_check(swear_filter: LLMSwearFilter, gpt: GatedGPT) -> AsyncIterator[asyncio.Task[bool]]:
+    """Check of ``TEXT`` waiting for the model."""
+    task = asyncio.create_task(swear_filter.check_contains_swears(TEXT))
+    await settle()
+    yield task
+    gpt.gate.set()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_shared_request(swear_filter: LLMSwearFilter, gpt: GatedGPT, first_check: asyncio.Task[bool]) -> None:
+    others = [asyncio.create_task(swear_filter.check_contains_swears(TEXT)) for _ in range(3)]
+    await settle()
+    gpt.gate.set()
+
+    assert await asyncio.gather(first_check, *others) == [True] * 4
+    assert gpt.prompts == [TEXT]
+
+
+async def test_cancelled_caller(swear_filter: LLMSwearFilter, gpt: GatedGPT, first_check: asyncio.Task[bool]) -> None:
+    second = asyncio.create_task(swear_filter.check_contains_swears(TEXT))
+    await settle()
+
+    first_check.cancel()
+    await settle()
+    gpt.gate.set()
+
+    assert await second is True
+    assert first_check.cancelled()
+    assert gpt.prompts == [TEXT]
+    # the shared request finished and cached its verdict
+    assert await swear_filter.check_contains_swears(TEXT) is True
+    assert gpt.prompts == [TEXT]
+
+
+async def test_batch_joins_single(
+    swear_filter: LLMSwearFilter,
+    gpt: GatedGPT,
+    batch_gpt: GatedGPT,
+    first_check: asyncio.Task[bool],
+) -> None:
+    batch = asyncio.create_task(swear_filter.check_many([TEXT]))
+    await settle()
+    gpt.gate.set()
+
+    assert await batch == [True]
+    assert await first_check is True
+    assert batch_gpt.prompts == []
+
+
+async def test_single_joins_batch(swear_filter: LLMSwearFilter, gpt: GatedGPT, batch_gpt: GatedGPT) -> None:
+    batch = asyncio.create_task(swear_filter.check_many([TEXT]))
+    await settle()
+    single = asyncio.create_task(swear_filter.check_contains_swears(TEXT))
+    await settle()
+    batch_gpt.gate.set()
+    gpt.gate.set()
+
+    assert await batch == [True]
+    assert await single is True
+    assert batch_gpt.prompts == [f"1. {TEXT}"]
+    assert gpt.prompts == []